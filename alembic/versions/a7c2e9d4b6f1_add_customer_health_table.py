@@ -0,0 +1,99 @@
+"""Add customer health table
+
+Revision ID: a7c2e9d4b6f1
+Revises: f81b3d5e2c94
+Create Date: 2026-10-16 17:21:36.540917
+
+"""
+import json
+from datetime import datetime, timedelta
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c2e9d4b6f1'
+down_revision: Union[str, Sequence[str], None] = 'f81b3d5e2c94'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SENTIMENT_SCORES = {'green': 1.0, 'amber': 0.0, 'red': -1.0}
+TREND_DAYS = 90
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    customer_health = op.create_table('customer_health',
+    sa.Column('customer_id', sa.Integer(), nullable=False),
+    sa.Column('latest_sentiment', sa.String(length=10), nullable=True),
+    sa.Column('latest_event_id', sa.Integer(), nullable=True),
+    sa.Column('latest_summary_at', sa.DateTime(), nullable=True),
+    sa.Column('green_count', sa.Integer(), nullable=False),
+    sa.Column('amber_count', sa.Integer(), nullable=False),
+    sa.Column('red_count', sa.Integer(), nullable=False),
+    sa.Column('open_action_items', sa.Integer(), nullable=False),
+    sa.Column('last_meeting_at', sa.DateTime(), nullable=True),
+    sa.Column('trend_score', sa.Float(), nullable=True),
+    sa.Column('recent_sentiments', sa.JSON(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['customer_id'], ['customers.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('customer_id')
+    )
+    op.create_index(op.f('ix_customer_health_last_meeting_at'), 'customer_health', ['last_meeting_at'], unique=False)
+    op.create_index(op.f('ix_customer_health_latest_sentiment'), 'customer_health', ['latest_sentiment'], unique=False)
+    op.create_index(op.f('ix_customer_health_open_action_items'), 'customer_health', ['open_action_items'], unique=False)
+    op.create_index(op.f('ix_customer_health_red_count'), 'customer_health', ['red_count'], unique=False)
+    op.create_index(op.f('ix_customer_health_trend_score'), 'customer_health', ['trend_score'], unique=False)
+
+    # Backfill from existing summaries, walking each customer's meetings in time order
+    rows = op.get_bind().execute(sa.text(
+        "SELECT e.customer_id, e.id, e.timestamp, s.summary_json "
+        "FROM events e LEFT JOIN event_summaries s ON s.event_id = e.id "
+        "ORDER BY e.customer_id, e.timestamp, e.id"
+    ))
+    now = datetime.now()
+    cutoff = now - timedelta(days=TREND_DAYS)
+    healths = {}
+    for customer_id, event_id, timestamp, summary in rows:
+        if isinstance(timestamp, str):
+            timestamp = datetime.fromisoformat(timestamp)
+        if isinstance(summary, str):
+            summary = json.loads(summary)
+        summary = summary or {}
+        health = healths.setdefault(customer_id, {
+            'customer_id': customer_id, 'latest_sentiment': None, 'latest_event_id': None,
+            'latest_summary_at': None, 'green_count': 0, 'amber_count': 0, 'red_count': 0,
+            'open_action_items': 0, 'recent_sentiments': [], 'updated_at': now,
+        })
+        health['last_meeting_at'] = timestamp
+        action_items = summary.get('action_items')
+        health['open_action_items'] += len(action_items) if isinstance(action_items, list) else 0
+        sentiment = str(summary.get('sentiment') or '').strip().lower()
+        if sentiment not in SENTIMENT_SCORES:
+            continue
+        health[f'{sentiment}_count'] += 1
+        health['latest_sentiment'] = sentiment
+        health['latest_event_id'] = event_id
+        health['latest_summary_at'] = timestamp
+        if timestamp >= cutoff:
+            health['recent_sentiments'].append([timestamp.isoformat(), event_id, sentiment])
+
+    for health in healths.values():
+        recent = health['recent_sentiments']
+        health['trend_score'] = (
+            round(sum(SENTIMENT_SCORES[s] for _, _, s in recent) / len(recent), 4) if recent else None
+        )
+    if healths:
+        op.bulk_insert(customer_health, list(healths.values()))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_customer_health_trend_score'), table_name='customer_health')
+    op.drop_index(op.f('ix_customer_health_red_count'), table_name='customer_health')
+    op.drop_index(op.f('ix_customer_health_open_action_items'), table_name='customer_health')
+    op.drop_index(op.f('ix_customer_health_latest_sentiment'), table_name='customer_health')
+    op.drop_index(op.f('ix_customer_health_last_meeting_at'), table_name='customer_health')
+    op.drop_table('customer_health')
@@ -0,0 +1,132 @@
+"""Normalize event summaries into columns and action items table
+
+Revision ID: b3f8d1a6c5e2
+Revises: a7c2e9d4b6f1
+Create Date: 2026-10-17 09:12:48.203655
+
+"""
+import json
+from datetime import date, datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3f8d1a6c5e2'
+down_revision: Union[str, Sequence[str], None] = 'a7c2e9d4b6f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+SENTIMENTS = {'green', 'amber', 'red'}
+
+
+def _parse_action_item(item):
+    if isinstance(item, dict):
+        text = str(item.get('text') or '').strip()
+        owner = str(item.get('owner') or '').strip() or None
+        try:
+            due_date = date.fromisoformat(str(item['due_date'])) if item.get('due_date') else None
+        except ValueError:
+            due_date = None
+        return text, owner, due_date
+    return str(item or '').strip(), None, None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('event_summaries', sa.Column('sentiment', sa.String(length=10), nullable=True))
+    op.add_column('event_summaries', sa.Column('tldr', sa.Text(), nullable=True))
+    op.add_column('event_summaries', sa.Column('schema_version', sa.Integer(), server_default='1', nullable=False))
+    op.create_index(op.f('ix_event_summaries_sentiment'), 'event_summaries', ['sentiment'], unique=False)
+    action_items = op.create_table('action_items',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('event_id', sa.Integer(), nullable=False),
+    sa.Column('customer_id', sa.Integer(), nullable=False),
+    sa.Column('position', sa.Integer(), nullable=False),
+    sa.Column('text', sa.Text(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('owner', sa.String(length=255), nullable=True),
+    sa.Column('due_date', sa.Date(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['customer_id'], ['customers.id'], ),
+    sa.ForeignKeyConstraint(['event_id'], ['events.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_action_items_event_id'), 'action_items', ['event_id'], unique=False)
+    op.create_index(op.f('ix_action_items_id'), 'action_items', ['id'], unique=False)
+    op.create_index('ix_action_items_status_id', 'action_items', ['status', 'id'], unique=False)
+    op.create_index('ix_action_items_customer_id_status_id', 'action_items', ['customer_id', 'status', 'id'], unique=False)
+    op.create_index('ix_action_items_owner_status_id', 'action_items', ['owner', 'status', 'id'], unique=False)
+
+    # Backfill in batches of summaries, keyed by summary ID
+    conn = op.get_bind()
+    now = datetime.now()
+    last_id = 0
+    while True:
+        rows = conn.execute(sa.text(
+            "SELECT s.id, s.event_id, s.summary_json, e.customer_id "
+            "FROM event_summaries s JOIN events e ON e.id = s.event_id "
+            "WHERE s.id > :last_id ORDER BY s.id LIMIT :batch_size"
+        ), {'last_id': last_id, 'batch_size': BATCH_SIZE}).all()
+        if not rows:
+            break
+        last_id = rows[-1].id
+
+        projected, items = [], []
+        for row in rows:
+            summary = json.loads(row.summary_json) if isinstance(row.summary_json, str) else row.summary_json
+            summary = summary or {}
+            sentiment = str(summary.get('sentiment') or '').strip().lower()
+            tldr = summary.get('tldr')
+            projected.append({
+                'summary_id': row.id,
+                'sentiment': sentiment if sentiment in SENTIMENTS else None,
+                'tldr': str(tldr) if tldr is not None else None,
+            })
+            action_items_json = summary.get('action_items')
+            if not isinstance(action_items_json, list):
+                continue
+            position = 0
+            for item in action_items_json:
+                text, owner, due_date = _parse_action_item(item)
+                if not text:
+                    continue
+                items.append({
+                    'event_id': row.event_id, 'customer_id': row.customer_id, 'position': position,
+                    'text': text, 'status': 'open', 'owner': owner, 'due_date': due_date,
+                    'created_at': now, 'updated_at': now,
+                })
+                position += 1
+
+        conn.execute(
+            sa.text("UPDATE event_summaries SET sentiment = :sentiment, tldr = :tldr WHERE id = :summary_id"),
+            projected,
+        )
+        if items:
+            op.bulk_insert(action_items, items)
+
+    # Open action-item counts now come from the action_items table
+    op.execute(
+        "UPDATE customer_health SET open_action_items = ("
+        "SELECT count(*) FROM action_items a "
+        "WHERE a.customer_id = customer_health.customer_id AND a.status = 'open')"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_action_items_owner_status_id', table_name='action_items')
+    op.drop_index('ix_action_items_customer_id_status_id', table_name='action_items')
+    op.drop_index('ix_action_items_status_id', table_name='action_items')
+    op.drop_index(op.f('ix_action_items_id'), table_name='action_items')
+    op.drop_index(op.f('ix_action_items_event_id'), table_name='action_items')
+    op.drop_table('action_items')
+    op.drop_index(op.f('ix_event_summaries_sentiment'), table_name='event_summaries')
+    with op.batch_alter_table('event_summaries') as batch_op:
+        batch_op.drop_column('schema_version')
+        batch_op.drop_column('tldr')
+        batch_op.drop_column('sentiment')
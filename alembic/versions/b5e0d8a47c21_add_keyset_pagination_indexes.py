@@ -0,0 +1,29 @@
+"""Add keyset pagination indexes
+
+Revision ID: b5e0d8a47c21
+Revises: 7a3c91d2f4b6
+Create Date: 2026-10-16 11:40:07.553019
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5e0d8a47c21'
+down_revision: Union[str, Sequence[str], None] = '7a3c91d2f4b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Customer pages seek on the primary key, which is already indexed
+    op.create_index('ix_events_customer_id_timestamp_id', 'events', ['customer_id', 'timestamp', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_events_customer_id_timestamp_id', table_name='events')
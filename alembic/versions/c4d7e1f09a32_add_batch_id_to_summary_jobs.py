@@ -0,0 +1,31 @@
+"""Add batch_id to summary jobs
+
+Revision ID: c4d7e1f09a32
+Revises: e2f4a6c8d0b1
+Create Date: 2026-10-16 14:22:18.604517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4d7e1f09a32'
+down_revision: Union[str, Sequence[str], None] = 'e2f4a6c8d0b1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('summary_jobs', sa.Column('batch_id', sa.String(length=32), nullable=True))
+    op.create_index(op.f('ix_summary_jobs_batch_id'), 'summary_jobs', ['batch_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_summary_jobs_batch_id'), table_name='summary_jobs')
+    with op.batch_alter_table('summary_jobs') as batch_op:
+        batch_op.drop_column('batch_id')
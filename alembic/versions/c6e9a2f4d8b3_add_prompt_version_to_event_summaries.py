@@ -0,0 +1,29 @@
+"""Add prompt_version to event summaries
+
+Revision ID: c6e9a2f4d8b3
+Revises: b3f8d1a6c5e2
+Create Date: 2026-10-17 11:40:27.519836
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6e9a2f4d8b3'
+down_revision: Union[str, Sequence[str], None] = 'b3f8d1a6c5e2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('event_summaries', sa.Column('prompt_version', sa.String(length=32), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('event_summaries') as batch_op:
+        batch_op.drop_column('prompt_version')
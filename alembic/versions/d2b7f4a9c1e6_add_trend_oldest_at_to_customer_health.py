@@ -0,0 +1,45 @@
+"""Add trend_oldest_at to customer health
+
+Revision ID: d2b7f4a9c1e6
+Revises: c6e9a2f4d8b3
+Create Date: 2026-10-17 15:12:08.204117
+
+"""
+import json
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2b7f4a9c1e6'
+down_revision: Union[str, Sequence[str], None] = 'c6e9a2f4d8b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('customer_health', sa.Column('trend_oldest_at', sa.DateTime(), nullable=True))
+    op.create_index(op.f('ix_customer_health_trend_oldest_at'), 'customer_health', ['trend_oldest_at'], unique=False)
+
+    # Backfill from the windowed sentiments, which are kept oldest first
+    conn = op.get_bind()
+    rows = conn.execute(sa.text("SELECT customer_id, recent_sentiments FROM customer_health")).fetchall()
+    for customer_id, recent in rows:
+        if isinstance(recent, str):
+            recent = json.loads(recent)
+        if recent:
+            conn.execute(
+                sa.text("UPDATE customer_health SET trend_oldest_at = :oldest WHERE customer_id = :customer_id"),
+                {'oldest': datetime.fromisoformat(recent[0][0]), 'customer_id': customer_id},
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_customer_health_trend_oldest_at'), table_name='customer_health')
+    with op.batch_alter_table('customer_health') as batch_op:
+        batch_op.drop_column('trend_oldest_at')
@@ -0,0 +1,67 @@
+"""Add full-text search index
+
+Revision ID: e2f4a6c8d0b1
+Revises: b5e0d8a47c21
+Create Date: 2026-10-16 13:05:42.118406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2f4a6c8d0b1'
+down_revision: Union[str, Sequence[str], None] = 'b5e0d8a47c21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name == 'sqlite':
+        # rowid is the event ID; bm25 column weights are applied at query time
+        op.execute(
+            "CREATE VIRTUAL TABLE search_index USING fts5("
+            "transcript, tldr, action_items, customer_id UNINDEXED, "
+            "tokenize = 'porter unicode61')"
+        )
+        op.execute(
+            "INSERT INTO search_index (rowid, transcript, tldr, action_items, customer_id) "
+            "SELECT e.id, m.transcript, json_extract(s.summary_json, '$.tldr'), "
+            "(SELECT group_concat(value, char(10)) FROM json_each(s.summary_json, '$.action_items')), "
+            "e.customer_id "
+            "FROM events e JOIN meetings m ON m.id = e.id "
+            "LEFT JOIN event_summaries s ON s.event_id = e.id"
+        )
+        return
+
+    op.create_table('search_index',
+    sa.Column('event_id', sa.Integer(), nullable=False),
+    sa.Column('customer_id', sa.Integer(), nullable=False),
+    sa.Column('transcript', sa.Text(), nullable=True),
+    sa.Column('tldr', sa.Text(), nullable=True),
+    sa.Column('action_items', sa.Text(), nullable=True),
+    sa.PrimaryKeyConstraint('event_id')
+    )
+    op.execute(
+        "ALTER TABLE search_index ADD COLUMN document tsvector GENERATED ALWAYS AS ("
+        "setweight(to_tsvector('english', coalesce(tldr, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(action_items, '')), 'B') || "
+        "setweight(to_tsvector('english', coalesce(transcript, '')), 'C')) STORED"
+    )
+    op.create_index('ix_search_index_document', 'search_index', ['document'], unique=False, postgresql_using='gin')
+    op.create_index(op.f('ix_search_index_customer_id'), 'search_index', ['customer_id'], unique=False)
+    op.execute(
+        "INSERT INTO search_index (event_id, customer_id, transcript, tldr, action_items) "
+        "SELECT e.id, e.customer_id, m.transcript, s.summary_json ->> 'tldr', "
+        "(SELECT string_agg(value, E'\\n') FROM json_array_elements_text(s.summary_json -> 'action_items') AS value) "
+        "FROM events e JOIN meetings m ON m.id = e.id "
+        "LEFT JOIN event_summaries s ON s.event_id = e.id"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TABLE search_index")
@@ -0,0 +1,32 @@
+"""Make llm_calls.cost_usd nullable
+
+Revision ID: e8c3a5f1b9d4
+Revises: d2b7f4a9c1e6
+Create Date: 2026-10-17 15:48:51.730264
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8c3a5f1b9d4'
+down_revision: Union[str, Sequence[str], None] = 'd2b7f4a9c1e6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Calls to models without a configured price are recorded without a cost
+    with op.batch_alter_table('llm_calls') as batch_op:
+        batch_op.alter_column('cost_usd', existing_type=sa.Float(), nullable=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("UPDATE llm_calls SET cost_usd = 0 WHERE cost_usd IS NULL")
+    with op.batch_alter_table('llm_calls') as batch_op:
+        batch_op.alter_column('cost_usd', existing_type=sa.Float(), nullable=False)
@@ -0,0 +1,51 @@
+"""Add llm calls table
+
+Revision ID: f81b3d5e2c94
+Revises: c4d7e1f09a32
+Create Date: 2026-10-16 15:48:03.377152
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f81b3d5e2c94'
+down_revision: Union[str, Sequence[str], None] = 'c4d7e1f09a32'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('llm_calls',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('operation', sa.String(length=50), nullable=False),
+    sa.Column('model', sa.String(length=100), nullable=False),
+    sa.Column('prompt_version', sa.String(length=32), nullable=True),
+    sa.Column('customer_id', sa.Integer(), nullable=True),
+    sa.Column('event_id', sa.Integer(), nullable=True),
+    sa.Column('prompt_tokens', sa.Integer(), nullable=False),
+    sa.Column('completion_tokens', sa.Integer(), nullable=False),
+    sa.Column('cost_usd', sa.Float(), nullable=False),
+    sa.Column('latency_ms', sa.Float(), nullable=False),
+    sa.Column('cache_hit', sa.Boolean(), nullable=False),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_llm_calls_created_at'), 'llm_calls', ['created_at'], unique=False)
+    op.create_index(op.f('ix_llm_calls_customer_id'), 'llm_calls', ['customer_id'], unique=False)
+    op.create_index(op.f('ix_llm_calls_id'), 'llm_calls', ['id'], unique=False)
+    op.create_index('ix_llm_calls_operation_created_at', 'llm_calls', ['operation', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_llm_calls_operation_created_at', table_name='llm_calls')
+    op.drop_index(op.f('ix_llm_calls_id'), table_name='llm_calls')
+    op.drop_index(op.f('ix_llm_calls_customer_id'), table_name='llm_calls')
+    op.drop_index(op.f('ix_llm_calls_created_at'), table_name='llm_calls')
+    op.drop_table('llm_calls')
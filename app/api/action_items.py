@@ -0,0 +1,52 @@
+from datetime import date
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from typing import Optional
+
+from app.database import get_db
+from app.services import action_item_service
+from app.services.schemas import ActionItemResponse, ActionItemUpdate, Page
+
+router = APIRouter()
+
+
+@router.get("", response_model=Page[ActionItemResponse])
+def get_action_items(
+    status: Optional[str] = Query(None, description="open or done"),
+    customer_id: Optional[int] = None,
+    event_id: Optional[int] = None,
+    owner: Optional[str] = None,
+    due_before: Optional[date] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=500),
+    db: Session = Depends(get_db),
+):
+    """Get action items across all customers, one page at a time. Pass next_cursor back as cursor for the next page."""
+    try:
+        items, next_cursor = action_item_service.get_action_items(
+            db,
+            status=status,
+            customer_id=customer_id,
+            event_id=event_id,
+            owner=owner,
+            due_before=due_before,
+            cursor=cursor,
+            limit=limit,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return Page(items=items, next_cursor=next_cursor)
+
+
+@router.patch("/{action_item_id}", response_model=ActionItemResponse)
+def update_action_item(
+    action_item_id: int, update: ActionItemUpdate, db: Session = Depends(get_db)
+):
+    """Update an action item's status, owner or due date."""
+    try:
+        item = action_item_service.update_action_item(db, action_item_id, update)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if item is None:
+        raise HTTPException(status_code=404, detail="Action item not found")
+    return item
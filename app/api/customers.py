@@ -1,27 +1,78 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
-from typing import List
+from typing import Optional
 
 from app.database import get_db
-from app.services import customer_service
-from app.services.schemas import CustomerCreate, CustomerUpdate, CustomerResponse
+from app.http_cache import cache_headers, is_not_modified, not_modified, version_etag
+from app.services import customer_service, health_service
+from app.services.schemas import (
+    CustomerCreate,
+    CustomerUpdate,
+    CustomerResponse,
+    CustomerHealthResponse,
+    Page,
+)
 
 router = APIRouter()
 
 
-@router.get("/", response_model=List[CustomerResponse])
-def get_customers(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    """Get all customers."""
-    customers = customer_service.get_customers(db, skip=skip, limit=limit)
-    return customers
+@router.get("/", response_model=Page[CustomerResponse])
+def get_customers(
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=500),
+    db: Session = Depends(get_db),
+):
+    """Get customers, one page at a time. Pass next_cursor back as cursor for the next page."""
+    try:
+        customers, next_cursor = customer_service.get_customers(
+            db, cursor=cursor, limit=limit
+        )
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return Page(items=customers, next_cursor=next_cursor)
+
+
+@router.get("/health", response_model=Page[CustomerHealthResponse])
+def get_customer_health(
+    sentiment: Optional[str] = Query(None, description="Only customers whose latest sentiment is green, amber or red"),
+    sort: str = Query("-last_meeting_at", description="Sort field, prefixed with - for descending"),
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=500),
+    db: Session = Depends(get_db),
+):
+    """
+    Get customer health rollups, filtered by latest sentiment and sorted.
+
+    Sortable fields: last_meeting_at, latest_summary_at, trend_score,
+    red_count, amber_count, green_count and open_action_items.
+    """
+    try:
+        rows, next_cursor = health_service.list_customer_health(
+            db, sentiment=sentiment, sort=sort, cursor=cursor, limit=limit
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    items = []
+    for health, organization_name in rows:
+        item = CustomerHealthResponse.model_validate(health)
+        item.organization_name = organization_name
+        items.append(item)
+    return Page(items=items, next_cursor=next_cursor)
 
 
 @router.get("/{customer_id}", response_model=CustomerResponse)
-def get_customer(customer_id: int, db: Session = Depends(get_db)):
-    """Get a specific customer by ID."""
+def get_customer(
+    customer_id: int, request: Request, response: Response, db: Session = Depends(get_db)
+):
+    """Get a specific customer by ID. Answers If-None-Match/If-Modified-Since with 304."""
     customer = customer_service.get_customer(db, customer_id=customer_id)
     if customer is None:
         raise HTTPException(status_code=404, detail="Customer not found")
+
+    etag = version_etag("customer", customer.id, customer.updated_at)
+    if is_not_modified(request, etag, customer.updated_at):
+        return not_modified(etag, customer.updated_at)
+    response.headers.update(cache_headers(etag, customer.updated_at))
     return customer
 
 
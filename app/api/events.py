@@ -1,38 +1,263 @@
-from fastapi import APIRouter, Depends, HTTPException
+import asyncio
+import json
+from collections import Counter
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic import TypeAdapter, ValidationError
 from sqlalchemy.orm import Session
-from typing import List
+from typing import AsyncIterator, List, Optional, Tuple
 
+from app.config import settings
 from app.database import get_db
-from app.services import event_service
-from app.services.schemas import EventResponse, MeetingCreate, MeetingUpdate, MeetingResponse
+from app.http_cache import (
+    cache_headers,
+    content_etag,
+    if_range_matches,
+    is_not_modified,
+    not_modified,
+    version_etag,
+)
+from app.models.summary_job import SUMMARY_PENDING, SUMMARY_RUNNING, SUMMARY_FAILED
+from app.services import event_service, summary_queue
+from app.services.llm_service import LLMService, get_llm_service
+from app.services.schemas import (
+    BulkIngestBatch,
+    BulkIngestItem,
+    EventResponse,
+    EventListItem,
+    MeetingCreate,
+    MeetingUpdate,
+    MeetingResponse,
+    Page,
+    SummaryJobStatus,
+)
+from app.services.summary_worker import summary_worker_pool
 
 router = APIRouter()
 
 
-@router.get("/customer/{customer_id}", response_model=List[EventResponse])
+EVENT_INCLUDES = {"summary"}
+
+
+@router.get("/customer/{customer_id}", response_model=Page[EventListItem])
 def get_customer_events(
-    customer_id: int, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
+    customer_id: int,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=500),
+    include: Optional[str] = None,
+    db: Session = Depends(get_db),
 ):
-    """Get all events for a specific customer."""
-    events = event_service.get_events_by_customer(
-        db, customer_id=customer_id, skip=skip, limit=limit
-    )
-    return events
+    """
+    Get events for a specific customer, newest first, one page at a time.
+
+    Items omit the full transcript; fetch it from /{event_id} or
+    /{event_id}/transcript. Pass next_cursor back as cursor for the next
+    page, and include=summary to embed each event's summary, fetched in
+    one query.
+    """
+    includes = {part.strip() for part in include.split(",")} if include else set()
+    unknown = includes - EVENT_INCLUDES
+    if unknown:
+        raise HTTPException(
+            status_code=400, detail=f"Unsupported include: {', '.join(sorted(unknown))}"
+        )
+
+    try:
+        events, next_cursor = event_service.get_events_by_customer(
+            db, customer_id=customer_id, cursor=cursor, limit=limit
+        )
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if "summary" not in includes:
+        return Page(items=events, next_cursor=next_cursor)
+
+    summaries = event_service.get_event_summaries(db, [event.id for event in events])
+    results = []
+    for event in events:
+        result = EventListItem.model_validate(event)
+        summary = summaries.get(event.id)
+        result.summary = summary.summary_json if summary else None
+        results.append(result)
+    return Page(items=results, next_cursor=next_cursor)
 
 
 @router.get("/{event_id}", response_model=EventResponse)
-def get_event(event_id: int, db: Session = Depends(get_db)):
-    """Get a specific event by ID."""
+def get_event(
+    event_id: int, request: Request, response: Response, db: Session = Depends(get_db)
+):
+    """
+    Get a specific event by ID.
+
+    Answers If-None-Match/If-Modified-Since with 304 after looking up only
+    updated_at, without loading the transcript.
+    """
+    version = event_service.get_event_version(db, event_id)
+    if version is None:
+        raise HTTPException(status_code=404, detail="Event not found")
+    etag = version_etag("event", event_id, version.updated_at)
+    if is_not_modified(request, etag, version.updated_at):
+        return not_modified(etag, version.updated_at)
+
     event = event_service.get_event(db, event_id=event_id)
     if event is None:
         raise HTTPException(status_code=404, detail="Event not found")
+    response.headers.update(
+        cache_headers(version_etag("event", event_id, event.updated_at), event.updated_at)
+    )
     return event
 
 
+@router.get("/{event_id}/transcript")
+def get_event_transcript(event_id: int, request: Request, db: Session = Depends(get_db)):
+    """
+    Get the full transcript of a meeting as plain text.
+
+    Supports a single HTTP byte range (Range: bytes=start-end) for partial
+    fetches, If-Range, and conditional requests answered with 304 before the
+    transcript is read. The body is read from the database in 64 KiB chunks
+    as it is sent.
+    """
+    version = event_service.get_event_version(db, event_id, meeting_only=True)
+    if version is None:
+        raise HTTPException(status_code=404, detail="Transcript not found")
+    etag = version_etag("transcript", event_id, version.updated_at)
+    if is_not_modified(request, etag, version.updated_at):
+        return not_modified(etag, version.updated_at)
+
+    size = event_service.get_meeting_transcript_size(db, event_id=event_id)
+    if size is None:
+        raise HTTPException(status_code=404, detail="Transcript not found")
+
+    start, end = 0, size - 1
+    status_code = 200
+    headers = {"Accept-Ranges": "bytes", **cache_headers(etag, version.updated_at)}
+
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if if_range is not None and not if_range_matches(if_range, etag, version.updated_at):
+        range_header = None  # The client's partial copy is stale; send the whole transcript
+    if range_header and size:
+        start, end = _parse_byte_range(range_header, size)
+        status_code = 206
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    headers["Content-Length"] = str(end - start + 1 if size else 0)
+
+    return StreamingResponse(
+        event_service.iter_meeting_transcript(db, event_id, start, end),
+        status_code=status_code,
+        media_type="text/plain; charset=utf-8",
+        headers=headers,
+    )
+
+
+def _parse_byte_range(range_header: str, size: int) -> Tuple[int, int]:
+    """Parse a single 'bytes=' range into inclusive (start, end) offsets."""
+    unit, _, spec = range_header.partition("=")
+    try:
+        if unit.strip() != "bytes" or "," in spec:
+            raise ValueError
+        first, _, last = spec.strip().partition("-")
+        if first:
+            start = int(first)
+            end = min(int(last), size - 1) if last else size - 1
+        else:
+            # Suffix range: the last N bytes
+            start = max(size - int(last), 0)
+            end = size - 1
+        if start > end or start >= size:
+            raise ValueError
+    except ValueError:
+        raise HTTPException(
+            status_code=416,
+            detail="Invalid or unsatisfiable range",
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+    return start, end
+
+
 @router.post("/meetings", response_model=MeetingResponse, status_code=201)
 def create_meeting(meeting: MeetingCreate, db: Session = Depends(get_db)):
-    """Create a new meeting event."""
-    return event_service.create_meeting(db=db, meeting=meeting)
+    """Create a new meeting event; its summary is generated in the background."""
+    db_meeting = event_service.create_meeting(db=db, meeting=meeting)
+    summary_worker_pool.notify()
+    return db_meeting
+
+
+@router.post("/meetings:bulk", response_model=BulkIngestBatch, status_code=202)
+async def create_meetings_bulk(request: Request, db: Session = Depends(get_db)):
+    """
+    Create many meetings at once from a JSON array or an NDJSON body.
+
+    All meetings are inserted in one transaction; participant extraction and
+    summaries are then generated in the background, within the LLM rate
+    limits. Poll /meetings:bulk/{batch_id} for per-item progress.
+    """
+    meetings = _parse_bulk_meetings(
+        await request.body(), request.headers.get("content-type", "")
+    )
+    batch_id, db_meetings = await asyncio.to_thread(
+        event_service.create_meetings_bulk, db, meetings
+    )
+    summary_worker_pool.notify()
+
+    items = [
+        BulkIngestItem(event_id=m.id, status=SUMMARY_PENDING if m.transcript else None)
+        for m in db_meetings
+    ]
+    return _bulk_batch(batch_id, items)
+
+
+@router.get("/meetings:bulk/{batch_id}", response_model=BulkIngestBatch)
+def get_bulk_batch(batch_id: str, db: Session = Depends(get_db)):
+    """Get per-meeting summary progress for a bulk ingest batch (meetings with transcripts)."""
+    jobs = summary_queue.get_batch_jobs(db, batch_id)
+    if not jobs:
+        raise HTTPException(status_code=404, detail="Batch not found")
+    items = [
+        BulkIngestItem(
+            event_id=job.event_id,
+            status=job.status,
+            attempts=job.attempts,
+            last_error=job.last_error,
+        )
+        for job in jobs
+    ]
+    return _bulk_batch(batch_id, items)
+
+
+def _bulk_batch(batch_id: str, items: List[BulkIngestItem]) -> BulkIngestBatch:
+    counts = Counter(item.status or "no_transcript" for item in items)
+    return BulkIngestBatch(batch_id=batch_id, total=len(items), counts=counts, items=items)
+
+
+def _parse_bulk_meetings(body: bytes, content_type: str) -> List[MeetingCreate]:
+    """Validate a JSON array or NDJSON (one meeting per line) request body."""
+    try:
+        if "ndjson" in content_type or "jsonlines" in content_type:
+            meetings = []
+            for line_number, line in enumerate(body.splitlines(), start=1):
+                if not line.strip():
+                    continue
+                try:
+                    meetings.append(MeetingCreate.model_validate_json(line))
+                except ValidationError as e:
+                    raise HTTPException(
+                        status_code=422,
+                        detail={"line": line_number, "errors": json.loads(e.json())},
+                    )
+        else:
+            meetings = TypeAdapter(List[MeetingCreate]).validate_json(body)
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=json.loads(e.json()))
+
+    if not meetings:
+        raise HTTPException(status_code=422, detail="No meetings in request body")
+    if len(meetings) > settings.bulk_ingest_max_items:
+        raise HTTPException(
+            status_code=413,
+            detail=f"At most {settings.bulk_ingest_max_items} meetings per request",
+        )
+    return meetings
 
 
 @router.put("/meetings/{meeting_id}", response_model=MeetingResponse)
@@ -49,23 +274,99 @@ def update_meeting(
 
 
 @router.get("/{event_id}/summary")
-def get_event_summary(event_id: int, db: Session = Depends(get_db)):
-    """Get the summary for a specific event."""
+def get_event_summary(event_id: int, request: Request, db: Session = Depends(get_db)):
+    """
+    Get the summary for a specific event.
+
+    Returns 202 with the job status while the summary is still being generated.
+    The ETag is a hash of the summary content, so regenerating an identical
+    summary doesn't invalidate cached copies.
+    """
     summary = event_service.get_event_summary(db, event_id=event_id)
-    if summary is None:
-        raise HTTPException(status_code=404, detail="Summary not found")
-    return summary.summary_json
+    if summary is not None:
+        body = json.dumps(
+            summary.summary_json, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+        etag = content_etag(body)
+        if is_not_modified(request, etag, summary.updated_at):
+            return not_modified(etag, summary.updated_at)
+        return Response(
+            content=body,
+            media_type="application/json",
+            headers=cache_headers(etag, summary.updated_at),
+        )
+
+    job = summary_queue.get_summary_job(db, event_id=event_id)
+    if job is not None and job.status in (SUMMARY_PENDING, SUMMARY_RUNNING):
+        job_status = SummaryJobStatus.model_validate(job)
+        return JSONResponse(status_code=202, content=job_status.model_dump(mode="json"))
+    if job is not None and job.status == SUMMARY_FAILED:
+        raise HTTPException(
+            status_code=404, detail=f"Summary generation failed: {job.last_error}"
+        )
+    raise HTTPException(status_code=404, detail="Summary not found")
 
 
 @router.post("/{event_id}/summary/regenerate")
-def regenerate_event_summary(event_id: int, db: Session = Depends(get_db)):
-    """Regenerate the summary for a specific event."""
-    summary_data = event_service.regenerate_event_summary(db, event_id=event_id)
+async def regenerate_event_summary(
+    event_id: int,
+    force: bool = False,
+    db: Session = Depends(get_db),
+    llm: LLMService = Depends(get_llm_service),
+):
+    """Regenerate the summary for a specific event. Pass force=true to bypass the LLM cache."""
+    summary_data = await event_service.regenerate_event_summary(
+        db, event_id=event_id, force=force, llm=llm
+    )
     if summary_data is None:
         raise HTTPException(status_code=404, detail="Event not found or has no transcript")
     return summary_data
 
 
+@router.post("/{event_id}/summary/regenerate/stream")
+async def stream_regenerated_event_summary(
+    event_id: int,
+    force: bool = False,
+    db: Session = Depends(get_db),
+    llm: LLMService = Depends(get_llm_service),
+):
+    """
+    Regenerate the summary for a specific event, streamed as Server-Sent Events.
+
+    While the LLM writes, `partial` events carry the summary fields received
+    so far (TL;DR first, then action items); long transcripts first get a
+    `progress` event while their parts are summarized. The stream ends with
+    a `summary` event once the complete summary has been saved, or an
+    `error` event if generation failed.
+    """
+    events = await event_service.regenerate_event_summary_stream(
+        db, event_id=event_id, force=force, llm=llm
+    )
+    if events is None:
+        raise HTTPException(status_code=404, detail="Event not found or has no transcript")
+    return StreamingResponse(
+        _sse_messages(events),
+        media_type="text/event-stream",
+        # Keep proxies from buffering or caching the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _sse_messages(events: AsyncIterator[Tuple[str, dict]]) -> AsyncIterator[bytes]:
+    """Encode (event, data) pairs as Server-Sent Events; a failure becomes a final error event."""
+    try:
+        async for event, data in events:
+            yield _sse_message(event, data)
+    except Exception as e:
+        # Headers are already sent, so the failure has to travel in the stream
+        yield _sse_message("error", {"detail": f"Summary generation failed: {e}"})
+
+
+def _sse_message(event: str, data: dict) -> bytes:
+    payload = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    return f"event: {event}\ndata: {payload}\n\n".encode("utf-8")
+
+
 @router.delete("/{event_id}", status_code=204)
 def delete_event(event_id: int, db: Session = Depends(get_db)):
     """Delete an event."""
@@ -0,0 +1,77 @@
+from datetime import datetime
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from typing import Optional
+
+from app.database import get_db
+from app.services.llm_logger import llm_logger
+from app.services.llm_metrics import llm_metrics, usage_since
+from app.services.llm_service import get_llm_service
+from app.services.read_cache import read_cache
+
+router = APIRouter()
+
+
+@router.get("/llm-cache")
+def get_llm_cache_stats():
+    """Get LLM response cache hit/miss counters."""
+    cache = get_llm_service().cache
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.stats()}
+
+
+@router.get("/read-cache")
+def get_read_cache_stats():
+    """Get customer/summary read cache hit rate, size and evictions."""
+    return read_cache.stats()
+
+
+@router.get("/llm-rate-limit")
+def get_llm_rate_limit_stats():
+    """Get remaining LLM request/token budget and how often calls were throttled."""
+    return get_llm_service().rate_limiter.stats()
+
+
+@router.get("/prompts")
+def get_prompt_versions():
+    """Get the current content-hash version of every prompt template."""
+    llm = get_llm_service()
+    return {
+        "versions": llm.prompts.versions(),
+        "summary_prompt_version": llm.summary_prompt_version(),
+    }
+
+
+@router.get("/llm-providers")
+def get_llm_provider_stats():
+    """Get hedge/fallback counters and per-provider attempts, wins and circuit breaker state."""
+    return get_llm_service().router.stats()
+
+
+@router.get("/llm-log")
+def get_llm_log_stats():
+    """Get LLM call log counters (written, queued, dropped, sampled out)."""
+    return llm_logger.stats()
+
+
+@router.get("/llm")
+def get_llm_usage(
+    since: Optional[datetime] = None,
+    group_by: str = Query("operation", pattern="^(operation|customer_id|model|prompt_version)$"),
+    db: Session = Depends(get_db),
+):
+    """
+    Get LLM token usage, cost and latency.
+
+    Without since, returns in-memory totals and histograms since startup,
+    broken down by operation, customer, model and prompt version. With
+    since, aggregates the persisted llm_calls table grouped by group_by.
+    """
+    if since is None:
+        return llm_metrics.snapshot()
+    return {
+        "since": since.isoformat(),
+        "group_by": group_by,
+        "usage": usage_since(db, since, group_by=group_by),
+    }
@@ -0,0 +1,27 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from typing import Optional
+
+from app.database import get_db
+from app.services import search_service
+from app.services.schemas import Page, SearchHit
+
+router = APIRouter()
+
+
+@router.get("", response_model=Page[SearchHit])
+def search(
+    q: str = Query(..., min_length=1, max_length=500),
+    customer_id: Optional[int] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+):
+    """Search meeting transcripts, summaries and action items, best matches first."""
+    try:
+        hits, next_cursor = search_service.search(
+            db, q, customer_id=customer_id, cursor=cursor, limit=limit
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return Page(items=hits, next_cursor=next_cursor)
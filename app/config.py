@@ -1,3 +1,5 @@
+from typing import Dict, Tuple
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -9,18 +11,113 @@ class Settings(BaseSettings):
     # Database
     database_url: str = "sqlite:///./prancing_pony.db"
 
+    # Database engine profile (pool settings apply to PostgreSQL and file-based SQLite)
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = 1800  # Seconds before a pooled connection is replaced
+    db_pool_pre_ping: bool = True
+
+    # SQLite pragmas, applied to every new connection
+    sqlite_journal_mode: str = "WAL"  # Lets readers proceed while a write is in progress
+    sqlite_synchronous: str = "NORMAL"  # Safe with WAL; fsyncs at checkpoints only
+    sqlite_busy_timeout_ms: int = 5000  # Wait for locks instead of raising "database is locked"
+    sqlite_cache_size_kb: int = 65536
+    sqlite_mmap_size: int = 256 * 1024 * 1024
+
     # API Keys
     anthropic_api_key: str = ""
     openai_api_key: str = ""
 
+    # LLM
+    llm_model: str = "gpt-4o-mini"
+    llm_max_connections: int = 200  # Shared HTTP client pool for concurrent LLM calls
+    llm_request_timeout: float = 120.0
+    llm_temperature: float = 0.0
+    llm_requests_per_minute: int = 500  # Provider rate limits; 0 disables
+    llm_tokens_per_minute: int = 200000
+    llm_max_concurrency: int = 32  # LLM calls in flight per process; more wait their turn
+    llm_max_retries: int = 1  # Client-side retries per provider; fallback providers cover the rest
+    # USD per 1k [prompt, completion] tokens by "provider/model", for cost accounting;
+    # calls to models not listed are recorded without a cost
+    llm_prices_per_1k_tokens: Dict[str, Tuple[float, float]] = {
+        "openai/gpt-4o-mini": (0.00015, 0.0006),
+        "openai/gpt-4o": (0.0025, 0.01),
+        "anthropic/claude-3-5-haiku-latest": (0.0008, 0.004),
+        "anthropic/claude-3-5-sonnet-latest": (0.003, 0.015),
+    }
+    llm_metrics_flush_seconds: float = 5.0  # How often call records are persisted to llm_calls
+    llm_prompts_dir: str = ""  # Prompt templates; empty uses prompts/ at the project root
+
+    # LLM providers, in order of preference; later ones serve as hedges and fallbacks
+    llm_providers: str = "openai"  # Comma-separated: openai, anthropic
+    anthropic_model: str = "claude-3-5-haiku-latest"
+    anthropic_max_tokens: int = 4096
+    llm_hedge_after_seconds: float = 0.0  # Also ask the next provider if no answer by then; 0 disables
+    llm_breaker_failures: int = 5  # Consecutive failures before a provider is skipped
+    llm_breaker_reset_seconds: float = 30.0  # How long a provider is skipped before a trial call
+
+    # Long transcripts are summarized chunk by chunk (map-reduce)
+    llm_chunk_tokens: int = 12000  # Transcript tokens per chunk; shorter transcripts use one call
+    llm_chunk_concurrency: int = 4  # Chunk summaries in flight per transcript
+
+    # LLM response cache
+    llm_cache_enabled: bool = True
+    llm_cache_path: str = ""  # SQLite file; empty uses llm-cache.db at the project root
+    llm_cache_max_entries: int = 10000
+    llm_cache_max_bytes: int = 256 * 1024 * 1024  # Total size of cached responses; 0 disables
+    llm_cache_ttl_seconds: int = 30 * 24 * 3600
+
+    # LLM call log (JSON Lines segments written by a background thread)
+    llm_log_dir: str = "llm-logs"
+    llm_log_sample_rate: float = 1.0  # Fraction of calls logged
+    llm_log_max_segment_bytes: int = 64 * 1024 * 1024
+    llm_log_rotate_seconds: float = 3600.0  # Start a new segment at least this often
+    llm_log_compress: bool = True  # Gzip segments once they are rotated
+    llm_log_retention_segments: int = 168  # Oldest segments beyond this are deleted
+    llm_log_queue_size: int = 10000  # Records buffered before new ones are dropped
+
     # API Configuration
     api_host: str = "0.0.0.0"
     api_port: int = 8000
-    debug: bool = True
+    debug: bool = False  # Development mode: query diagnostics, prompt and server auto-reload
+    http_cache_control: str = "no-cache"  # Sent with ETag'd reads: caches must revalidate before reuse
+
+    # Query diagnostics (only when debug is on)
+    slow_query_ms: float = 100.0  # Statements slower than this are flagged
+    n_plus_one_threshold: int = 5  # Same statement this many times in one request is flagged
+    debug_requests_kept: int = 200  # Recent requests listed at /debug/requests
+
+    # Summary job queue
+    summary_worker_enabled: bool = True
+    summary_worker_concurrency: int = 2
+    summary_worker_poll_interval: float = 1.0  # Seconds between polls when the queue is empty
+    summary_job_max_attempts: int = 3
+    summary_job_backoff_seconds: float = 5.0  # Doubled after every failed attempt
+    summary_job_stale_after_seconds: int = 600  # Running jobs older than this are requeued on startup
+
+    # Bulk meeting ingestion
+    bulk_ingest_max_items: int = 10000  # Meetings accepted per request
+
+    # Customer health rollup
+    customer_health_trend_days: int = 90  # Window of meetings behind trend_score
+    customer_health_sweep_interval: float = 3600.0  # Seconds between sweeps aging trend windows; 0 disables
+
+    # Read-through cache for single customer and summary lookups
+    read_cache_enabled: bool = True
+    read_cache_max_entries: int = 10000
+    read_cache_max_bytes: int = 64 * 1024 * 1024  # Pickled size of all entries
+    read_cache_ttl_seconds: int = 300  # Bounds staleness from writes made outside this process
+    read_cache_redis_url: str = ""  # Share the cache across worker processes; empty keeps it in-process
 
     # CORS
     cors_origins: str = "http://localhost:5173,http://localhost:3000"
 
+    @property
+    def llm_providers_list(self) -> list[str]:
+        """Parse LLM providers from comma-separated string."""
+        return [name.strip() for name in self.llm_providers.split(",") if name.strip()]
+
     @property
     def cors_origins_list(self) -> list[str]:
         """Parse CORS origins from comma-separated string."""
@@ -1,13 +1,63 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
 from app.config import settings
 
+
+def _is_memory_sqlite(url) -> bool:
+    return url.database in (None, "", ":memory:") or url.query.get("mode") == "memory"
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Apply the configured pragmas to a new SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"PRAGMA journal_mode={settings.sqlite_journal_mode}")
+    cursor.execute(f"PRAGMA synchronous={settings.sqlite_synchronous}")
+    cursor.execute(f"PRAGMA busy_timeout={int(settings.sqlite_busy_timeout_ms)}")
+    # A negative cache_size is interpreted as KiB rather than pages
+    cursor.execute(f"PRAGMA cache_size=-{int(settings.sqlite_cache_size_kb)}")
+    cursor.execute(f"PRAGMA mmap_size={int(settings.sqlite_mmap_size)}")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
+def create_db_engine(database_url: str) -> Engine:
+    """
+    Create an engine using the production profile from settings.
+
+    SQLite connections get WAL mode and tuned pragmas through a connect-event
+    hook; PostgreSQL (and other server databases) get a pre-pinged,
+    recycled connection pool.
+    """
+    url = make_url(database_url)
+    engine_kwargs = {}
+
+    if url.get_backend_name() == "sqlite":
+        engine_kwargs["connect_args"] = {
+            "check_same_thread": False,
+            "timeout": settings.sqlite_busy_timeout_ms / 1000,
+        }
+    if not (url.get_backend_name() == "sqlite" and _is_memory_sqlite(url)):
+        # In-memory SQLite uses a single-connection pool that takes no sizing
+        engine_kwargs.update(
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+            pool_recycle=settings.db_pool_recycle,
+            pool_pre_ping=settings.db_pool_pre_ping,
+        )
+
+    db_engine = create_engine(url, **engine_kwargs)
+
+    if url.get_backend_name() == "sqlite":
+        event.listen(db_engine, "connect", _set_sqlite_pragmas)
+    return db_engine
+
+
 # Create SQLAlchemy engine
-engine = create_engine(
-    settings.database_url, connect_args={"check_same_thread": False}
-)
+engine = create_db_engine(settings.database_url)
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -0,0 +1,226 @@
+"""
+Per-request query diagnostics for development and staging (opt in with Settings.debug).
+
+Every statement executed while handling a request is recorded. Statements
+repeated with different parameters (N+1 patterns) and statements slower
+than the threshold are flagged, logged with their query plan, summarized
+in X-Query-* response headers and listed at /debug/requests.
+"""
+
+import html
+import logging
+import time
+from collections import deque
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Deque, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class StatementStats:
+    """How often and how long one parameterized statement ran within a request."""
+
+    __slots__ = ("count", "total_ms", "max_ms", "plan")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.plan: Optional[str] = None
+
+
+class RequestDiagnostics:
+    """Statements executed while handling one request, and the problems found in them."""
+
+    def __init__(self, method: str, path: str):
+        self.method = method
+        self.path = path
+        self.started_at = datetime.now()
+        self.status_code: Optional[int] = None
+        self.duration_ms = 0.0
+        self.statements: Dict[str, StatementStats] = {}
+        self.query_count = 0
+        self.query_ms = 0.0
+
+    def record(self, statement: str, elapsed_ms: float) -> StatementStats:
+        stats = self.statements.get(statement)
+        if stats is None:
+            stats = self.statements[statement] = StatementStats()
+        stats.count += 1
+        stats.total_ms += elapsed_ms
+        stats.max_ms = max(stats.max_ms, elapsed_ms)
+        self.query_count += 1
+        self.query_ms += elapsed_ms
+        return stats
+
+    def issues(self) -> List[dict]:
+        """N+1 and slow-query findings, worst first."""
+        found = []
+        for statement, stats in self.statements.items():
+            if stats.count >= settings.n_plus_one_threshold:
+                found.append({"kind": "n+1", "statement": statement, "stats": stats})
+            if stats.max_ms >= settings.slow_query_ms:
+                found.append({"kind": "slow", "statement": statement, "stats": stats})
+        return sorted(found, key=lambda issue: issue["stats"].total_ms, reverse=True)
+
+
+current_diagnostics: ContextVar[Optional[RequestDiagnostics]] = ContextVar(
+    "current_diagnostics", default=None
+)
+
+# Most recent requests, for /debug/requests
+recent_requests: Deque[RequestDiagnostics] = deque(maxlen=settings.debug_requests_kept)
+
+
+def explain(cursor, statement: str, parameters, dialect_name: str) -> Optional[str]:
+    """
+    Get the query plan of a SELECT using a fresh DB-API cursor.
+
+    The raw cursor bypasses SQLAlchemy, so explaining does not re-enter
+    the execute hooks or disturb the statement's own result. It runs on the
+    request's connection, inside its transaction: on PostgreSQL a failed
+    statement aborts the whole transaction, so EXPLAIN runs in a savepoint
+    that is rolled back on failure. (SQLite's EXPLAIN QUERY PLAN doesn't
+    affect the transaction.)
+    """
+    if not statement.lstrip().upper().startswith("SELECT"):
+        return None
+    sqlite = dialect_name == "sqlite"
+    prefix = "EXPLAIN QUERY PLAN " if sqlite else "EXPLAIN "
+    explain_cursor = cursor.connection.cursor()
+    try:
+        if not sqlite:
+            explain_cursor.execute("SAVEPOINT query_diagnostics_explain")
+        try:
+            explain_cursor.execute(prefix + statement, parameters)
+            rows = explain_cursor.fetchall()
+        except Exception as e:
+            if not sqlite:
+                explain_cursor.execute("ROLLBACK TO SAVEPOINT query_diagnostics_explain")
+            return f"EXPLAIN failed: {e}"
+        finally:
+            if not sqlite:
+                explain_cursor.execute("RELEASE SAVEPOINT query_diagnostics_explain")
+    finally:
+        explain_cursor.close()
+    # SQLite rows are (id, parent, notused, detail); PostgreSQL rows are single lines
+    return "\n".join(str(row[-1]) for row in rows)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if current_diagnostics.get() is not None:
+        conn.info.setdefault("diagnostics_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    diagnostics = current_diagnostics.get()
+    if diagnostics is None or not conn.info.get("diagnostics_started"):
+        return
+    elapsed_ms = (time.perf_counter() - conn.info["diagnostics_started"].pop()) * 1000
+    stats = diagnostics.record(statement, elapsed_ms)
+
+    # Explain each suspicious statement once, while its connection is at hand
+    suspicious = elapsed_ms >= settings.slow_query_ms or stats.count == settings.n_plus_one_threshold
+    if suspicious and stats.plan is None and not executemany:
+        stats.plan = explain(cursor, statement, parameters, conn.dialect.name)
+
+
+def _handle_error(exception_context):
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("diagnostics_started"):
+        conn.info["diagnostics_started"].pop()
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Record statements executed on the engine while a request is being diagnosed."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+class QueryDiagnosticsMiddleware:
+    """ASGI middleware that diagnoses the statements run by each request."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"].startswith("/debug/"):
+            await self.app(scope, receive, send)
+            return
+
+        diagnostics = RequestDiagnostics(scope["method"], scope["path"])
+        token = current_diagnostics.set(diagnostics)
+        started = time.perf_counter()
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                diagnostics.status_code = message["status"]
+                headers = list(message.get("headers", []))
+                headers += [
+                    (b"x-query-count", str(diagnostics.query_count).encode()),
+                    (b"x-query-time-ms", f"{diagnostics.query_ms:.1f}".encode()),
+                    (b"x-query-issues", str(len(diagnostics.issues())).encode()),
+                ]
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            current_diagnostics.reset(token)
+            diagnostics.duration_ms = (time.perf_counter() - started) * 1000
+            recent_requests.append(diagnostics)
+            for issue in diagnostics.issues():
+                stats = issue["stats"]
+                logger.warning(
+                    f"{issue['kind']} query in {diagnostics.method} {diagnostics.path}: "
+                    f"{stats.count}x, max {stats.max_ms:.1f} ms, total {stats.total_ms:.1f} ms\n"
+                    f"{issue['statement']}\nPlan:\n{stats.plan or '(not available)'}"
+                )
+
+
+def render_requests_page() -> str:
+    """Render recent requests as an HTML page, worst offenders first."""
+    requests = sorted(
+        list(recent_requests),
+        key=lambda r: (len(r.issues()), r.query_count, r.query_ms),
+        reverse=True,
+    )
+    rows = []
+    for r in requests:
+        issues = "".join(
+            "<details><summary>{kind}: {count}x, max {max_ms:.1f} ms</summary>"
+            "<pre>{statement}</pre><pre>{plan}</pre></details>".format(
+                kind=issue["kind"],
+                count=issue["stats"].count,
+                max_ms=issue["stats"].max_ms,
+                statement=html.escape(issue["statement"]),
+                plan=html.escape(issue["stats"].plan or "(no plan)"),
+            )
+            for issue in r.issues()
+        )
+        rows.append(
+            f"<tr><td>{r.started_at:%H:%M:%S}</td><td>{html.escape(r.method)}</td>"
+            f"<td>{html.escape(r.path)}</td><td>{r.status_code}</td>"
+            f"<td>{r.duration_ms:.1f}</td><td>{r.query_count}</td><td>{r.query_ms:.1f}</td>"
+            f"<td>{issues or '-'}</td></tr>"
+        )
+    return (
+        "<!doctype html><html><head><title>Request diagnostics</title>"
+        "<style>body{font-family:sans-serif}td,th{padding:4px 8px;border-bottom:1px solid #ddd;"
+        "vertical-align:top;text-align:left}pre{white-space:pre-wrap;max-width:900px}</style>"
+        "</head><body><h1>Request diagnostics</h1>"
+        f"<p>Last {len(requests)} requests. N+1: a statement run {settings.n_plus_one_threshold}+ "
+        f"times in one request. Slow: over {settings.slow_query_ms:g} ms.</p>"
+        "<table><tr><th>Time</th><th>Method</th><th>Path</th><th>Status</th><th>ms</th>"
+        "<th>Queries</th><th>Query ms</th><th>Issues</th></tr>"
+        + "".join(rows)
+        + "</table></body></html>"
+    )
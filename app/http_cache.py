@@ -0,0 +1,86 @@
+"""
+Conditional GET support: ETag and Last-Modified validators, 304 responses
+and Cache-Control headers.
+
+Row-backed resources derive a strong ETag from their updated_at column, so
+an endpoint can answer If-None-Match (or If-Modified-Since) after a cheap
+version lookup, before loading or serializing the body.
+"""
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Optional
+
+from fastapi import Request, Response
+
+from app.config import settings
+
+
+def version_etag(kind: str, key, updated_at: Optional[datetime]) -> Optional[str]:
+    """ETag for a row identified by kind and key, at the version given by updated_at."""
+    if updated_at is None:
+        return None
+    digest = hashlib.sha1(f"{kind}:{key}:{updated_at.isoformat()}".encode("utf-8")).hexdigest()
+    return f'"{digest[:24]}"'
+
+
+def content_etag(content: bytes) -> str:
+    """ETag for an exact response body."""
+    return f'"{hashlib.sha256(content).hexdigest()[:32]}"'
+
+
+def http_date(value: datetime) -> str:
+    """Format a naive local (or aware) datetime as an HTTP date."""
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def cache_headers(etag: Optional[str], last_modified: Optional[datetime] = None) -> Dict[str, str]:
+    """Validator and Cache-Control headers for a cacheable response."""
+    headers = {"Cache-Control": settings.http_cache_control}
+    if etag is not None:
+        headers["ETag"] = etag
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    return headers
+
+
+def etag_matches(header: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag."""
+    if header.strip() == "*":
+        return True
+    return any(candidate.strip().removeprefix("W/") == etag for candidate in header.split(","))
+
+
+def if_range_matches(header: str, etag: Optional[str], last_modified: Optional[datetime]) -> bool:
+    """Whether an If-Range validator (strong ETag or HTTP date) still matches, so the range may be served."""
+    header = header.strip()
+    if header.startswith(('"', "W/")):
+        return etag is not None and header == etag
+    return last_modified is not None and header == http_date(last_modified)
+
+
+def is_not_modified(
+    request: Request, etag: Optional[str], last_modified: Optional[datetime] = None
+) -> bool:
+    """Whether the client's cached copy is current. If-None-Match takes precedence over If-Modified-Since."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag is not None and etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    # HTTP dates have whole-second precision
+    return last_modified.astimezone(timezone.utc).replace(microsecond=0) <= since
+
+
+def not_modified(etag: Optional[str], last_modified: Optional[datetime] = None) -> Response:
+    """An empty 304 response carrying the current validators."""
+    return Response(status_code=304, headers=cache_headers(etag, last_modified))
@@ -0,0 +1,209 @@
+"""
+Request, database and LLM instrumentation exported at /metrics.
+
+MetricsMiddleware times every HTTP request per route template and tracks
+in-flight requests. SQLAlchemy cursor hooks time every statement and
+attribute it to the current request through a context variable, which
+Starlette copies into the threadpool that runs sync endpoints.
+"""
+
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+import anyio.to_thread
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.metrics import Counter, Gauge, Histogram
+from app.services.rate_limiter import PRIORITY_NAMES
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total", "HTTP requests handled.", ["method", "route", "status"]
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds", "HTTP request latency.", ["method", "route"]
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight", "HTTP requests currently being handled.", ["method"]
+)
+DB_QUERIES_PER_REQUEST = Histogram(
+    "http_request_db_queries", "Database statements executed per HTTP request.", ["method", "route"],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100),
+)
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds", "Database statement latency.", ["operation"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0),
+)
+LLM_CALL_DURATION = Histogram(
+    "llm_call_duration_seconds", "LLM call latency (cache hits included).", ["operation", "model", "cache_hit"]
+)
+LLM_CALLS = Counter(
+    "llm_calls_total", "LLM calls made.", ["operation", "model", "outcome"]
+)
+LLM_TOKENS = Counter(
+    "llm_tokens_total", "LLM tokens used.", ["operation", "model", "kind"]
+)
+LLM_PROVIDER_ATTEMPTS = Counter(
+    "llm_provider_attempts_total", "Attempts sent to each LLM provider, hedges and fallbacks included.",
+    ["provider", "outcome"],
+)
+LLM_QUEUE_DEPTH = Gauge(
+    "llm_queue_depth", "LLM calls waiting for rate limit or concurrency capacity.", ["priority"]
+)
+LLM_IN_FLIGHT = Gauge(
+    "llm_calls_in_flight", "LLM calls holding a concurrency slot."
+)
+LLM_QUEUE_WAIT = Histogram(
+    "llm_queue_wait_seconds", "Time LLM calls waited for rate limit or concurrency capacity.", ["priority"],
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+)
+THREADPOOL_IN_USE = Gauge(
+    "threadpool_threads_in_use", "Worker threads busy running sync endpoints and to_thread calls."
+)
+THREADPOOL_LIMIT = Gauge(
+    "threadpool_threads_limit", "Maximum worker threads available to sync endpoints."
+)
+
+
+class RequestStats:
+    """Per-request counters filled in by the database hooks."""
+
+    __slots__ = ("queries", "query_seconds")
+
+    def __init__(self):
+        self.queries = 0
+        self.query_seconds = 0.0
+
+
+current_request_stats: ContextVar[Optional[RequestStats]] = ContextVar(
+    "current_request_stats", default=None
+)
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording per-route latency, status and DB query counts."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        stats = RequestStats()
+        token = current_request_stats.set(stats)
+        status_code = 500
+        started = time.perf_counter()
+        # The route is only known after routing, so in-flight is tracked per method
+        in_flight = HTTP_REQUESTS_IN_FLIGHT.labels(method)
+        in_flight.inc()
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            in_flight.dec()
+            current_request_stats.reset(token)
+            route_path = route_template(scope)
+            HTTP_REQUESTS.labels(method, route_path, status_code).inc()
+            HTTP_REQUEST_DURATION.labels(method, route_path).observe(elapsed)
+            DB_QUERIES_PER_REQUEST.labels(method, route_path).observe(stats.queries)
+
+
+def route_template(scope) -> str:
+    """
+    The matched route's path template, e.g. /api/events/{event_id}.
+
+    Templates keep label cardinality bounded; unmatched paths share one
+    label. Routes of included routers may only know their own part of the
+    template, so the router prefix is taken from the request path.
+    """
+    route = scope.get("route")
+    template = getattr(route, "path_format", None)
+    if template is None:
+        return "unmatched"
+    path = scope["path"]
+    prefix_segments = path.count("/") - template.count("/")
+    if prefix_segments <= 0:
+        return template
+    return "/".join(path.split("/")[:prefix_segments + 1]) + template
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_started"].pop()
+    operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "OTHER"
+    DB_QUERY_DURATION.labels(operation).observe(elapsed)
+    stats = current_request_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.query_seconds += elapsed
+
+
+def _handle_error(exception_context):
+    # Keep the timing stack balanced when a statement fails
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_started"):
+        conn.info["query_started"].pop()
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Time every statement executed on the engine."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+def observe_llm_call(
+    operation: str,
+    model: str,
+    seconds: float,
+    prompt_tokens: int,
+    completion_tokens: int,
+    cache_hit: bool,
+    error: Optional[str],
+) -> None:
+    """Record an LLM call made through LLMService."""
+    outcome = "error" if error else "cache_hit" if cache_hit else "success"
+    LLM_CALLS.labels(operation, model, outcome).inc()
+    LLM_CALL_DURATION.labels(operation, model, str(cache_hit).lower()).observe(seconds)
+    if prompt_tokens:
+        LLM_TOKENS.labels(operation, model, "prompt").inc(prompt_tokens)
+    if completion_tokens:
+        LLM_TOKENS.labels(operation, model, "completion").inc(completion_tokens)
+
+
+def observe_llm_attempt(provider: str, outcome: str) -> None:
+    """Record how one provider attempt ended: success, error, invalid or cancelled."""
+    LLM_PROVIDER_ATTEMPTS.labels(provider, outcome).inc()
+
+
+def observe_llm_queue_wait(priority: int, seconds: float) -> None:
+    """Record how long an LLM call waited in the rate limiter queue."""
+    LLM_QUEUE_WAIT.labels(PRIORITY_NAMES.get(priority, str(priority))).observe(seconds)
+
+
+def install_llm_limiter_gauges(limiter) -> None:
+    """Report queue depth per priority and calls in flight of the shared LLM rate limiter."""
+    for priority, name in PRIORITY_NAMES.items():
+        LLM_QUEUE_DEPTH.labels(name).set_function(lambda priority=priority: limiter.queue_depth(priority))
+    LLM_IN_FLIGHT.set_function(lambda: limiter.in_flight)
+
+
+def install_threadpool_gauges() -> None:
+    """Report the anyio worker thread limiter. Must be called from the event loop."""
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    THREADPOOL_IN_USE.set_function(lambda: limiter.borrowed_tokens)
+    THREADPOOL_LIMIT.set_function(lambda: limiter.total_tokens)
@@ -1,16 +1,52 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import HTMLResponse, Response
 
+from app import diagnostics
+from app import metrics as prometheus
 from app.config import settings
-from app.api import customers, events
+from app.database import engine
+from app.instrumentation import MetricsMiddleware, install_threadpool_gauges, instrument_engine
+from app.api import action_items, customers, events, metrics, search
+from app.services.llm_logger import llm_logger
+from app.services.llm_metrics import llm_metrics
+from app.services.llm_service import aclose_llm_service
+from app.services.summary_worker import summary_worker_pool
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start background workers on startup and drain them on shutdown."""
+    install_threadpool_gauges()
+    if settings.summary_worker_enabled:
+        await summary_worker_pool.start()
+    yield
+    await summary_worker_pool.stop()
+    await aclose_llm_service()
+    await asyncio.to_thread(llm_logger.close)
+    await asyncio.to_thread(llm_metrics.close)
+
 
 # Initialize FastAPI app
 app = FastAPI(
     title="The Prancing Pony",
     description="Customer Relationship Tracking Application",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
+# Time every request and database statement for /metrics
+app.add_middleware(MetricsMiddleware)
+instrument_engine(engine)
+
+# Flag N+1 patterns and slow queries per request in development and staging
+if settings.debug:
+    app.add_middleware(diagnostics.QueryDiagnosticsMiddleware)
+    diagnostics.instrument_engine(engine)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -36,9 +72,25 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/metrics", include_in_schema=False)
+async def prometheus_metrics():
+    """Prometheus metrics in the text exposition format."""
+    return Response(content=prometheus.REGISTRY.render(), media_type=prometheus.CONTENT_TYPE)
+
+
+if settings.debug:
+    @app.get("/debug/requests", include_in_schema=False, response_class=HTMLResponse)
+    async def debug_requests():
+        """Recent requests with their query counts, N+1 patterns and slow queries."""
+        return diagnostics.render_requests_page()
+
+
 # Include routers
 app.include_router(customers.router, prefix="/api/customers", tags=["customers"])
 app.include_router(events.router, prefix="/api/events", tags=["events"])
+app.include_router(metrics.router, prefix="/api/metrics", tags=["metrics"])
+app.include_router(search.router, prefix="/api/search", tags=["search"])
+app.include_router(action_items.router, prefix="/api/action-items", tags=["action-items"])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,263 @@
+"""
+Minimal Prometheus-compatible metrics (counters, gauges, histograms).
+
+Updates go to a per-thread shard, so the hot path never takes a lock: each
+thread only ever writes its own shard, and shards are summed when the
+registry is rendered in the Prometheus text exposition format. A thread's
+shard is folded into a shared one when the thread exits, so short-lived
+worker threads don't pile up shards.
+"""
+
+import bisect
+import math
+import threading
+import weakref
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class _ShardOwner:
+    """Holds a thread's shard; only referenced from the thread-local, so it dies with the thread."""
+
+    __slots__ = ("shard", "__weakref__")
+
+    def __init__(self, shard: List[float]):
+        self.shard = shard
+
+
+class _Sharded:
+    """Base for a metric child whose values are kept in per-thread shards."""
+
+    def __init__(self, size: int):
+        self._size = size
+        self._local = threading.local()
+        self._shards: List[List[float]] = []
+        self._retired = [0.0] * size  # Totals of threads that have exited
+        self._lock = threading.Lock()
+
+    def _shard(self) -> List[float]:
+        owner = getattr(self._local, "owner", None)
+        if owner is None:
+            owner = _ShardOwner([0.0] * self._size)
+            with self._lock:  # Once per thread
+                self._shards.append(owner.shard)
+            # Thread-locals are cleared when their thread exits, which finalizes the owner
+            weakref.finalize(owner, self._retire, owner.shard)
+            self._local.owner = owner
+        return owner.shard
+
+    def _retire(self, shard: List[float]) -> None:
+        with self._lock:
+            for i, value in enumerate(shard):
+                self._retired[i] += value
+            self._shards = [live for live in self._shards if live is not shard]
+
+    def _totals(self) -> List[float]:
+        with self._lock:
+            shards = list(self._shards)
+            totals = list(self._retired)
+        for shard in shards:
+            for i, value in enumerate(shard):
+                totals[i] += value
+        return totals
+
+
+class CounterChild(_Sharded):
+    def __init__(self):
+        super().__init__(1)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._shard()[0] += amount
+
+    def value(self) -> float:
+        return self._totals()[0]
+
+
+class GaugeChild(_Sharded):
+    def __init__(self):
+        super().__init__(1)
+        self._function: Optional[Callable[[], float]] = None
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._shard()[0] += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._shard()[0] -= amount
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Compute the gauge value on every scrape instead of tracking it."""
+        self._function = function
+
+    def value(self) -> float:
+        if self._function is not None:
+            return self._function()
+        return self._totals()[0]
+
+
+class HistogramChild(_Sharded):
+    def __init__(self, buckets: Sequence[float]):
+        # One slot per bucket, one for +Inf, one for the sum
+        super().__init__(len(buckets) + 2)
+        self._buckets = buckets
+
+    def observe(self, value: float) -> None:
+        shard = self._shard()
+        shard[bisect.bisect_left(self._buckets, value)] += 1
+        shard[-1] += value
+
+    def snapshot(self) -> Tuple[List[float], float, float]:
+        """Cumulative bucket counts, total count and sum."""
+        totals = self._totals()
+        cumulative, running = [], 0.0
+        for count in totals[:-1]:
+            running += count
+            cumulative.append(running)
+        return cumulative, running, totals[-1]
+
+
+class _Metric:
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (), registry=None):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+        (registry or REGISTRY).register(self)
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values):
+        """Get the child for a set of label values (created on first use)."""
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}")
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _items(self):
+        with self._lock:
+            return list(self._children.items())
+
+    def _label_str(self, key: Tuple[str, ...], extra: Optional[Tuple[str, str]] = None) -> str:
+        pairs = list(zip(self.labelnames, key))
+        if extra:
+            pairs.append(extra)
+        if not pairs:
+            return ""
+        return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        for key, child in self._items():
+            lines.extend(self._render_child(key, child))
+        return lines
+
+    def _render_child(self, key, child) -> List[str]:
+        return [f"{self.name}{self._label_str(key)} {_format(child.value())}"]
+
+
+class Counter(_Metric):
+    type_name = "counter"
+
+    def _new_child(self):
+        return CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+
+class Gauge(_Metric):
+    type_name = "gauge"
+
+    def _new_child(self):
+        return GaugeChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.labels().dec(amount)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        self.labels().set_function(function)
+
+
+class Histogram(_Metric):
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        registry=None,
+    ):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames, registry)
+
+    def _new_child(self):
+        return HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def _render_child(self, key, child) -> List[str]:
+        cumulative, count, total = child.snapshot()
+        bounds = [_format(bound) for bound in self.buckets] + ["+Inf"]
+        lines = [
+            f"{self.name}_bucket{self._label_str(key, ('le', bound))} {_format(value)}"
+            for bound, value in zip(bounds, cumulative)
+        ]
+        lines.append(f"{self.name}_sum{self._label_str(key)} {_format(total)}")
+        lines.append(f"{self.name}_count{self._label_str(key)} {_format(count)}")
+        return lines
+
+
+class Registry:
+    """Collection of metrics rendered together at /metrics."""
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> None:
+        with self._lock:
+            self._metrics.append(metric)
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format (version 0.0.4)."""
+        with self._lock:
+            metrics = list(self._metrics)
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Default registry
+REGISTRY = Registry()
@@ -1,5 +1,9 @@
+from app.models.action_item import ActionItem
 from app.models.customer import Customer
+from app.models.customer_health import CustomerHealth
 from app.models.event import Event, Meeting
 from app.models.event_summary import EventSummary
+from app.models.llm_call import LLMCall
+from app.models.summary_job import SummaryJob
 
-__all__ = ["Customer", "Event", "Meeting", "EventSummary"]
+__all__ = ["Customer", "CustomerHealth", "Event", "Meeting", "EventSummary", "SummaryJob", "LLMCall", "ActionItem"]
@@ -0,0 +1,33 @@
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, DateTime, Date, Text, ForeignKey, Index
+from app.database import Base
+
+ACTION_ITEM_OPEN = "open"
+ACTION_ITEM_DONE = "done"
+ACTION_ITEM_STATUSES = (ACTION_ITEM_OPEN, ACTION_ITEM_DONE)
+
+
+class ActionItem(Base):
+    """An action item from a meeting summary, tracked until it is done."""
+
+    __tablename__ = "action_items"
+
+    id = Column(Integer, primary_key=True, index=True)
+    event_id = Column(
+        Integer, ForeignKey("events.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    customer_id = Column(Integer, ForeignKey("customers.id"), nullable=False)  # Denormalized for cross-customer listings
+    position = Column(Integer, nullable=False, default=0)  # Order within the summary
+    text = Column(Text, nullable=False)
+    status = Column(String(20), nullable=False, default=ACTION_ITEM_OPEN)
+    owner = Column(String(255))
+    due_date = Column(Date)
+    created_at = Column(DateTime, default=datetime.now)
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
+
+    __table_args__ = (
+        # Keyset pagination by ID, within a status and optionally a customer or owner
+        Index("ix_action_items_status_id", "status", "id"),
+        Index("ix_action_items_customer_id_status_id", "customer_id", "status", "id"),
+        Index("ix_action_items_owner_status_id", "owner", "status", "id"),
+    )
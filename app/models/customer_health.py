@@ -0,0 +1,32 @@
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, DateTime, Float, ForeignKey, JSON
+from app.database import Base
+
+
+class CustomerHealth(Base):
+    """
+    Per-customer rollup of meeting summary sentiment, maintained incrementally.
+
+    Rows are updated by the event service whenever a meeting or summary is
+    created, regenerated or deleted, so health can be listed, filtered and
+    sorted without parsing summary JSON. The trend window is aged by
+    health_service.age_customer_trends as meetings fall out of it.
+    """
+
+    __tablename__ = "customer_health"
+
+    customer_id = Column(
+        Integer, ForeignKey("customers.id", ondelete="CASCADE"), primary_key=True
+    )
+    latest_sentiment = Column(String(10), index=True)  # green, amber or red
+    latest_event_id = Column(Integer)  # Most recent meeting with a sentiment
+    latest_summary_at = Column(DateTime)  # Timestamp of that meeting
+    green_count = Column(Integer, nullable=False, default=0)
+    amber_count = Column(Integer, nullable=False, default=0)
+    red_count = Column(Integer, nullable=False, default=0, index=True)
+    open_action_items = Column(Integer, nullable=False, default=0, index=True)
+    last_meeting_at = Column(DateTime, index=True)
+    trend_score = Column(Float, index=True)  # Mean sentiment over the trend window (1 green .. -1 red)
+    recent_sentiments = Column(JSON, nullable=False, default=list)  # [timestamp, event_id, sentiment] in the window
+    trend_oldest_at = Column(DateTime, index=True)  # Oldest meeting in recent_sentiments; swept once out of the window
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
@@ -1,5 +1,6 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Index
+from sqlalchemy.orm import relationship
 from app.database import Base
 
 
@@ -16,11 +17,23 @@ class Event(Base):
     created_at = Column(DateTime, default=datetime.now)
     updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
 
+    summary_job = relationship("SummaryJob", uselist=False, viewonly=True)
+
+    __table_args__ = (
+        # Serves the customer timeline: filter by customer, seek on (timestamp, id)
+        Index("ix_events_customer_id_timestamp_id", "customer_id", "timestamp", "id"),
+    )
+
     __mapper_args__ = {
         "polymorphic_on": event_type,
         "polymorphic_identity": "event",
     }
 
+    @property
+    def summary_status(self):
+        """Status of the background summary job, if one was ever queued."""
+        return self.summary_job.status if self.summary_job else None
+
 
 class Meeting(Event):
     """Meeting event subclass with meeting-specific fields."""
@@ -2,6 +2,9 @@ from datetime import datetime
 from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, JSON
 from app.database import Base
 
+# Version of the summary JSON layout produced by the summary prompts
+SUMMARY_SCHEMA_VERSION = 1
+
 
 class EventSummary(Base):
     """Summary of an event generated by LLM."""
@@ -17,5 +20,10 @@ class EventSummary(Base):
         index=True
     )
     summary_json = Column(JSON, nullable=False)  # Store the full summary as JSON
+    # Projected from summary_json on save; action items live in the action_items table
+    sentiment = Column(String(10), index=True)  # green, amber or red
+    tldr = Column(Text)
+    schema_version = Column(Integer, nullable=False, default=SUMMARY_SCHEMA_VERSION)
+    prompt_version = Column(String(32))  # Version of the summary prompts that produced it
     created_at = Column(DateTime, default=datetime.now)
     updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
@@ -0,0 +1,27 @@
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, DateTime, Float, Boolean, Text, Index
+from app.database import Base
+
+
+class LLMCall(Base):
+    """Token usage, latency and cost of a single LLM call (or cache hit)."""
+
+    __tablename__ = "llm_calls"
+
+    id = Column(Integer, primary_key=True, index=True)
+    created_at = Column(DateTime, default=datetime.now, nullable=False, index=True)
+    operation = Column(String(50), nullable=False)  # extract_participants, summarize_meeting, ...
+    model = Column(String(100), nullable=False)
+    prompt_version = Column(String(32))
+    customer_id = Column(Integer, index=True)  # No foreign key: usage outlives deleted customers
+    event_id = Column(Integer)
+    prompt_tokens = Column(Integer, nullable=False, default=0)
+    completion_tokens = Column(Integer, nullable=False, default=0)
+    cost_usd = Column(Float)  # None when the model has no configured price
+    latency_ms = Column(Float, nullable=False)
+    cache_hit = Column(Boolean, nullable=False, default=False)
+    error = Column(Text)
+
+    __table_args__ = (
+        Index("ix_llm_calls_operation_created_at", "operation", "created_at"),
+    )
@@ -0,0 +1,38 @@
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Index
+from app.database import Base
+
+# Summary job lifecycle states
+SUMMARY_PENDING = "pending"
+SUMMARY_RUNNING = "running"
+SUMMARY_DONE = "done"
+SUMMARY_FAILED = "failed"
+
+
+class SummaryJob(Base):
+    """Queued LLM summarization work for a meeting, drained by the summary worker."""
+
+    __tablename__ = "summary_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    event_id = Column(
+        Integer,
+        ForeignKey("events.id", ondelete="CASCADE"),
+        nullable=False,
+        unique=True,
+        index=True
+    )
+    batch_id = Column(String(32), index=True)  # Set for meetings created by a bulk ingest
+    status = Column(String(20), nullable=False, default=SUMMARY_PENDING)
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=3)
+    last_error = Column(Text)
+    run_after = Column(DateTime, nullable=False, default=datetime.now)  # Earliest time a worker may pick it up
+    started_at = Column(DateTime)
+    finished_at = Column(DateTime)
+    created_at = Column(DateTime, default=datetime.now)
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
+
+    __table_args__ = (
+        Index("ix_summary_jobs_status_run_after", "status", "run_after"),
+    )
@@ -0,0 +1,219 @@
+from collections import defaultdict
+from datetime import date
+from sqlalchemy.orm import Session
+from typing import Dict, List, Optional, Tuple
+
+from app.models.action_item import ActionItem, ACTION_ITEM_OPEN, ACTION_ITEM_STATUSES
+from app.models.event import Event
+from app.models.event_summary import EventSummary
+from app.services import health_service
+from app.services.pagination import decode_cursor, encode_cursor
+from app.services.schemas import ActionItemUpdate
+
+
+def _parse_due_date(value) -> Optional[date]:
+    try:
+        return date.fromisoformat(str(value)) if value else None
+    except ValueError:
+        return None
+
+
+def parse_action_items(summary_json: Optional[dict]) -> List[dict]:
+    """
+    Action items of a summary as dicts with text, owner and due_date.
+
+    Items may be plain strings or objects with text/owner/due_date keys;
+    empty items are skipped.
+    """
+    action_items = (summary_json or {}).get("action_items")
+    if not isinstance(action_items, list):
+        return []
+    parsed = []
+    for item in action_items:
+        if isinstance(item, dict):
+            text = str(item.get("text") or "").strip()
+            owner = str(item.get("owner") or "").strip() or None
+            due_date = _parse_due_date(item.get("due_date"))
+        else:
+            text, owner, due_date = str(item or "").strip(), None, None
+        if text:
+            parsed.append({"text": text, "owner": owner, "due_date": due_date})
+    return parsed
+
+
+def _open_count(items: List[ActionItem]) -> int:
+    return sum(item.status == ACTION_ITEM_OPEN for item in items)
+
+
+def replace_action_items(
+    db: Session, event_id: int, customer_id: int, summary_json: Optional[dict]
+) -> int:
+    """
+    Sync an event's action items with its (re)generated summary. Joins the caller's transaction.
+
+    Items whose text is unchanged keep their status, owner and due date, so
+    regenerating a summary doesn't reopen finished work.
+
+    Returns:
+        Change in the number of open action items
+    """
+    existing = (
+        db.query(ActionItem).filter(ActionItem.event_id == event_id).order_by(ActionItem.position).all()
+    )
+    old_open = _open_count(existing)
+    by_text: Dict[str, List[ActionItem]] = defaultdict(list)
+    for item in existing:
+        by_text[item.text.casefold()].append(item)
+
+    items = []
+    for position, parsed in enumerate(parse_action_items(summary_json)):
+        matches = by_text.get(parsed["text"].casefold())
+        if matches:
+            item = matches.pop(0)
+            item.position = position
+            item.owner = item.owner or parsed["owner"]
+            item.due_date = item.due_date or parsed["due_date"]
+        else:
+            item = ActionItem(
+                event_id=event_id,
+                customer_id=customer_id,
+                position=position,
+                status=ACTION_ITEM_OPEN,
+                **parsed,
+            )
+            db.add(item)
+        items.append(item)
+    for stale in by_text.values():
+        for item in stale:
+            db.delete(item)
+    return _open_count(items) - old_open
+
+
+def remove_action_items(db: Session, event_id: int) -> int:
+    """
+    Delete an event's action items. Joins the caller's transaction.
+
+    Returns:
+        Change in the number of open action items
+    """
+    items = db.query(ActionItem).filter(ActionItem.event_id == event_id).all()
+    for item in items:
+        db.delete(item)
+    return -_open_count(items)
+
+
+def remove_customer_action_items(db: Session, customer_id: int) -> None:
+    """Delete all of a customer's action items. Joins the caller's transaction."""
+    db.query(ActionItem).filter(ActionItem.customer_id == customer_id).delete(synchronize_session=False)
+
+
+def rebuild_action_items(
+    db: Session, batch_size: int = 1000, commit: bool = True, missing_only: bool = False
+) -> None:
+    """
+    Recreate every action item from the summaries, in batches. Statuses start over as open.
+
+    With missing_only, existing items are kept and only events that have
+    none get theirs derived from the summary.
+    """
+    rows = (
+        db.query(EventSummary.event_id, Event.customer_id, EventSummary.summary_json)
+        .join(Event, Event.id == EventSummary.event_id)
+        .order_by(EventSummary.id)
+    )
+    if missing_only:
+        # Evaluated up front: the inserts below must not change which events qualify
+        covered = {event_id for (event_id,) in db.query(ActionItem.event_id).distinct()}
+    else:
+        covered = set()
+        db.query(ActionItem).delete(synchronize_session=False)
+    batch = []
+    for row in rows.yield_per(batch_size):
+        if row.event_id in covered:
+            continue
+        batch.extend(
+            {"event_id": row.event_id, "customer_id": row.customer_id, "position": position, **parsed}
+            for position, parsed in enumerate(parse_action_items(row.summary_json))
+        )
+        if len(batch) >= batch_size:
+            db.execute(ActionItem.__table__.insert(), batch)
+            batch = []
+    if batch:
+        db.execute(ActionItem.__table__.insert(), batch)
+    if commit:
+        db.commit()
+
+
+def get_action_items(
+    db: Session,
+    status: Optional[str] = None,
+    customer_id: Optional[int] = None,
+    event_id: Optional[int] = None,
+    owner: Optional[str] = None,
+    due_before: Optional[date] = None,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+) -> Tuple[List[ActionItem], Optional[str]]:
+    """
+    Get action items across customers ordered by ID, using keyset pagination.
+
+    Filters on status, customer and owner are served by (filter, status, id)
+    indexes.
+
+    Returns:
+        Tuple of (action items, cursor for the next page or None on the last page)
+
+    Raises:
+        ValueError: If the status or cursor is invalid
+    """
+    query = db.query(ActionItem)
+    if status is not None:
+        if status not in ACTION_ITEM_STATUSES:
+            raise ValueError(f"Unsupported status: {status}")
+        query = query.filter(ActionItem.status == status)
+    if customer_id is not None:
+        query = query.filter(ActionItem.customer_id == customer_id)
+    if event_id is not None:
+        query = query.filter(ActionItem.event_id == event_id)
+    if owner is not None:
+        query = query.filter(ActionItem.owner == owner)
+    if due_before is not None:
+        query = query.filter(ActionItem.due_date < due_before)
+    if cursor:
+        (last_id,) = decode_cursor(cursor, int)
+        query = query.filter(ActionItem.id > last_id)
+
+    # Fetch one extra row to learn whether another page exists
+    items = query.order_by(ActionItem.id).limit(limit + 1).all()
+    if len(items) <= limit:
+        return items, None
+    items = items[:limit]
+    return items, encode_cursor(items[-1].id)
+
+
+def update_action_item(
+    db: Session, action_item_id: int, update: ActionItemUpdate
+) -> Optional[ActionItem]:
+    """
+    Update an action item's status, owner or due date.
+
+    Raises:
+        ValueError: If the status is invalid
+    """
+    item = db.query(ActionItem).filter(ActionItem.id == action_item_id).first()
+    if item is None:
+        return None
+
+    update_data = update.model_dump(exclude_unset=True)
+    if "status" in update_data and update_data["status"] not in ACTION_ITEM_STATUSES:
+        raise ValueError(f"Unsupported status: {update_data['status']}")
+    was_open = item.status == ACTION_ITEM_OPEN
+    for key, value in update_data.items():
+        setattr(item, key, value)
+
+    is_open = item.status == ACTION_ITEM_OPEN
+    if is_open != was_open:
+        health_service.adjust_open_action_items(db, item.customer_id, 1 if is_open else -1)
+    db.commit()
+    db.refresh(item)
+    return item
@@ -1,24 +1,61 @@
+from sqlalchemy import delete, select
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from app.models.customer import Customer
+from app.models.customer_health import CustomerHealth
+from app.models.event import Event, Meeting
+from app.models.event_summary import EventSummary
+from app.models.summary_job import SummaryJob
+from app.services import action_item_service, search_service
+from app.services.pagination import decode_cursor, encode_cursor
+from app.services.read_cache import customer_key, event_summary_key, read_cache
 from app.services.schemas import CustomerCreate, CustomerUpdate
 
 
-def get_customer(db: Session, customer_id: int) -> Optional[Customer]:
-    """Get a customer by ID."""
+def _load_customer(db: Session, customer_id: int) -> Optional[Customer]:
     return db.query(Customer).filter(Customer.id == customer_id).first()
 
 
-def get_customers(db: Session, skip: int = 0, limit: int = 100) -> List[Customer]:
-    """Get all customers with pagination."""
-    return db.query(Customer).offset(skip).limit(limit).all()
+def get_customer(db: Session, customer_id: int) -> Optional[Customer]:
+    """Get a customer by ID, through the read cache."""
+    return read_cache.get_or_load(
+        db, customer_key(customer_id), lambda: _load_customer(db, customer_id)
+    )
+
+
+def get_customers(
+    db: Session, cursor: Optional[str] = None, limit: int = 100
+) -> Tuple[List[Customer], Optional[str]]:
+    """
+    Get customers ordered by ID using keyset pagination.
+
+    Returns:
+        Tuple of (customers, cursor for the next page or None on the last page)
+
+    Raises:
+        ValueError: If the cursor is invalid
+    """
+    query = db.query(Customer)
+    if cursor:
+        (last_id,) = decode_cursor(cursor, int)
+        query = query.filter(Customer.id > last_id)
+
+    # Fetch one extra row to learn whether another page exists
+    customers = query.order_by(Customer.id).limit(limit + 1).all()
+    if len(customers) <= limit:
+        return customers, None
+    customers = customers[:limit]
+    return customers, encode_cursor(customers[-1].id)
 
 
 def create_customer(db: Session, customer: CustomerCreate) -> Customer:
     """Create a new customer."""
     db_customer = Customer(**customer.model_dump())
     db.add(db_customer)
+    db.flush()
+    # IDs can be reused (e.g. SQLite without AUTOINCREMENT), so drop any entry left by a deleted customer
+    read_cache.invalidate_on_commit(db, customer_key(db_customer.id))
     db.commit()
     db.refresh(db_customer)
     return db_customer
@@ -28,7 +65,7 @@ def update_customer(
     db: Session, customer_id: int, customer: CustomerUpdate
 ) -> Optional[Customer]:
     """Update a customer."""
-    db_customer = get_customer(db, customer_id)
+    db_customer = _load_customer(db, customer_id)
     if db_customer is None:
         return None
 
@@ -36,6 +73,7 @@ def update_customer(
     for key, value in update_data.items():
         setattr(db_customer, key, value)
 
+    read_cache.invalidate_on_commit(db, customer_key(customer_id))
     db.commit()
     db.refresh(db_customer)
     return db_customer
@@ -43,10 +81,28 @@ def update_customer(
 
 def delete_customer(db: Session, customer_id: int) -> bool:
     """Delete a customer."""
-    db_customer = get_customer(db, customer_id)
+    db_customer = _load_customer(db, customer_id)
     if db_customer is None:
         return False
 
+    event_ids = [row.id for row in db.query(Event.id).filter(Event.customer_id == customer_id)]
+    read_cache.invalidate_on_commit(
+        db,
+        customer_key(customer_id),
+        *(event_summary_key(event_id) for event_id in event_ids),
+    )
+
+    # Their events and everything hanging off them are deleted explicitly,
+    # since SQLite doesn't enforce ON DELETE CASCADE
+    customer_events = select(Event.id).where(Event.customer_id == customer_id)
+    search_service.remove_customer(db, customer_id)
+    action_item_service.remove_customer_action_items(db, customer_id)
+    db.execute(delete(EventSummary).where(EventSummary.event_id.in_(customer_events)))
+    db.execute(delete(SummaryJob).where(SummaryJob.event_id.in_(customer_events)))
+    db.execute(delete(Meeting.__table__).where(Meeting.__table__.c.id.in_(customer_events)))
+    db.execute(delete(Event.__table__).where(Event.__table__.c.customer_id == customer_id))
+    # Their health rollup, open action item count included, goes too
+    db.query(CustomerHealth).filter(CustomerHealth.customer_id == customer_id).delete()
     db.delete(db_customer)
     db.commit()
     return True
@@ -1,75 +1,250 @@
+import asyncio
 import logging
-from sqlalchemy.orm import Session
-from typing import List, Optional
+import uuid
+from datetime import datetime
+from sqlalchemy import LargeBinary, Row, and_, cast, func, or_
+from sqlalchemy.orm import Session, with_polymorphic
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple
 
 from app.models.event import Event, Meeting
-from app.models.event_summary import EventSummary
+from app.models.event_summary import EventSummary, SUMMARY_SCHEMA_VERSION
 from app.services.schemas import MeetingCreate, MeetingUpdate
-from app.services.llm_service import llm_service
+from app.services import action_item_service, health_service, search_service, summary_queue
+from app.services.pagination import decode_cursor, encode_cursor
+from app.services.llm_service import LLMService, get_llm_service
+from app.services.rate_limiter import PRIORITY_INTERACTIVE, llm_priority
+from app.services.read_cache import event_summary_key, read_cache
 
 logger = logging.getLogger(__name__)
 
 
+# Characters of transcript included in event list items
+TRANSCRIPT_PREVIEW_LENGTH = 200
+
+
 def get_event(db: Session, event_id: int) -> Optional[Event]:
-    """Get an event by ID."""
-    return db.query(Event).filter(Event.id == event_id).first()
+    """Get an event by ID, loading subclass columns in the same query."""
+    event_poly = with_polymorphic(Event, [Meeting])
+    return db.query(event_poly).filter(event_poly.id == event_id).first()
 
 
-def get_event_summary(db: Session, event_id: int) -> Optional[EventSummary]:
-    """Get the summary for an event."""
+def get_event_version(db: Session, event_id: int, meeting_only: bool = False) -> Optional[Row]:
+    """Get just an event's updated_at, to validate cached copies without loading the event."""
+    model = Meeting if meeting_only else Event
+    return db.query(model.updated_at).filter(model.id == event_id).first()
+
+
+def _transcript_bytes(db: Session):
+    """A meeting's transcript as UTF-8 bytes, as a SQL expression."""
+    if db.get_bind().dialect.name == "sqlite":
+        return cast(Meeting.transcript, LargeBinary)
+    return func.convert_to(Meeting.transcript, "UTF8")
+
+
+def get_meeting_transcript_size(db: Session, event_id: int) -> Optional[int]:
+    """Get the size in bytes of a meeting's UTF-8 transcript, or None if it has none."""
+    return (
+        db.query(func.length(_transcript_bytes(db)))
+        .filter(Meeting.id == event_id)
+        .scalar()
+    )
+
+
+def iter_meeting_transcript(
+    db: Session, event_id: int, start: int, end: int, chunk_size: int = 64 * 1024
+) -> Iterator[bytes]:
+    """
+    Read bytes start..end (inclusive) of a meeting's UTF-8 transcript, chunk by chunk.
+
+    Each chunk is cut out with substr in SQL, so the transcript is never
+    held in memory whole.
+    """
+    data = _transcript_bytes(db)
+    for offset in range(start, end + 1, chunk_size):
+        length = min(chunk_size, end + 1 - offset)
+        chunk = (
+            db.query(func.substr(data, offset + 1, length))
+            .filter(Meeting.id == event_id)
+            .scalar()
+        )
+        if not chunk:
+            return  # Deleted or shortened since the response started
+        yield bytes(chunk)
+
+
+def get_meeting_for_summary(db: Session, event_id: int) -> Optional[Row]:
+    """Get a meeting's customer_id and transcript, without loading the full event."""
+    return (
+        db.query(Meeting.customer_id, Meeting.transcript)
+        .filter(Meeting.id == event_id)
+        .first()
+    )
+
+
+def _load_event_summary(db: Session, event_id: int) -> Optional[EventSummary]:
     return db.query(EventSummary).filter(EventSummary.event_id == event_id).first()
 
 
+def get_event_summary(db: Session, event_id: int) -> Optional[EventSummary]:
+    """Get the summary for an event, through the read cache."""
+    return read_cache.get_or_load(
+        db, event_summary_key(event_id), lambda: _load_event_summary(db, event_id)
+    )
+
+
+def get_event_summaries(db: Session, event_ids: List[int]) -> Dict[int, EventSummary]:
+    """Get the summaries for many events in a single query, keyed by event ID."""
+    if not event_ids:
+        return {}
+    summaries = db.query(EventSummary).filter(EventSummary.event_id.in_(event_ids)).all()
+    return {summary.event_id: summary for summary in summaries}
+
+
 def get_events_by_customer(
-    db: Session, customer_id: int, skip: int = 0, limit: int = 100
-) -> List[Event]:
-    """Get all events for a customer, ordered by timestamp descending."""
-    return (
-        db.query(Event)
+    db: Session, customer_id: int, cursor: Optional[str] = None, limit: int = 100
+) -> Tuple[List[Row], Optional[str]]:
+    """
+    Get lightweight list rows for a customer's events, newest first, using keyset pagination.
+
+    Only the columns the timeline needs are selected; full transcripts are
+    never loaded, just a short transcript_preview. Events are ordered by
+    (timestamp, id) descending so that pages stay stable when several
+    events share a timestamp.
+
+    Returns:
+        Tuple of (event rows, cursor for the next page or None on the last page)
+
+    Raises:
+        ValueError: If the cursor is invalid
+    """
+    meetings = Meeting.__table__
+    query = (
+        db.query(
+            Event.id,
+            Event.customer_id,
+            Event.event_type,
+            Event.timestamp,
+            Event.participants,
+            Event.created_at,
+            Event.updated_at,
+            meetings.c.location,
+            func.substr(meetings.c.transcript, 1, TRANSCRIPT_PREVIEW_LENGTH).label(
+                "transcript_preview"
+            ),
+        )
+        .outerjoin(meetings, meetings.c.id == Event.id)
         .filter(Event.customer_id == customer_id)
-        .order_by(Event.timestamp.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
     )
+    if cursor:
+        last_timestamp, last_id = decode_cursor(cursor, datetime, int)
+        query = query.filter(
+            or_(
+                Event.timestamp < last_timestamp,
+                and_(Event.timestamp == last_timestamp, Event.id < last_id),
+            )
+        )
+
+    # Fetch one extra row to learn whether another page exists
+    events = (
+        query.order_by(Event.timestamp.desc(), Event.id.desc()).limit(limit + 1).all()
+    )
+    if len(events) <= limit:
+        return events, None
+    events = events[:limit]
+    return events, encode_cursor(events[-1].timestamp, events[-1].id)
 
 
 def create_meeting(db: Session, meeting: MeetingCreate) -> Meeting:
-    """Create a new meeting event and generate summary."""
-    # Extract participants from transcript if available
-    participants = meeting.participants
-    if meeting.transcript and not participants:
-        try:
-            participants = llm_service.extract_participants(meeting.transcript)
-        except Exception as e:
-            logger.error(f"Error extracting participants: {e}", exc_info=True)
-            participants = None
-
-    # Create meeting with extracted or provided participants
-    meeting_data = meeting.model_dump()
-    meeting_data['participants'] = participants
-    db_meeting = Meeting(**meeting_data)
+    """Create a new meeting event and queue its summary for background generation."""
+    db_meeting = Meeting(**meeting.model_dump())
     db.add(db_meeting)
+    db.flush()
+
+    # Participant extraction and summarization run in the summary worker
+    if db_meeting.transcript:
+        summary_queue.enqueue_summary_job(db, db_meeting.id, commit=False)
+    search_service.index_event(db, db_meeting.id)
+    health_service.record_meeting(db, db_meeting.customer_id, db_meeting.timestamp)
+
     db.commit()
     db.refresh(db_meeting)
+    return db_meeting
 
-    # Generate summary if transcript exists
-    if db_meeting.transcript:
-        try:
-            summary_data = llm_service.summarize_meeting(
-                db_meeting.transcript, meeting_id=db_meeting.id
-            )
 
-            # Save summary to database
-            db_summary = EventSummary(
-                event_id=db_meeting.id, summary_json=summary_data
-            )
-            db.add(db_summary)
-            db.commit()
-        except Exception as e:
-            logger.error(f"Error generating summary: {e}", exc_info=True)
+def create_meetings_bulk(
+    db: Session, meetings: List[MeetingCreate]
+) -> Tuple[str, List[Meeting]]:
+    """
+    Create many meetings in one transaction and queue their summaries as a batch.
 
-    return db_meeting
+    Returns:
+        Tuple of (batch ID, created meetings in input order)
+    """
+    batch_id = uuid.uuid4().hex
+    db_meetings = [Meeting(**meeting.model_dump()) for meeting in meetings]
+    db.add_all(db_meetings)
+    db.flush()
+
+    summary_queue.enqueue_summary_jobs(
+        db, [m.id for m in db_meetings if m.transcript], batch_id=batch_id
+    )
+    last_meeting_at: Dict[int, datetime] = {}
+    for db_meeting in db_meetings:
+        search_service.index_event(db, db_meeting.id)
+        latest = last_meeting_at.get(db_meeting.customer_id)
+        if latest is None or db_meeting.timestamp > latest:
+            last_meeting_at[db_meeting.customer_id] = db_meeting.timestamp
+    for customer_id, timestamp in last_meeting_at.items():
+        health_service.record_meeting(db, customer_id, timestamp)
+
+    db.commit()
+    return batch_id, db_meetings
+
+
+def save_event_summary(
+    db: Session,
+    event_id: int,
+    summary_data: dict,
+    commit: bool = True,
+    prompt_version: Optional[str] = None,
+) -> EventSummary:
+    """
+    Create or replace the summary for an event.
+
+    Sentiment and TL;DR are projected into indexed columns, action items
+    into the action_items table, and the customer's health rollup is
+    updated, all in the same transaction. The cached summary is dropped
+    once that transaction commits. prompt_version records which prompt
+    templates produced the summary.
+    """
+    db_summary = _load_event_summary(db, event_id)
+    old_sentiment = db_summary.sentiment if db_summary else None
+    if db_summary is None:
+        db_summary = EventSummary(event_id=event_id)
+        db.add(db_summary)
+    db_summary.summary_json = summary_data
+    db_summary.sentiment = health_service.summary_sentiment(summary_data)
+    tldr = summary_data.get("tldr")
+    db_summary.tldr = str(tldr) if tldr is not None else None
+    db_summary.schema_version = SUMMARY_SCHEMA_VERSION
+    db_summary.prompt_version = prompt_version
+    db.flush()
+    search_service.index_event(db, event_id)
+
+    event = db.query(Event.customer_id, Event.timestamp).filter(Event.id == event_id).one()
+    open_delta = action_item_service.replace_action_items(
+        db, event_id, event.customer_id, summary_data
+    )
+    health_service.apply_summary_change(
+        db, event.customer_id, event_id, event.timestamp, old_sentiment, db_summary.sentiment
+    )
+    health_service.adjust_open_action_items(db, event.customer_id, open_delta)
+    read_cache.invalidate_on_commit(db, event_summary_key(event_id))
+
+    if commit:
+        db.commit()
+        db.refresh(db_summary)
+    return db_summary
 
 
 def update_meeting(
@@ -83,6 +258,13 @@ def update_meeting(
     update_data = meeting.model_dump(exclude_unset=True)
     for key, value in update_data.items():
         setattr(db_meeting, key, value)
+    # onupdate only fires when the events row itself changes, not just the meetings row
+    db_meeting.updated_at = datetime.now()
+    db.flush()
+    search_service.index_event(db, meeting_id)
+    if "timestamp" in update_data:
+        # Moving a meeting in time can change the customer's latest sentiment and trend
+        health_service.rebuild_customer_health(db, [db_meeting.customer_id], commit=False)
 
     db.commit()
     db.refresh(db_meeting)
@@ -95,43 +277,102 @@ def delete_event(db: Session, event_id: int) -> bool:
     if db_event is None:
         return False
 
+    customer_id, timestamp = db_event.customer_id, db_event.timestamp
+    # Children are deleted explicitly, since SQLite doesn't enforce ON DELETE CASCADE
+    db_summary = _load_event_summary(db, event_id)
+    if db_summary:
+        db.delete(db_summary)
+        read_cache.invalidate_on_commit(db, event_summary_key(event_id))
+    open_delta = action_item_service.remove_action_items(db, event_id)
+    summary_queue.remove_summary_job(db, event_id)
     db.delete(db_event)
+    search_service.remove_event(db, event_id)
+    db.flush()
+
+    if db_summary:
+        health_service.apply_summary_change(
+            db, customer_id, event_id, timestamp, db_summary.sentiment, None
+        )
+    health_service.adjust_open_action_items(db, customer_id, open_delta)
+    health_service.remove_meeting(db, customer_id, timestamp)
     db.commit()
     return True
 
 
-def regenerate_event_summary(db: Session, event_id: int) -> Optional[dict]:
-    """Regenerate the summary for an event."""
-    db_event = get_event(db, event_id)
-    if db_event is None:
-        return None
+async def regenerate_event_summary(
+    db: Session, event_id: int, force: bool = False, llm: Optional[LLMService] = None
+) -> Optional[dict]:
+    """
+    Regenerate the summary for an event.
+
+    Identical transcripts are served from the LLM response cache unless
+    force is set, which always makes a fresh LLM call. llm defaults to the
+    shared LLM service.
 
-    # Check if event has a transcript (only meetings have transcripts)
-    if not hasattr(db_event, 'transcript') or not db_event.transcript:
+    Database access runs in a worker thread so the event loop stays free
+    while the LLM call is in flight.
+    """
+    # Only meetings have transcripts; a missing event also yields None
+    meeting = await asyncio.to_thread(get_meeting_for_summary, db, event_id)
+    if meeting is None or not meeting.transcript:
         return None
 
+    llm = llm or get_llm_service()
     try:
-        # Generate new summary
-        summary_data = llm_service.summarize_meeting(
-            db_event.transcript, meeting_id=db_event.id
-        )
-
-        # Check if summary already exists
-        existing_summary = get_event_summary(db, event_id)
-        if existing_summary:
-            # Update existing summary
-            existing_summary.summary_json = summary_data
-            db.commit()
-            db.refresh(existing_summary)
-        else:
-            # Create new summary
-            db_summary = EventSummary(
-                event_id=db_event.id, summary_json=summary_data
+        # Generate new summary; someone is waiting, so it goes ahead of background jobs
+        prompt_version = llm.summary_prompt_version()
+        with llm_priority(PRIORITY_INTERACTIVE):
+            summary_data = await llm.asummarize_meeting(
+                meeting.transcript,
+                meeting_id=event_id,
+                use_cache=not force,
+                customer_id=meeting.customer_id,
             )
-            db.add(db_summary)
-            db.commit()
 
+        await asyncio.to_thread(
+            save_event_summary, db, event_id, summary_data, prompt_version=prompt_version
+        )
         return summary_data
     except Exception as e:
         logger.error(f"Error regenerating summary: {e}", exc_info=True)
         raise
+
+
+async def regenerate_event_summary_stream(
+    db: Session, event_id: int, force: bool = False, llm: Optional[LLMService] = None
+) -> Optional[AsyncIterator[Tuple[str, dict]]]:
+    """
+    Regenerate the summary for an event, streaming it as it is written.
+
+    Returns None if the event has no transcript, otherwise an async iterator
+    of (event, data) pairs: progress and partial events as the LLM writes
+    (see LLMService.astream_summarize_meeting), then a summary event with
+    the complete summary once it has been saved. A stream abandoned before
+    the end saves nothing.
+    """
+    meeting = await asyncio.to_thread(get_meeting_for_summary, db, event_id)
+    if meeting is None or not meeting.transcript:
+        return None
+    return _stream_regenerated_summary(db, event_id, meeting, force, llm or get_llm_service())
+
+
+async def _stream_regenerated_summary(
+    db: Session, event_id: int, meeting: Row, force: bool, llm: LLMService
+) -> AsyncIterator[Tuple[str, dict]]:
+    prompt_version = llm.summary_prompt_version()
+    try:
+        async for event, data in llm.astream_summarize_meeting(
+            meeting.transcript,
+            meeting_id=event_id,
+            use_cache=not force,
+            customer_id=meeting.customer_id,
+            priority=PRIORITY_INTERACTIVE,
+        ):
+            if event == "summary":
+                await asyncio.to_thread(
+                    save_event_summary, db, event_id, data, prompt_version=prompt_version
+                )
+            yield event, data
+    except Exception as e:
+        logger.error(f"Error regenerating summary: {e}", exc_info=True)
+        raise
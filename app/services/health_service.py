@@ -0,0 +1,293 @@
+from datetime import datetime, timedelta
+from sqlalchemy import Row, func
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from typing import Dict, List, Optional, Tuple
+
+from app.config import settings
+from app.models.action_item import ActionItem, ACTION_ITEM_OPEN
+from app.models.customer import Customer
+from app.models.customer_health import CustomerHealth
+from app.models.event import Event
+from app.models.event_summary import EventSummary
+from app.services.pagination import decode_cursor, encode_cursor
+
+# Sentiment flags produced by the summary prompt, scored for the trend
+SENTIMENT_SCORES = {"green": 1.0, "amber": 0.0, "red": -1.0}
+
+# Columns GET /api/customers/health can sort by
+HEALTH_SORT_FIELDS = {
+    "last_meeting_at",
+    "latest_summary_at",
+    "trend_score",
+    "red_count",
+    "amber_count",
+    "green_count",
+    "open_action_items",
+}
+
+
+def summary_sentiment(summary_json: Optional[dict]) -> Optional[str]:
+    """The normalized sentiment flag of a summary, or None if missing or unrecognized."""
+    if not summary_json:
+        return None
+    sentiment = str(summary_json.get("sentiment") or "").strip().lower()
+    return sentiment if sentiment in SENTIMENT_SCORES else None
+
+
+def _dialect(db: Session) -> str:
+    return db.get_bind().dialect.name
+
+
+def _trend_cutoff() -> str:
+    return (datetime.now() - timedelta(days=settings.customer_health_trend_days)).isoformat()
+
+
+def _trend_score(recent: List[list]) -> Optional[float]:
+    if not recent:
+        return None
+    return round(sum(SENTIMENT_SCORES[sentiment] for _, _, sentiment in recent) / len(recent), 4)
+
+
+def _set_trend(health: CustomerHealth, recent: List[list]) -> None:
+    """Store the window's sentiments (oldest first) and what derives from them."""
+    health.recent_sentiments = recent
+    health.trend_score = _trend_score(recent)
+    health.trend_oldest_at = datetime.fromisoformat(recent[0][0]) if recent else None
+
+
+def _health_row(db: Session, customer_id: int) -> CustomerHealth:
+    """Get a customer's health row for update, creating it if needed."""
+    insert = sqlite_insert if _dialect(db) == "sqlite" else postgresql_insert
+    db.execute(
+        insert(CustomerHealth).values(customer_id=customer_id).on_conflict_do_nothing()
+    )
+    return (
+        db.query(CustomerHealth)
+        .filter(CustomerHealth.customer_id == customer_id)
+        .with_for_update()
+        .one()
+    )
+
+
+def _refresh_latest(db: Session, health: CustomerHealth) -> None:
+    """Find the customer's most recent meeting with a sentiment."""
+    row = (
+        db.query(Event.id, Event.timestamp, EventSummary.sentiment)
+        .join(EventSummary, EventSummary.event_id == Event.id)
+        .filter(Event.customer_id == health.customer_id, EventSummary.sentiment.isnot(None))
+        .order_by(Event.timestamp.desc(), Event.id.desc())
+        .first()
+    )
+    if row is None:
+        health.latest_sentiment = health.latest_event_id = health.latest_summary_at = None
+    else:
+        health.latest_sentiment, health.latest_event_id, health.latest_summary_at = (
+            row.sentiment, row.id, row.timestamp
+        )
+
+
+def record_meeting(db: Session, customer_id: int, timestamp: datetime) -> None:
+    """Account for a new meeting. Joins the caller's transaction."""
+    health = _health_row(db, customer_id)
+    if health.last_meeting_at is None or timestamp > health.last_meeting_at:
+        health.last_meeting_at = timestamp
+
+
+def remove_meeting(db: Session, customer_id: int, timestamp: datetime) -> None:
+    """Account for a deleted meeting (after it has been flushed). Joins the caller's transaction."""
+    health = _health_row(db, customer_id)
+    if health.last_meeting_at is None or timestamp >= health.last_meeting_at:
+        health.last_meeting_at = (
+            db.query(func.max(Event.timestamp)).filter(Event.customer_id == customer_id).scalar()
+        )
+
+
+def adjust_open_action_items(db: Session, customer_id: int, delta: int) -> None:
+    """Account for action items being opened (+) or closed/deleted (-). Joins the caller's transaction."""
+    if delta:
+        health = _health_row(db, customer_id)
+        health.open_action_items += delta
+
+
+def apply_summary_change(
+    db: Session,
+    customer_id: int,
+    event_id: int,
+    timestamp: datetime,
+    old_sentiment: Optional[str],
+    new_sentiment: Optional[str],
+) -> None:
+    """
+    Fold one summary's sentiment change into the customer's health row. Joins the caller's transaction.
+
+    Args:
+        timestamp: The meeting's timestamp
+        old_sentiment: Sentiment of the summary being replaced, or None for a new summary
+        new_sentiment: Sentiment of the new summary, or None if it was deleted
+    """
+    health = _health_row(db, customer_id)
+    if old_sentiment:
+        setattr(health, f"{old_sentiment}_count", getattr(health, f"{old_sentiment}_count") - 1)
+    if new_sentiment:
+        setattr(health, f"{new_sentiment}_count", getattr(health, f"{new_sentiment}_count") + 1)
+
+    # Rolling trend: sentiments of meetings inside the window, oldest first
+    cutoff = _trend_cutoff()
+    recent = [
+        entry for entry in health.recent_sentiments or []
+        if entry[1] != event_id and entry[0] >= cutoff
+    ]
+    if new_sentiment and timestamp.isoformat() >= cutoff:
+        recent.append([timestamp.isoformat(), event_id, new_sentiment])
+        recent.sort()
+    _set_trend(health, recent)
+
+    is_latest = health.latest_summary_at is None or (timestamp, event_id) >= (
+        health.latest_summary_at, health.latest_event_id
+    )
+    if new_sentiment and is_latest:
+        health.latest_sentiment = new_sentiment
+        health.latest_event_id = event_id
+        health.latest_summary_at = timestamp
+    elif health.latest_event_id == event_id:
+        # The latest summary was deleted or lost its sentiment
+        _refresh_latest(db, health)
+
+
+def rebuild_customer_health(
+    db: Session, customer_ids: Optional[List[int]] = None, commit: bool = True
+) -> None:
+    """Recompute health rows from events, summaries and action items, for some customers or all of them."""
+    deleted = db.query(CustomerHealth)
+    rows = (
+        db.query(Event.customer_id, Event.id, Event.timestamp, EventSummary.sentiment)
+        .outerjoin(EventSummary, EventSummary.event_id == Event.id)
+    )
+    open_items = (
+        db.query(ActionItem.customer_id, func.count(ActionItem.id))
+        .filter(ActionItem.status == ACTION_ITEM_OPEN)
+        .group_by(ActionItem.customer_id)
+    )
+    if customer_ids is not None:
+        deleted = deleted.filter(CustomerHealth.customer_id.in_(customer_ids))
+        rows = rows.filter(Event.customer_id.in_(customer_ids))
+        open_items = open_items.filter(ActionItem.customer_id.in_(customer_ids))
+    deleted.delete(synchronize_session="fetch")
+    open_counts = dict(open_items.all())
+
+    cutoff = _trend_cutoff()
+    healths: Dict[int, dict] = {}
+    ordered = rows.order_by(Event.customer_id, Event.timestamp, Event.id)
+    for row in ordered.yield_per(1000):
+        health = healths.get(row.customer_id)
+        if health is None:
+            health = healths[row.customer_id] = {
+                "customer_id": row.customer_id,
+                "latest_sentiment": None,
+                "latest_event_id": None,
+                "latest_summary_at": None,
+                "green_count": 0,
+                "amber_count": 0,
+                "red_count": 0,
+                "open_action_items": open_counts.get(row.customer_id, 0),
+                "recent_sentiments": [],
+            }
+        # Rows are in timestamp order, so the last one seen is the latest
+        health["last_meeting_at"] = row.timestamp
+        sentiment = row.sentiment
+        if sentiment is None:
+            continue
+        health[f"{sentiment}_count"] += 1
+        health["latest_sentiment"] = sentiment
+        health["latest_event_id"] = row.id
+        health["latest_summary_at"] = row.timestamp
+        if row.timestamp.isoformat() >= cutoff:
+            health["recent_sentiments"].append([row.timestamp.isoformat(), row.id, sentiment])
+
+    for health in healths.values():
+        recent = health["recent_sentiments"]
+        health["trend_score"] = _trend_score(recent)
+        health["trend_oldest_at"] = datetime.fromisoformat(recent[0][0]) if recent else None
+    if healths:
+        db.execute(CustomerHealth.__table__.insert(), list(healths.values()))
+    if commit:
+        db.commit()
+
+
+def age_customer_trends(db: Session, batch_size: int = 500) -> int:
+    """
+    Drop meetings that have fallen out of the trend window from every health row.
+
+    Trends are otherwise only recomputed when one of the customer's summaries
+    changes, so a customer without new meetings would keep an old trend
+    forever. Run periodically (the summary worker pool does); only rows whose
+    oldest windowed meeting is past the cutoff are touched.
+
+    Returns:
+        Number of health rows updated
+    """
+    cutoff = _trend_cutoff()
+    aged = 0
+    while True:
+        healths = (
+            db.query(CustomerHealth)
+            .filter(CustomerHealth.trend_oldest_at < datetime.fromisoformat(cutoff))
+            .order_by(CustomerHealth.customer_id)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+        for health in healths:
+            _set_trend(health, [entry for entry in health.recent_sentiments if entry[0] >= cutoff])
+        db.commit()
+        aged += len(healths)
+        if len(healths) < batch_size:
+            return aged
+
+
+def list_customer_health(
+    db: Session,
+    sentiment: Optional[str] = None,
+    sort: str = "-last_meeting_at",
+    cursor: Optional[str] = None,
+    limit: int = 100,
+) -> Tuple[List[Row], Optional[str]]:
+    """
+    List customer health rows with the customer's name, filtered by latest sentiment.
+
+    Args:
+        sort: A column in HEALTH_SORT_FIELDS, prefixed with - for descending order
+
+    Returns:
+        Tuple of (rows of (CustomerHealth, organization_name), cursor for the next page or None)
+
+    Raises:
+        ValueError: If the sort field, sentiment or cursor is invalid
+    """
+    field = sort.lstrip("-")
+    if field not in HEALTH_SORT_FIELDS:
+        raise ValueError(f"Unsupported sort: {sort}")
+    column = getattr(CustomerHealth, field)
+    order = column.desc() if sort.startswith("-") else column.asc()
+
+    query = db.query(CustomerHealth, Customer.organization_name).join(
+        Customer, Customer.id == CustomerHealth.customer_id
+    )
+    if sentiment is not None:
+        if sentiment not in SENTIMENT_SCORES:
+            raise ValueError(f"Unsupported sentiment: {sentiment}")
+        query = query.filter(CustomerHealth.latest_sentiment == sentiment)
+
+    # Arbitrary sort keys (with NULLs) are paged by offset, encoded in the opaque cursor
+    offset = decode_cursor(cursor, int)[0] if cursor else 0
+    rows = (
+        query.order_by(order.nullslast(), CustomerHealth.customer_id)
+        .offset(offset)
+        .limit(limit + 1)
+        .all()
+    )
+    if len(rows) <= limit:
+        return rows, None
+    return rows[:limit], encode_cursor(offset + limit)
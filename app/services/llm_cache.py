@@ -0,0 +1,201 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+# llm-cache.db at the project root, independent of the working directory
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parents[2] / "llm-cache.db"
+
+# Stored size of a response in bytes (length() of TEXT counts characters)
+RESPONSE_BYTES = "length(CAST(response AS BLOB))"
+
+
+class LLMResponseCache:
+    """
+    Persistent, content-addressed cache of raw LLM responses.
+
+    Entries live in a small SQLite file keyed on a hash of everything that
+    determines the model output. Entries expire after a TTL and the least
+    recently used ones are evicted once the cache holds more than
+    max_entries entries or max_bytes bytes of responses. Reads don't write:
+    access times are kept in memory and saved in batches (and before any
+    eviction), so cache hits never wait on a commit.
+    """
+
+    TOUCH_BATCH = 500  # Access times buffered before they are written out
+
+    def __init__(
+        self,
+        path: Union[str, Path] = DEFAULT_CACHE_PATH,
+        max_entries: int = 10000,
+        ttl_seconds: int = 0,
+        max_bytes: int = 0,
+    ):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes  # 0 disables the byte cap
+        self.ttl_seconds = ttl_seconds  # 0 disables expiry
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._entries = 0
+        self._bytes = 0
+        self._touched: Dict[str, float] = {}
+
+    @staticmethod
+    def make_key(prompt_version: str, prompt: str, model: str, temperature: float) -> str:
+        """Build the cache key for a fully formatted prompt."""
+        payload = json.dumps([prompt_version, prompt, model, temperature])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        # Opened lazily so importing the service never touches the disk
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    key TEXT PRIMARY KEY,
+                    response TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_accessed REAL NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_llm_cache_last_accessed ON llm_cache (last_accessed)"
+            )
+            self._entries, self._bytes = conn.execute(
+                f"SELECT COUNT(*), COALESCE(SUM({RESPONSE_BYTES}), 0) FROM llm_cache"
+            ).fetchone()
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for a key, or None on a miss."""
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                f"SELECT response, created_at, {RESPONSE_BYTES} FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and self.ttl_seconds and now - row[1] > self.ttl_seconds:
+                conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                conn.commit()
+                self._touched.pop(key, None)
+                self._entries -= 1
+                self._bytes -= row[2]
+                self.evictions += 1
+                row = None
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            self._touched[key] = now
+            if len(self._touched) >= self.TOUCH_BATCH:
+                self._save_touches(conn)
+                conn.commit()
+            self.hits += 1
+            return row[0]
+
+    def _save_touches(self, conn: sqlite3.Connection) -> None:
+        if self._touched:
+            conn.executemany(
+                "UPDATE llm_cache SET last_accessed = ? WHERE key = ?",
+                [(accessed, key) for key, accessed in self._touched.items()],
+            )
+            self._touched.clear()
+
+    def set(self, key: str, response: str) -> None:
+        """Store a response, evicting least recently used entries over the caps."""
+        size = len(response.encode("utf-8"))
+        if self.max_bytes and size > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            # Eviction goes by access time, so it has to see the buffered ones
+            self._save_touches(conn)
+            old = conn.execute(f"SELECT {RESPONSE_BYTES} FROM llm_cache WHERE key = ?", (key,)).fetchone()
+            if old is not None:
+                conn.execute(
+                    "UPDATE llm_cache SET response = ?, created_at = ?, last_accessed = ? WHERE key = ?",
+                    (response, now, now, key),
+                )
+                self._bytes += size - old[0]
+            else:
+                conn.execute(
+                    "INSERT INTO llm_cache (key, response, created_at, last_accessed) VALUES (?, ?, ?, ?)",
+                    (key, response, now, now),
+                )
+                self._entries += 1
+                self._bytes += size
+            self.writes += 1
+            self._evict(conn)
+            conn.commit()
+
+    def _over_cap(self) -> bool:
+        return self._entries > self.max_entries or bool(self.max_bytes and self._bytes > self.max_bytes)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Delete least recently used entries until both caps hold."""
+        while self._over_cap():
+            victims = []
+            for key, size in conn.execute(
+                f"SELECT key, {RESPONSE_BYTES} FROM llm_cache ORDER BY last_accessed ASC LIMIT 100"
+            ):
+                if not self._over_cap():
+                    break
+                victims.append((key,))
+                self._entries -= 1
+                self._bytes -= size
+            if not victims:
+                break
+            conn.executemany("DELETE FROM llm_cache WHERE key = ?", victims)
+            self.evictions += len(victims)
+
+    def delete(self, key: str) -> None:
+        """Remove a single entry."""
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(f"SELECT {RESPONSE_BYTES} FROM llm_cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return
+            conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+            conn.commit()
+            self._touched.pop(key, None)
+            self._entries -= 1
+            self._bytes -= row[0]
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM llm_cache")
+            conn.commit()
+            self._touched.clear()
+            self._entries = 0
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        """Hit/miss counters for monitoring."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "entries": self._entries,
+            "max_entries": self.max_entries,
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes or None,
+        }
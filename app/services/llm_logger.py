@@ -1,21 +1,66 @@
-import os
+import atexit
+import gzip
 import json
+import logging
+import queue
+import random
+import shutil
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
+from typing import List, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_PREFIX = "llm-calls-"
 
 
 class LLMLogger:
-    """Simple logger for LLM calls and responses."""
+    """
+    Buffered logger for LLM calls and responses.
 
-    def __init__(self, log_dir: str = "llm-logs"):
-        self.log_dir = Path(log_dir)
-        self.log_dir.mkdir(exist_ok=True)
+    log_call only samples the call and enqueues a record. A background
+    writer thread appends the records as JSON Lines to a segment file, which
+    is rotated by size or age, optionally gzipped, and pruned down to the
+    retention limit. Call flush() or close() to make sure every enqueued
+    record has been written; close() also runs at interpreter exit.
+    """
+
+    def __init__(
+        self,
+        log_dir: Optional[str] = None,
+        sample_rate: Optional[float] = None,
+        max_segment_bytes: Optional[int] = None,
+        rotate_seconds: Optional[float] = None,
+        compress: Optional[bool] = None,
+        retention_segments: Optional[int] = None,
+        queue_size: Optional[int] = None,
+    ):
+        self.log_dir = Path(log_dir or settings.llm_log_dir)
+        self.sample_rate = settings.llm_log_sample_rate if sample_rate is None else sample_rate
+        self.max_segment_bytes = max_segment_bytes or settings.llm_log_max_segment_bytes
+        self.rotate_seconds = rotate_seconds or settings.llm_log_rotate_seconds
+        self.compress = settings.llm_log_compress if compress is None else compress
+        self.retention_segments = retention_segments or settings.llm_log_retention_segments
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size or settings.llm_log_queue_size)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._segment = None
+        self._segment_path: Optional[Path] = None
+        self._segment_opened = 0.0
+        self._segment_bytes = 0
+        self.written = 0
+        self.dropped = 0
+        self.sampled_out = 0
 
     def log_call(
         self, prompt: str, response: str, model: str = "gpt-4o-mini", metadata: dict = None
-    ) -> str:
+    ) -> bool:
         """
-        Log an LLM call and response to a text file.
+        Queue an LLM call and response for logging.
 
         Args:
             prompt: The prompt sent to the LLM
@@ -24,41 +69,147 @@ class LLMLogger:
             metadata: Additional metadata to log
 
         Returns:
-            The filename of the log file
+            Whether the record was queued (False if sampled out or the queue is full)
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-        filename = f"{timestamp}_{model}.txt"
-        filepath = self.log_dir / filename
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            self.sampled_out += 1
+            return False
+
+        record = {
+            "timestamp": datetime.now().isoformat(),
+            "model": model,
+            "metadata": metadata or {},
+            "prompt": prompt,
+            "response": response,
+        }
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            # Never block the caller on logging
+            self.dropped += 1
+            return False
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Block until every queued record has been written to disk."""
+        if self._thread is None:
+            return
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    logger.warning(f"LLM log flush timed out with {self._queue.unfinished_tasks} records pending")
+                    return
+                self._queue.all_tasks_done.wait(remaining)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Write out every queued record, stop the writer thread and seal the current segment."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        self._queue.put(None)
+        thread.join(timeout)
+        self._close_segment()
+
+    def stats(self) -> dict:
+        """Counters for written, dropped and sampled-out records."""
+        return {
+            "written": self.written,
+            "queued": self._queue.qsize(),
+            "dropped": self.dropped,
+            "sampled_out": self.sampled_out,
+            "sample_rate": self.sample_rate,
+        }
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="llm-log-writer", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            try:
+                # Wake up periodically so idle segments still rotate on time
+                record = self._queue.get(timeout=1.0)
+            except queue.Empty:
+                self._rotate_if_due()
+                continue
 
-        log_content = f"""{'='*80}
-LLM CALL LOG
-{'='*80}
-Timestamp: {datetime.now().isoformat()}
-Model: {model}
-"""
+            batch = [record]
+            while len(batch) < 1000:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
 
-        if metadata:
-            log_content += f"\nMetadata:\n{json.dumps(metadata, indent=2)}\n"
+            stop = None in batch
+            try:
+                self._write([r for r in batch if r is not None])
+            except Exception as e:
+                logger.error(f"Error writing LLM call log: {e}", exc_info=True)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if stop:
+                return
 
-        log_content += f"""
-{'='*80}
-PROMPT
-{'='*80}
-{prompt}
+    def _write(self, records: List[dict]) -> None:
+        if not records:
+            return
+        self._rotate_if_due()
+        if self._segment is None:
+            self._open_segment()
+        data = "".join(
+            json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+            for record in records
+        )
+        self._segment.write(data)
+        self._segment.flush()
+        self._segment_bytes += len(data.encode("utf-8"))
+        self.written += len(records)
 
-{'='*80}
-RESPONSE
-{'='*80}
-{response}
+    def _open_segment(self) -> None:
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        name = f"{SEGMENT_PREFIX}{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.jsonl"
+        self._segment_path = self.log_dir / name
+        self._segment = open(self._segment_path, "a", encoding="utf-8")
+        self._segment_opened = time.monotonic()
+        self._segment_bytes = 0
 
-{'='*80}
-"""
+    def _rotate_if_due(self) -> None:
+        if self._segment is None:
+            return
+        too_big = self._segment_bytes >= self.max_segment_bytes
+        too_old = time.monotonic() - self._segment_opened >= self.rotate_seconds
+        if too_big or too_old:
+            self._close_segment()
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(log_content)
+    def _close_segment(self) -> None:
+        """Close the current segment, compress it if configured, and apply retention."""
+        if self._segment is None:
+            return
+        self._segment.close()
+        path, self._segment, self._segment_path = self._segment_path, None, None
+        if self.compress:
+            with open(path, "rb") as src, gzip.open(f"{path}.gz", "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            path.unlink()
+        self._prune()
 
-        return str(filename)
+    def _prune(self) -> None:
+        segments = sorted(self.log_dir.glob(f"{SEGMENT_PREFIX}*.jsonl*"))
+        for old in segments[:-self.retention_segments]:
+            old.unlink(missing_ok=True)
 
 
 # Global logger instance
 llm_logger = LLMLogger()
+atexit.register(llm_logger.close)
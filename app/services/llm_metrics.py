@@ -0,0 +1,300 @@
+import atexit
+import bisect
+import logging
+import threading
+from collections import defaultdict
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import case, func
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.llm_call import LLMCall
+
+logger = logging.getLogger(__name__)
+
+# Histogram bucket upper bounds; the last bucket is open-ended
+LATENCY_BUCKETS_MS = [50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000]
+TOKEN_BUCKETS = [100, 250, 500, 1000, 2000, 4000, 8000, 16000, 32000]
+
+
+class Histogram:
+    """Fixed-bucket histogram with count and sum, cheap enough to update per call."""
+
+    def __init__(self, bounds: List[float]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the q-th quantile (None past the last bound)."""
+        if not self.count:
+            return None
+        target = q * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= target:
+                return bound
+        return None
+
+    def to_dict(self) -> dict:
+        labels = [f"le_{bound}" for bound in self.bounds] + ["inf"]
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 3),
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+class UsageStats:
+    """Aggregated usage for one breakdown key (an operation, customer, ...)."""
+
+    def __init__(self):
+        self.calls = 0
+        self.cache_hits = 0
+        self.errors = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.cost_usd = 0.0
+        self.unpriced_calls = 0  # Calls to models without a configured price, missing from cost_usd
+        self.latency_ms = Histogram(LATENCY_BUCKETS_MS)
+        self.tokens = Histogram(TOKEN_BUCKETS)
+
+    def add(self, call: dict) -> None:
+        self.calls += 1
+        self.cache_hits += call["cache_hit"]
+        self.errors += call["error"] is not None
+        self.prompt_tokens += call["prompt_tokens"]
+        self.completion_tokens += call["completion_tokens"]
+        if call["cost_usd"] is None:
+            self.unpriced_calls += 1
+        else:
+            self.cost_usd += call["cost_usd"]
+        self.latency_ms.observe(call["latency_ms"])
+        if not call["cache_hit"]:
+            self.tokens.observe(call["prompt_tokens"] + call["completion_tokens"])
+
+    def to_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "cache_hits": self.cache_hits,
+            "errors": self.errors,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "cost_usd": round(self.cost_usd, 6),
+            "unpriced_calls": self.unpriced_calls,
+            "latency_ms": self.latency_ms.to_dict(),
+            "tokens_per_call": self.tokens.to_dict(),
+        }
+
+
+def estimate_cost(
+    provider: Optional[str], model: str, prompt_tokens: int, completion_tokens: int
+) -> Optional[float]:
+    """
+    Estimated USD cost of a call at the model's configured per-1k-token prices.
+
+    Returns None for a model without a price rather than guessing; calls
+    that used no tokens (cache hits, failures) cost nothing either way.
+    """
+    if not prompt_tokens and not completion_tokens:
+        return 0.0
+    prices = settings.llm_prices_per_1k_tokens.get(f"{provider}/{model}")
+    if prices is None:
+        return None
+    prompt_price, completion_price = prices
+    return (prompt_tokens * prompt_price + completion_tokens * completion_price) / 1000
+
+
+class LLMMetrics:
+    """
+    Per-call LLM usage accounting.
+
+    Calls are aggregated in memory (totals plus per-operation, per-customer,
+    per-model and per-prompt-version breakdowns) for cheap reads, and
+    buffered for persistence to the llm_calls table by a background thread,
+    so recording a call never touches the database on the caller's thread.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        flush_interval: Optional[float] = None,
+        flush_batch_size: int = 500,
+        max_buffer: int = 50000,
+    ):
+        self.session_factory = session_factory
+        self.flush_interval = flush_interval or settings.llm_metrics_flush_seconds
+        self.flush_batch_size = flush_batch_size
+        self.max_buffer = max_buffer
+        self.started_at = datetime.now()
+        self._lock = threading.Lock()
+        self._buffer: List[dict] = []
+        self._wakeup = threading.Event()
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+        self.persisted = 0
+        self.dropped = 0
+        self._reset_aggregates()
+
+    def _reset_aggregates(self) -> None:
+        self.total = UsageStats()
+        self.by_operation: Dict[str, UsageStats] = defaultdict(UsageStats)
+        self.by_customer: Dict[Optional[int], UsageStats] = defaultdict(UsageStats)
+        self.by_model: Dict[str, UsageStats] = defaultdict(UsageStats)
+        self.by_prompt_version: Dict[str, UsageStats] = defaultdict(UsageStats)
+
+    def record(
+        self,
+        operation: str,
+        model: str,
+        latency_ms: float,
+        provider: Optional[str] = None,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+        cache_hit: bool = False,
+        prompt_version: Optional[str] = None,
+        customer_id: Optional[int] = None,
+        event_id: Optional[int] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        """Record one LLM call (or cache hit) in the aggregates and the persistence buffer."""
+        call = {
+            "created_at": datetime.now(),
+            "operation": operation,
+            "model": model,
+            "prompt_version": prompt_version,
+            "customer_id": customer_id,
+            "event_id": event_id,
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "cost_usd": estimate_cost(provider, model, prompt_tokens, completion_tokens),
+            "latency_ms": latency_ms,
+            "cache_hit": cache_hit,
+            "error": error,
+        }
+        with self._lock:
+            self.total.add(call)
+            self.by_operation[operation].add(call)
+            self.by_customer[customer_id].add(call)
+            self.by_model[model].add(call)
+            self.by_prompt_version[prompt_version or "unknown"].add(call)
+
+            if len(self._buffer) >= self.max_buffer:
+                self.dropped += 1
+            else:
+                self._buffer.append(call)
+            flush_now = len(self._buffer) >= self.flush_batch_size
+
+        self._ensure_started()
+        if flush_now:
+            self._wakeup.set()
+
+    def snapshot(self) -> dict:
+        """In-memory usage since startup, with breakdowns."""
+        with self._lock:
+            return {
+                "since": self.started_at.isoformat(),
+                "total": self.total.to_dict(),
+                "by_operation": {k: v.to_dict() for k, v in self.by_operation.items()},
+                "by_customer": {
+                    str(k) if k is not None else "none": v.to_dict()
+                    for k, v in self.by_customer.items()
+                },
+                "by_model": {k: v.to_dict() for k, v in self.by_model.items()},
+                "by_prompt_version": {k: v.to_dict() for k, v in self.by_prompt_version.items()},
+                "persistence": {
+                    "persisted": self.persisted,
+                    "buffered": len(self._buffer),
+                    "dropped": self.dropped,
+                },
+            }
+
+    def flush(self) -> None:
+        """Persist buffered calls to the llm_calls table."""
+        with self._lock:
+            calls, self._buffer = self._buffer, []
+        if not calls:
+            return
+        db = self.session_factory()
+        try:
+            db.execute(LLMCall.__table__.insert(), calls)
+            db.commit()
+            self.persisted += len(calls)
+        except Exception as e:
+            db.rollback()
+            self.dropped += len(calls)
+            logger.error(f"Error persisting {len(calls)} LLM call records: {e}", exc_info=True)
+        finally:
+            db.close()
+
+    def close(self) -> None:
+        """Stop the flush thread and persist anything still buffered."""
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stopping = True
+            self._wakeup.set()
+            thread.join()
+            self._stopping = False
+        self.flush()
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="llm-metrics-flush", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stopping:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+
+def usage_since(db: Session, since: datetime, group_by: str = "operation") -> List[dict]:
+    """
+    Aggregate persisted LLM usage since a point in time.
+
+    Args:
+        group_by: Column to break usage down by (operation, customer_id, model or prompt_version)
+    """
+    column = getattr(LLMCall, group_by)
+    rows = (
+        db.query(
+            column.label("key"),
+            func.count(LLMCall.id).label("calls"),
+            func.sum(case((LLMCall.cache_hit, 1), else_=0)).label("cache_hits"),
+            func.sum(case((LLMCall.error.isnot(None), 1), else_=0)).label("errors"),
+            func.sum(LLMCall.prompt_tokens).label("prompt_tokens"),
+            func.sum(LLMCall.completion_tokens).label("completion_tokens"),
+            func.sum(LLMCall.cost_usd).label("cost_usd"),
+            func.avg(LLMCall.latency_ms).label("avg_latency_ms"),
+            func.max(LLMCall.latency_ms).label("max_latency_ms"),
+        )
+        .filter(LLMCall.created_at >= since)
+        .group_by(column)
+        .order_by(func.sum(LLMCall.cost_usd).desc())
+        .all()
+    )
+    return [dict(row._mapping) for row in rows]
+
+
+# Global LLM usage tracker
+llm_metrics = LLMMetrics()
+atexit.register(llm_metrics.close)
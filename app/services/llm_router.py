@@ -0,0 +1,537 @@
+"""
+Routing of LLM calls across providers, with hedging, fallback and circuit breakers.
+
+Providers are tried in order of preference. On the async path, when the
+provider in flight hasn't answered within the hedge delay, the next one is
+started as well and the first valid answer wins; the losers are cancelled.
+A provider that errors, times out or answers with something invalid is
+replaced by the next one straight away. Each provider has a circuit
+breaker, so one that keeps failing is skipped until a trial call succeeds.
+Streamed answers fall back the same way until the first chunk arrives, but
+are never hedged.
+"""
+
+import asyncio
+import itertools
+import logging
+import random
+import threading
+import time
+from typing import AsyncIterator, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from app.config import settings
+from app.instrumentation import observe_llm_attempt
+
+logger = logging.getLogger(__name__)
+
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
+
+
+class LLMProviderError(RuntimeError):
+    """No provider produced an answer."""
+
+
+class ChatResponse:
+    """Chat model answer in the shape LLMService reads (content and usage_metadata)."""
+
+    __slots__ = ("content", "usage_metadata")
+
+    def __init__(self, content: str, usage_metadata: Optional[dict] = None):
+        self.content = content
+        self.usage_metadata = usage_metadata
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    After failure_threshold failures in a row the circuit opens and calls
+    are refused. Once reset_seconds have passed, one trial call is let
+    through (half-open): success closes the circuit, failure reopens it.
+    """
+
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self.opens = 0
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return BREAKER_CLOSED
+        if self._trial_in_flight or time.monotonic() - self._opened_at >= self.reset_seconds:
+            return BREAKER_HALF_OPEN
+        return BREAKER_OPEN
+
+    def allow(self) -> bool:
+        """Whether a call may be sent now. A True in half-open state claims the trial call."""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._trial_in_flight or time.monotonic() - self._opened_at < self.reset_seconds:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self._opened_at is not None or self._failures >= self.failure_threshold:
+                if self._opened_at is None:
+                    self.opens += 1
+                self._opened_at = time.monotonic()
+
+    def release(self) -> None:
+        """Give back a claimed trial call that was abandoned (e.g. cancelled as a losing hedge)."""
+        with self._lock:
+            self._trial_in_flight = False
+
+
+class LLMProvider:
+    """
+    A named chat model the router can send prompts to.
+
+    model is anything with invoke(prompt) and ainvoke(prompt) returning an
+    object with .content (and optionally .usage_metadata), and astream(prompt)
+    yielding such objects piece by piece: a LangChain chat model,
+    AnthropicChat or FakeChat.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        model,
+        model_name: Optional[str] = None,
+        http_client=None,
+        failure_threshold: Optional[int] = None,
+        reset_seconds: Optional[float] = None,
+    ):
+        self.name = name
+        self.model = model
+        self.model_name = model_name or getattr(model, "model_name", None) or name
+        self.http_client = http_client  # Closed with the provider
+        self.breaker = CircuitBreaker(
+            failure_threshold or settings.llm_breaker_failures,
+            settings.llm_breaker_reset_seconds if reset_seconds is None else reset_seconds,
+        )
+        self.attempts = 0
+        self.failures = 0
+        self.wins = 0
+
+    def stats(self) -> dict:
+        return {
+            "model": self.model_name,
+            "attempts": self.attempts,
+            "failures": self.failures,
+            "wins": self.wins,
+            "breaker": self.breaker.state,
+            "breaker_opens": self.breaker.opens,
+        }
+
+    async def aclose(self) -> None:
+        if self.http_client is not None:
+            await self.http_client.aclose()
+        close = getattr(self.model, "aclose", None)
+        if close is not None:
+            await close()
+
+
+class LLMRouter:
+    """
+    Send prompts to a list of providers in order of preference.
+
+    hedge_after_seconds of 0 disables hedging (providers are then only used
+    as fallbacks). timeout_seconds bounds each async attempt; sync calls
+    rely on the client's own timeout. The sync path never hedges, since it
+    would need a second thread per call.
+    """
+
+    def __init__(
+        self,
+        providers: Sequence[LLMProvider],
+        hedge_after_seconds: float = 0.0,
+        timeout_seconds: Optional[float] = None,
+    ):
+        if not providers:
+            raise ValueError("At least one LLM provider is required")
+        self.providers = list(providers)
+        self.hedge_after_seconds = hedge_after_seconds
+        self.timeout_seconds = timeout_seconds
+        self.requests = 0
+        self.hedges = 0
+        self.fallbacks = 0
+
+    @property
+    def primary(self) -> LLMProvider:
+        return self.providers[0]
+
+    def invoke(
+        self, prompt: str, validate: Optional[Callable[[str], bool]] = None
+    ) -> Tuple[ChatResponse, LLMProvider]:
+        """
+        Get an answer from the first provider that gives a valid one, trying them in turn.
+
+        Returns:
+            Tuple of (response, provider that produced it). If no answer is
+            valid, the first invalid one is returned.
+
+        Raises:
+            LLMProviderError: If every provider failed or is unavailable
+        """
+        self.requests += 1
+        errors: List[str] = []
+        fallback: Optional[Tuple[ChatResponse, LLMProvider]] = None
+        for provider in self.providers:
+            if not provider.breaker.allow():
+                continue
+            if errors or fallback:
+                self.fallbacks += 1
+            provider.attempts += 1
+            try:
+                response = provider.model.invoke(prompt)
+            except Exception as e:
+                provider.breaker.record_failure()
+                self._failed(provider, e, errors)
+                continue
+            provider.breaker.record_success()
+            if validate is None or validate(response.content):
+                return self._won(provider, response)
+            observe_llm_attempt(provider.name, "invalid")
+            fallback = fallback or (response, provider)
+        return self._give_up(fallback, errors)
+
+    async def ainvoke(
+        self, prompt: str, validate: Optional[Callable[[str], bool]] = None
+    ) -> Tuple[ChatResponse, LLMProvider]:
+        """Async variant of invoke that also hedges slow providers."""
+        self.requests += 1
+        queue = list(self.providers)
+        in_flight: Dict[asyncio.Task, LLMProvider] = {}
+        errors: List[str] = []
+        fallback: Optional[Tuple[ChatResponse, LLMProvider]] = None
+
+        def launch() -> bool:
+            while queue:
+                provider = queue.pop(0)
+                if provider.breaker.allow():
+                    in_flight[asyncio.ensure_future(self._attempt(provider, prompt))] = provider
+                    return True
+            return False
+
+        launch()
+        try:
+            while in_flight:
+                hedge_after = self.hedge_after_seconds if queue else 0
+                done, _ = await asyncio.wait(
+                    in_flight, timeout=hedge_after or None, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    # Nobody has answered in time: race the next provider
+                    if launch():
+                        self.hedges += 1
+                    continue
+
+                for task in done:
+                    provider = in_flight.pop(task)
+                    try:
+                        response = task.result()
+                    except Exception as e:
+                        self._failed(provider, e, errors)
+                        continue
+                    if validate is None or validate(response.content):
+                        return self._won(provider, response)
+                    observe_llm_attempt(provider.name, "invalid")
+                    fallback = fallback or (response, provider)
+
+                # Everything in flight failed: fall back to the next provider now
+                if not in_flight and launch():
+                    self.fallbacks += 1
+        finally:
+            for task in in_flight:
+                task.cancel()
+        return self._give_up(fallback, errors)
+
+    async def astream(self, prompt: str) -> AsyncIterator[Tuple[ChatResponse, LLMProvider]]:
+        """
+        Stream an answer as (chunk, provider) pairs from the first provider that starts one.
+
+        Providers are tried in turn until one yields its first chunk. From
+        then on the stream is committed to that provider: the caller has
+        already seen part of the answer, so a failure mid-stream is raised
+        rather than retried elsewhere. timeout_seconds bounds the wait for
+        each chunk.
+
+        Raises:
+            LLMProviderError: If no provider started a stream, or the stream broke off
+        """
+        self.requests += 1
+        errors: List[str] = []
+        for provider in self.providers:
+            if not provider.breaker.allow():
+                continue
+            if errors:
+                self.fallbacks += 1
+            provider.attempts += 1
+            chunks = None
+            started = False
+            try:
+                chunks = provider.model.astream(prompt).__aiter__()
+                while True:
+                    try:
+                        chunk = await asyncio.wait_for(chunks.__anext__(), self.timeout_seconds)
+                    except StopAsyncIteration:
+                        break
+                    started = True
+                    yield chunk, provider
+            except (asyncio.CancelledError, GeneratorExit):
+                # The caller went away; not the provider's fault
+                provider.breaker.release()
+                observe_llm_attempt(provider.name, "cancelled")
+                raise
+            except Exception as e:
+                provider.breaker.record_failure()
+                self._failed(provider, e, errors)
+                if started:
+                    raise LLMProviderError(f"LLM provider {provider.name} failed mid-stream: {e}") from e
+                continue
+            finally:
+                close = getattr(chunks, "aclose", None)
+                if close is not None:
+                    await close()
+            provider.breaker.record_success()
+            provider.wins += 1
+            observe_llm_attempt(provider.name, "success")
+            return
+        self._give_up(None, errors)
+
+    async def _attempt(self, provider: LLMProvider, prompt: str) -> ChatResponse:
+        provider.attempts += 1
+        try:
+            response = await asyncio.wait_for(provider.model.ainvoke(prompt), self.timeout_seconds)
+        except asyncio.CancelledError:
+            # Lost a hedge race; not the provider's fault
+            provider.breaker.release()
+            observe_llm_attempt(provider.name, "cancelled")
+            raise
+        except Exception:
+            provider.breaker.record_failure()
+            raise
+        provider.breaker.record_success()
+        return response
+
+    def _failed(self, provider: LLMProvider, error: Exception, errors: List[str]) -> None:
+        if isinstance(error, asyncio.TimeoutError):
+            error = f"no answer within {self.timeout_seconds}s"
+        provider.failures += 1
+        observe_llm_attempt(provider.name, "error")
+        errors.append(f"{provider.name}: {error}")
+        logger.warning(f"LLM provider {provider.name} failed: {error}")
+
+    def _won(self, provider: LLMProvider, response: ChatResponse) -> Tuple[ChatResponse, LLMProvider]:
+        provider.wins += 1
+        observe_llm_attempt(provider.name, "success")
+        return response, provider
+
+    @staticmethod
+    def _give_up(
+        fallback: Optional[Tuple[ChatResponse, LLMProvider]], errors: List[str]
+    ) -> Tuple[ChatResponse, LLMProvider]:
+        if fallback is not None:
+            return fallback
+        if not errors:
+            raise LLMProviderError("No LLM provider available: every circuit is open")
+        raise LLMProviderError(f"All LLM providers failed: {'; '.join(errors)}")
+
+    def stats(self) -> dict:
+        """Hedging/fallback counters and per-provider attempts, wins and breaker state."""
+        return {
+            "requests": self.requests,
+            "hedges": self.hedges,
+            "fallbacks": self.fallbacks,
+            "hedge_after_seconds": self.hedge_after_seconds,
+            "providers": {provider.name: provider.stats() for provider in self.providers},
+        }
+
+    async def aclose(self) -> None:
+        for provider in self.providers:
+            await provider.aclose()
+
+
+class AnthropicChat:
+    """Chat model over the Anthropic SDK, with the invoke/ainvoke/astream interface the router uses."""
+
+    def __init__(
+        self, model: str, api_key: str, temperature: float, max_tokens: int, timeout: float, max_retries: int = 2
+    ):
+        import anthropic  # Deferred like the OpenAI client
+
+        self.model_name = model
+        self.temperature = temperature
+        self.max_tokens = max_tokens
+        self._client = anthropic.Anthropic(api_key=api_key, timeout=timeout, max_retries=max_retries)
+        self._async_client = anthropic.AsyncAnthropic(
+            api_key=api_key, timeout=timeout, max_retries=max_retries
+        )
+
+    def _request(self, prompt: str) -> dict:
+        return {
+            "model": self.model_name,
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+            "messages": [{"role": "user", "content": prompt}],
+        }
+
+    @staticmethod
+    def _response(message) -> ChatResponse:
+        text = "".join(block.text for block in message.content if block.type == "text")
+        usage = {
+            "input_tokens": message.usage.input_tokens,
+            "output_tokens": message.usage.output_tokens,
+            "total_tokens": message.usage.input_tokens + message.usage.output_tokens,
+        }
+        return ChatResponse(text, usage)
+
+    def invoke(self, prompt: str) -> ChatResponse:
+        return self._response(self._client.messages.create(**self._request(prompt)))
+
+    async def ainvoke(self, prompt: str) -> ChatResponse:
+        return self._response(await self._async_client.messages.create(**self._request(prompt)))
+
+    async def astream(self, prompt: str) -> AsyncIterator[ChatResponse]:
+        """Yield the answer's text as it arrives, then an empty chunk carrying the token usage."""
+        async with self._async_client.messages.stream(**self._request(prompt)) as stream:
+            async for text in stream.text_stream:
+                yield ChatResponse(text)
+            message = await stream.get_final_message()
+        yield ChatResponse("", self._response(message).usage_metadata)
+
+    async def aclose(self) -> None:
+        await self._async_client.close()
+        self._client.close()
+
+
+class FakeChat:
+    """
+    Local stand-in for a provider, for tests and benchmarks.
+
+    Cycles through responses after sleeping for latency seconds (a number,
+    or a callable returning one per call, to model tail latency), and
+    raises instead with probability error_rate. Responses are generated in
+    pieces of STREAM_CHUNK_CHARS characters (about a token), token_latency
+    seconds apart: astream yields them as they come, invoke and ainvoke
+    wait for all of them.
+    """
+
+    STREAM_CHUNK_CHARS = 4
+
+    def __init__(
+        self,
+        responses: Sequence[str],
+        latency: Union[float, Callable[[], float]] = 0.0,
+        error_rate: float = 0.0,
+        seed: Optional[int] = None,
+        token_latency: float = 0.0,
+    ):
+        self._responses = itertools.cycle(responses)
+        self._latency = latency
+        self.error_rate = error_rate
+        self.token_latency = token_latency
+        self._random = random.Random(seed)
+
+    def _next(self) -> Tuple[float, Optional[str]]:
+        latency = self._latency() if callable(self._latency) else self._latency
+        if self.error_rate and self._random.random() < self.error_rate:
+            return latency, None
+        return latency, next(self._responses)
+
+    def _generation_time(self, content: str) -> float:
+        pieces = -(-len(content) // self.STREAM_CHUNK_CHARS)
+        return max(pieces - 1, 0) * self.token_latency
+
+    def invoke(self, prompt: str) -> ChatResponse:
+        latency, content = self._next()
+        if content is None:
+            time.sleep(latency)
+            raise RuntimeError("Injected provider error")
+        time.sleep(latency + self._generation_time(content))
+        return ChatResponse(content)
+
+    async def ainvoke(self, prompt: str) -> ChatResponse:
+        latency, content = self._next()
+        if content is None:
+            await asyncio.sleep(latency)
+            raise RuntimeError("Injected provider error")
+        await asyncio.sleep(latency + self._generation_time(content))
+        return ChatResponse(content)
+
+    async def astream(self, prompt: str) -> AsyncIterator[ChatResponse]:
+        latency, content = self._next()
+        await asyncio.sleep(latency)
+        if content is None:
+            raise RuntimeError("Injected provider error")
+        for start in range(0, len(content), self.STREAM_CHUNK_CHARS):
+            if start:
+                await asyncio.sleep(self.token_latency)
+            yield ChatResponse(content[start:start + self.STREAM_CHUNK_CHARS])
+
+
+def build_providers(names: Sequence[str]) -> List[LLMProvider]:
+    """
+    Create the configured providers, in order of preference.
+
+    Raises:
+        ValueError: If a provider name is unknown
+    """
+    providers = []
+    for name in names:
+        if name == "openai":
+            # Imported here: they take longer to import than the rest of the app
+            import httpx
+            from langchain_openai import ChatOpenAI
+
+            # One pooled async client shared by every concurrent LLM call
+            http_async_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=settings.llm_max_connections,
+                    max_keepalive_connections=settings.llm_max_connections,
+                ),
+                timeout=settings.llm_request_timeout,
+            )
+            model = ChatOpenAI(
+                model=settings.llm_model,
+                api_key=settings.openai_api_key,
+                temperature=settings.llm_temperature,  # Deterministic for consistent summaries
+                timeout=settings.llm_request_timeout,
+                max_retries=settings.llm_max_retries,
+                stream_usage=True,  # Token counts for streamed answers too
+                http_async_client=http_async_client,
+            )
+            providers.append(
+                LLMProvider(name, model, settings.llm_model, http_client=http_async_client)
+            )
+        elif name == "anthropic":
+            model = AnthropicChat(
+                model=settings.anthropic_model,
+                api_key=settings.anthropic_api_key,
+                temperature=settings.llm_temperature,
+                max_tokens=settings.anthropic_max_tokens,
+                timeout=settings.llm_request_timeout,
+                max_retries=settings.llm_max_retries,
+            )
+            providers.append(LLMProvider(name, model, settings.anthropic_model))
+        else:
+            raise ValueError(f"Unknown LLM provider: {name}")
+    return providers
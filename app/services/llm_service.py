@@ -1,96 +1,700 @@
+import asyncio
 import json
-from pathlib import Path
-from langchain_openai import ChatOpenAI
-from langchain.prompts import PromptTemplate
+import logging
+import re
+import threading
+import time
+from typing import TYPE_CHECKING, AsyncIterator, Callable, List, Optional, Sequence, Tuple
 
 from app.config import settings
+from app.instrumentation import install_llm_limiter_gauges, observe_llm_call, observe_llm_queue_wait
+from app.services.llm_cache import DEFAULT_CACHE_PATH, LLMResponseCache
 from app.services.llm_logger import llm_logger
+from app.services.llm_metrics import llm_metrics
+from app.services.llm_router import ChatResponse, LLMProvider, LLMRouter, build_providers
+from app.services.prompt_registry import DEFAULT_PROMPTS_DIR, PromptRegistry
+from app.services.rate_limiter import RateLimiter, current_llm_priority, llm_priority
+from app.services.transcript_chunker import chunk_transcript, estimate_tokens
+
+if TYPE_CHECKING:
+    from langchain_core.language_models import BaseChatModel
+
+logger = logging.getLogger(__name__)
+
+# Completion tokens counted against the tokens-per-minute budget for each call
+RESPONSE_TOKEN_ALLOWANCE = 500
+
+# Prompts that can contribute to a meeting summary (chunked transcripts use all three)
+SUMMARY_PROMPTS = ("meeting_summary", "meeting_summary_chunk", "meeting_summary_reduce")
 
 
 class LLMService:
-    """Service for LLM operations."""
+    """
+    Service for LLM operations.
+
+    Calls go through an LLMRouter over the providers in LLM_PROVIDERS, which
+    hedges slow providers and falls back on failing ones. A chat model
+    (e.g. langchain's FakeListChatModel) or a list of providers (e.g. with
+    FakeChat models) can be injected to run offline; injected models get no
+    response cache unless one is passed too. Prompt templates come from a
+    PromptRegistry, compiled once at startup and reloaded on change in
+    debug mode.
+    """
+
+    def __init__(
+        self,
+        model: Optional["BaseChatModel"] = None,
+        cache: Optional[LLMResponseCache] = None,
+        prompts: Optional[PromptRegistry] = None,
+        providers: Optional[Sequence[LLMProvider]] = None,
+    ):
+        self.chunk_tokens = settings.llm_chunk_tokens
+        self.chunk_concurrency = settings.llm_chunk_concurrency
+        self.prompts = prompts or PromptRegistry(
+            settings.llm_prompts_dir or DEFAULT_PROMPTS_DIR, auto_reload=settings.debug
+        )
+        self.cache = cache
+        self.rate_limiter = RateLimiter(
+            requests_per_minute=settings.llm_requests_per_minute,
+            tokens_per_minute=settings.llm_tokens_per_minute,
+            max_concurrency=settings.llm_max_concurrency,
+        )
+        self.rate_limiter.on_wait = observe_llm_queue_wait
+
+        injected = model is not None or providers is not None
+        if model is not None:
+            providers = [LLMProvider("default", model, settings.llm_model)]
+        elif providers is None:
+            providers = build_providers(settings.llm_providers_list)
+        self.router = LLMRouter(
+            providers,
+            hedge_after_seconds=settings.llm_hedge_after_seconds,
+            timeout_seconds=settings.llm_request_timeout,
+        )
+        # Cache keys use the primary provider's model, whichever provider answered
+        self.model_name = self.router.primary.model_name
+
+        if not injected and cache is None and settings.llm_cache_enabled:
+            self.cache = LLMResponseCache(
+                path=settings.llm_cache_path or DEFAULT_CACHE_PATH,
+                max_entries=settings.llm_cache_max_entries,
+                max_bytes=settings.llm_cache_max_bytes,
+                ttl_seconds=settings.llm_cache_ttl_seconds,
+            )
 
-    def __init__(self):
-        self.model = ChatOpenAI(
-            model="gpt-4o-mini",
-            api_key=settings.openai_api_key,
-            temperature=0.0,  # Deterministic for consistent summaries
+    def format_prompt(self, prompt_name: str, transcript: str, **variables) -> Tuple[str, str]:
+        """
+        Format a registered prompt template with the transcript and any extra variables.
+
+        Returns:
+            Tuple of (formatted prompt, template version hash)
+        """
+        prompt = self.prompts.get(prompt_name)
+        return prompt.format(transcript=transcript, **variables), prompt.version
+
+    def summary_prompt_version(self) -> str:
+        """Combined version of the summary prompts, recorded with each stored summary."""
+        return self.prompts.version(*SUMMARY_PROMPTS)
+
+    def _cache_key(self, prompt: str, prompt_version: str) -> Optional[str]:
+        if self.cache is None:
+            return None
+        return self.cache.make_key(
+            prompt_version, prompt, self.model_name, settings.llm_temperature
+        )
+
+    def _cache_lookup(self, key: Optional[str], use_cache: bool) -> Optional[str]:
+        if key is None or not use_cache:
+            return None
+        return self.cache.get(key)
+
+    def _cache_store(
+        self, key: Optional[str], response_text: str, cacheable: Optional[Callable[[str], bool]]
+    ) -> None:
+        if key is not None and (cacheable is None or cacheable(response_text)):
+            self.cache.set(key, response_text)
+
+    async def _acache_lookup(self, key: Optional[str], use_cache: bool) -> Optional[str]:
+        """_cache_lookup for coroutines: the SQLite read (and the cache's lock) stay off the event loop."""
+        if key is None or not use_cache:
+            return None
+        return await asyncio.to_thread(self.cache.get, key)
+
+    async def _acache_store(
+        self, key: Optional[str], response_text: str, cacheable: Optional[Callable[[str], bool]]
+    ) -> None:
+        """_cache_store for coroutines, writing from a worker thread."""
+        if key is not None and (cacheable is None or cacheable(response_text)):
+            await asyncio.to_thread(self.cache.set, key, response_text)
+
+    def _record_call(
+        self,
+        metadata: dict,
+        prompt_version: str,
+        started: float,
+        prompt: Optional[str] = None,
+        response=None,
+        cache_hit: bool = False,
+        error: Optional[str] = None,
+        provider: Optional[LLMProvider] = None,
+    ) -> None:
+        """
+        Record token usage and latency of a call with the usage tracker.
+
+        Provider-reported token counts are used when the model returns them
+        (usage_metadata); otherwise they are estimated from the text.
+        provider is the one that answered, defaulting to the primary.
+        """
+        prompt_tokens = completion_tokens = 0
+        if response is not None:
+            usage = getattr(response, "usage_metadata", None)
+            if usage:
+                prompt_tokens = usage.get("input_tokens", 0)
+                completion_tokens = usage.get("output_tokens", 0)
+            else:
+                prompt_tokens = estimate_tokens(prompt)
+                completion_tokens = estimate_tokens(response.content)
+        elapsed = time.perf_counter() - started
+        operation = metadata.get("operation", "unknown")
+        provider = provider or self.router.primary
+        model = provider.model_name
+        observe_llm_call(
+            operation, model, elapsed, prompt_tokens, completion_tokens, cache_hit, error
+        )
+        llm_metrics.record(
+            operation=operation,
+            model=model,
+            provider=provider.name,
+            latency_ms=elapsed * 1000,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            cache_hit=cache_hit,
+            prompt_version=prompt_version,
+            customer_id=metadata.get("customer_id"),
+            event_id=metadata.get("meeting_id"),
+            error=error,
         )
-        self.prompts_dir = Path("prompts")
 
-    def load_prompt(self, prompt_name: str) -> str:
-        """Load a prompt template from the prompts directory."""
-        prompt_path = self.prompts_dir / f"{prompt_name}.txt"
-        with open(prompt_path, "r", encoding="utf-8") as f:
-            return f.read()
+    @staticmethod
+    def _metadata(operation: str, meeting_id: Optional[int], customer_id: Optional[int], **extra) -> dict:
+        """Build call metadata for logging and usage accounting."""
+        metadata = {"operation": operation, **extra}
+        if meeting_id:
+            metadata["meeting_id"] = meeting_id
+        if customer_id:
+            metadata["customer_id"] = customer_id
+        return metadata
 
-    def extract_participants(self, transcript: str) -> str:
+    def _call(
+        self,
+        prompt: str,
+        metadata: dict,
+        prompt_version: str,
+        use_cache: bool = True,
+        cacheable: Optional[Callable[[str], bool]] = None,
+    ) -> str:
+        """
+        Route the prompt to a provider synchronously (or serve from cache) and log the call.
+
+        The call waits its turn in the rate limiter, at the priority set with
+        llm_priority() (background by default).
+        """
+        started = time.perf_counter()
+        key = self._cache_key(prompt, prompt_version)
+        cached = self._cache_lookup(key, use_cache)
+        if cached is not None:
+            self._record_call(metadata, prompt_version, started, cache_hit=True)
+            return cached
+
+        tokens = estimate_tokens(prompt) + RESPONSE_TOKEN_ALLOWANCE
+        with self.rate_limiter.limit(tokens):
+            started = time.perf_counter()
+            try:
+                response, provider = self.router.invoke(prompt, validate=cacheable)
+            except Exception as e:
+                self._record_call(metadata, prompt_version, started, error=str(e))
+                raise
+        self._record_call(
+            metadata, prompt_version, started, prompt=prompt, response=response, provider=provider
+        )
+        llm_logger.log_call(
+            prompt=prompt,
+            response=response.content,
+            model=provider.model_name,
+            metadata={**metadata, "provider": provider.name},
+        )
+        self._cache_store(key, response.content, cacheable)
+        return response.content
+
+    async def _acall(
+        self,
+        prompt: str,
+        metadata: dict,
+        prompt_version: str,
+        use_cache: bool = True,
+        cacheable: Optional[Callable[[str], bool]] = None,
+    ) -> str:
+        """Async variant of _call that doesn't block the event loop and hedges slow providers."""
+        started = time.perf_counter()
+        key = self._cache_key(prompt, prompt_version)
+        cached = await self._acache_lookup(key, use_cache)
+        if cached is not None:
+            self._record_call(metadata, prompt_version, started, cache_hit=True)
+            return cached
+
+        tokens = estimate_tokens(prompt) + RESPONSE_TOKEN_ALLOWANCE
+        async with self.rate_limiter.alimit(tokens):
+            started = time.perf_counter()
+            try:
+                response, provider = await self.router.ainvoke(prompt, validate=cacheable)
+            except Exception as e:
+                self._record_call(metadata, prompt_version, started, error=str(e))
+                raise
+        self._record_call(
+            metadata, prompt_version, started, prompt=prompt, response=response, provider=provider
+        )
+        llm_logger.log_call(
+            prompt=prompt,
+            response=response.content,
+            model=provider.model_name,
+            metadata={**metadata, "provider": provider.name},
+        )
+        await self._acache_store(key, response.content, cacheable)
+        return response.content
+
+    async def _astream_call(
+        self,
+        prompt: str,
+        metadata: dict,
+        prompt_version: str,
+        use_cache: bool = True,
+        cacheable: Optional[Callable[[str], bool]] = None,
+        priority: Optional[int] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Streaming variant of _acall, yielding the answer's text as it arrives.
+
+        A cached answer is yielded whole. Once the stream ends, the answer is
+        recorded, logged and cached like any other; a stream that fails or is
+        abandoned part way is recorded as an error.
+        """
+        started = time.perf_counter()
+        key = self._cache_key(prompt, prompt_version)
+        cached = await self._acache_lookup(key, use_cache)
+        if cached is not None:
+            self._record_call(metadata, prompt_version, started, cache_hit=True)
+            yield cached
+            return
+
+        tokens = estimate_tokens(prompt) + RESPONSE_TOKEN_ALLOWANCE
+        pieces: List[str] = []
+        usage = None
+        # An empty stream yields no chunk to name the provider that answered
+        provider = self.router.primary
+        async with self.rate_limiter.alimit(tokens, priority=priority):
+            started = time.perf_counter()
+            try:
+                async for chunk, provider in self.router.astream(prompt):
+                    usage = getattr(chunk, "usage_metadata", None) or usage
+                    if chunk.content:
+                        pieces.append(chunk.content)
+                        yield chunk.content
+            except BaseException as e:
+                self._record_call(metadata, prompt_version, started, error=str(e) or type(e).__name__)
+                raise
+        response = ChatResponse("".join(pieces), usage)
+        self._record_call(
+            metadata, prompt_version, started, prompt=prompt, response=response, provider=provider
+        )
+        llm_logger.log_call(
+            prompt=prompt,
+            response=response.content,
+            model=provider.model_name,
+            metadata={**metadata, "provider": provider.name, "streamed": True},
+        )
+        await self._acache_store(key, response.content, cacheable)
+
+    def extract_participants(
+        self,
+        transcript: str,
+        use_cache: bool = True,
+        meeting_id: int = None,
+        customer_id: int = None,
+    ) -> str:
         """
         Extract participants from a meeting transcript using LLM.
 
         Args:
             transcript: The meeting transcript
+            use_cache: Set to False to bypass the response cache
+            meeting_id: Optional meeting ID for logging and usage accounting
+            customer_id: Optional customer ID for usage accounting
 
         Returns:
             Comma-separated string of participant names
         """
-        # Load prompt template
-        prompt_template_str = self.load_prompt("extract_participants")
-        prompt_template = PromptTemplate(
-            input_variables=["transcript"], template=prompt_template_str
+        formatted_prompt, version = self.format_prompt("extract_participants", transcript)
+        response_text = self._call(
+            formatted_prompt,
+            metadata=self._metadata("extract_participants", meeting_id, customer_id),
+            prompt_version=version,
+            use_cache=use_cache,
         )
+        return response_text.strip()
 
-        # Format prompt with transcript
-        formatted_prompt = prompt_template.format(transcript=transcript)
-
-        # Call LLM
-        response = self.model.invoke(formatted_prompt)
-        response_text = response.content.strip()
-
-        # Log the call
-        llm_logger.log_call(
-            prompt=formatted_prompt,
-            response=response_text,
-            model="gpt-4o-mini",
-            metadata={"operation": "extract_participants"},
+    async def aextract_participants(
+        self,
+        transcript: str,
+        use_cache: bool = True,
+        meeting_id: int = None,
+        customer_id: int = None,
+    ) -> str:
+        """Async variant of extract_participants."""
+        formatted_prompt, version = self.format_prompt("extract_participants", transcript)
+        response_text = await self._acall(
+            formatted_prompt,
+            metadata=self._metadata("extract_participants", meeting_id, customer_id),
+            prompt_version=version,
+            use_cache=use_cache,
         )
+        return response_text.strip()
 
-        return response_text
-
-    def summarize_meeting(self, transcript: str, meeting_id: int = None) -> dict:
+    def summarize_meeting(
+        self,
+        transcript: str,
+        meeting_id: int = None,
+        use_cache: bool = True,
+        customer_id: int = None,
+    ) -> dict:
         """
         Summarize a meeting transcript using LLM.
 
         Args:
             transcript: The meeting transcript
-            meeting_id: Optional meeting ID for logging
+            meeting_id: Optional meeting ID for logging and usage accounting
+            use_cache: Set to False to force a fresh LLM call (the result is still cached)
+            customer_id: Optional customer ID for usage accounting
+
+        Transcripts longer than llm_chunk_tokens are summarized map-reduce
+        style: each chunk of speaker turns is summarized on its own, then the
+        partial summaries are combined into one.
 
         Returns:
             Dictionary with summary data: {tldr, action_items, sentiment, sentiment_explanation}
         """
-        # Load prompt template
-        prompt_template_str = self.load_prompt("meeting_summary")
-        prompt_template = PromptTemplate(
-            input_variables=["transcript"], template=prompt_template_str
-        )
+        chunks = chunk_transcript(transcript, self.chunk_tokens)
+        if len(chunks) > 1:
+            partials = [
+                self._summarize_prompt(
+                    *self._chunk_prompt(chunk, part, len(chunks), meeting_id, customer_id), use_cache
+                )
+                for part, chunk in enumerate(chunks, start=1)
+            ]
+            while True:
+                groups = self._group_partials(partials)
+                if len(groups) == 1:
+                    return self._summarize_prompt(
+                        *self._reduce_prompt(groups[0], meeting_id, customer_id), use_cache
+                    )
+                partials = [
+                    self._summarize_prompt(*self._reduce_prompt(group, meeting_id, customer_id), use_cache)
+                    for group in groups
+                ]
 
-        # Format prompt with transcript
-        formatted_prompt = prompt_template.format(transcript=transcript)
+        formatted_prompt, version = self.format_prompt("meeting_summary", transcript)
+        metadata = self._metadata("summarize_meeting", meeting_id, customer_id)
+        return self._summarize_prompt(formatted_prompt, version, metadata, use_cache)
 
-        # Call LLM
-        response = self.model.invoke(formatted_prompt)
-        response_text = response.content
+    async def asummarize_meeting(
+        self,
+        transcript: str,
+        meeting_id: int = None,
+        use_cache: bool = True,
+        customer_id: int = None,
+    ) -> dict:
+        """Async variant of summarize_meeting; chunk summaries run concurrently."""
+        chunks = chunk_transcript(transcript, self.chunk_tokens)
+        if len(chunks) > 1:
+            prompt, version, metadata = await self._areduce_chunks(chunks, meeting_id, customer_id, use_cache)
+        else:
+            prompt, version = self.format_prompt("meeting_summary", transcript)
+            metadata = self._metadata("summarize_meeting", meeting_id, customer_id)
+        return await self._asummarize_prompt(prompt, version, metadata, use_cache)
 
-        # Log the call
-        metadata = {"meeting_id": meeting_id} if meeting_id else {}
-        llm_logger.log_call(
-            prompt=formatted_prompt,
-            response=response_text,
-            model="gpt-4o-mini",
+    async def astream_summarize_meeting(
+        self,
+        transcript: str,
+        meeting_id: int = None,
+        use_cache: bool = True,
+        customer_id: int = None,
+        priority: Optional[int] = None,
+    ) -> AsyncIterator[Tuple[str, dict]]:
+        """
+        Streaming variant of asummarize_meeting, yielding (event, data) pairs.
+
+        Events:
+            progress: {"parts": n}, before the parts of a long transcript are summarized
+            partial: the summary fields received so far, each time they grow
+            summary: the complete parsed summary, always last
+
+        Only the final LLM call streams, since partial summaries have to be
+        complete before they can be combined. The summary is cached like
+        asummarize_meeting's. priority is the rate limiter priority class,
+        by default that of the calling context; it is passed explicitly
+        because a stream is often consumed outside the context that created
+        it (llm_priority() can't span the yields of a generator).
+        """
+        if priority is None:
+            priority = current_llm_priority.get()
+        chunks = chunk_transcript(transcript, self.chunk_tokens)
+        if len(chunks) > 1:
+            yield "progress", {"parts": len(chunks)}
+            with llm_priority(priority):
+                prompt, version, metadata = await self._areduce_chunks(
+                    chunks, meeting_id, customer_id, use_cache
+                )
+        else:
+            prompt, version = self.format_prompt("meeting_summary", transcript)
+            metadata = self._metadata("summarize_meeting", meeting_id, customer_id)
+
+        response_text = ""
+        shown: dict = {}
+        async for text in self._astream_call(
+            prompt,
+            metadata=metadata,
+            prompt_version=version,
+            use_cache=use_cache,
+            cacheable=self.is_valid_summary,
+            priority=priority,
+        ):
+            response_text += text
+            partial = self.parse_partial_summary(response_text)
+            if partial and partial != shown:
+                shown = partial
+                yield "partial", partial
+        yield "summary", self.parse_summary(response_text)
+
+    async def _areduce_chunks(
+        self,
+        chunks: List[str],
+        meeting_id: Optional[int],
+        customer_id: Optional[int],
+        use_cache: bool,
+    ) -> Tuple[str, str, dict]:
+        """
+        Summarize the chunks of a long transcript concurrently and reduce them
+        until one reduce call is left; returns that call's (prompt, version, metadata).
+        """
+        semaphore = asyncio.Semaphore(self.chunk_concurrency)
+
+        async def summarize(prompt: str, version: str, metadata: dict) -> dict:
+            async with semaphore:
+                return await self._asummarize_prompt(prompt, version, metadata, use_cache)
+
+        partials = await asyncio.gather(*(
+            summarize(*self._chunk_prompt(chunk, part, len(chunks), meeting_id, customer_id))
+            for part, chunk in enumerate(chunks, start=1)
+        ))
+        while True:
+            groups = self._group_partials(partials)
+            if len(groups) == 1:
+                return self._reduce_prompt(groups[0], meeting_id, customer_id)
+            partials = await asyncio.gather(*(
+                summarize(*self._reduce_prompt(group, meeting_id, customer_id)) for group in groups
+            ))
+
+    def _summarize_prompt(
+        self, prompt: str, version: str, metadata: dict, use_cache: bool
+    ) -> dict:
+        response_text = self._call(
+            prompt,
+            metadata=metadata,
+            prompt_version=version,
+            use_cache=use_cache,
+            cacheable=self.is_valid_summary,
+        )
+        return self.parse_summary(response_text)
+
+    async def _asummarize_prompt(
+        self, prompt: str, version: str, metadata: dict, use_cache: bool
+    ) -> dict:
+        response_text = await self._acall(
+            prompt,
             metadata=metadata,
+            prompt_version=version,
+            use_cache=use_cache,
+            cacheable=self.is_valid_summary,
+        )
+        return self.parse_summary(response_text)
+
+    def _chunk_prompt(
+        self,
+        chunk: str,
+        part: int,
+        total: int,
+        meeting_id: Optional[int],
+        customer_id: Optional[int],
+    ) -> Tuple[str, str, dict]:
+        """Build the (prompt, version, metadata) for summarizing one transcript chunk."""
+        prompt, version = self.format_prompt(
+            "meeting_summary_chunk", chunk, part=part, total=total
+        )
+        metadata = self._metadata(
+            "summarize_chunk", meeting_id, customer_id, chunk=part, chunks=total
+        )
+        return prompt, version, metadata
+
+    def _reduce_prompt(
+        self, partials: List[dict], meeting_id: Optional[int], customer_id: Optional[int]
+    ) -> Tuple[str, str, dict]:
+        """Build the (prompt, version, metadata) for combining partial summaries."""
+        formatted_partials = "\n\n".join(
+            f"Part {part}:\n{json.dumps(partial, ensure_ascii=False)}"
+            for part, partial in enumerate(partials, start=1)
+        )
+        prompt, version = self.format_prompt("meeting_summary_reduce", formatted_partials)
+        metadata = self._metadata(
+            "reduce_summaries", meeting_id, customer_id, parts=len(partials)
+        )
+        return prompt, version, metadata
+
+    def _group_partials(self, partials: List[dict]) -> List[List[dict]]:
+        """
+        Group partial summaries so each reduce prompt stays within the chunk budget.
+
+        A single group means the partials can be reduced in one call; otherwise
+        each group is reduced first and the results are reduced again.
+        """
+        partials = [
+            {key: value for key, value in partial.items() if key != "raw_response"}
+            for partial in partials
+        ]
+        groups: List[List[dict]] = [[]]
+        group_tokens = 0
+        for partial in partials:
+            tokens = estimate_tokens(json.dumps(partial, ensure_ascii=False))
+            if groups[-1] and group_tokens + tokens > self.chunk_tokens:
+                groups.append([])
+                group_tokens = 0
+            groups[-1].append(partial)
+            group_tokens += tokens
+
+        # Never loop forever on partials that are each over budget on their own
+        if len(groups) == len(partials):
+            return [partials]
+        return groups
+
+    async def aanalyze_meeting(
+        self,
+        transcript: str,
+        meeting_id: int = None,
+        extract_participants: bool = True,
+        customer_id: int = None,
+    ) -> dict:
+        """
+        Extract participants and summarize a meeting concurrently.
+
+        The two prompts are independent, so running them side by side roughly
+        halves the wall time of analyzing a meeting.
+
+        Args:
+            transcript: The meeting transcript
+            meeting_id: Optional meeting ID for logging and usage accounting
+            extract_participants: Whether to run participant extraction
+            customer_id: Optional customer ID for usage accounting
+
+        Returns:
+            Dictionary with keys: participants (None if skipped or failed), summary
+            and prompt_version (of the summary prompts used)
+        """
+        prompt_version = self.summary_prompt_version()
+        if not extract_participants:
+            summary = await self.asummarize_meeting(
+                transcript, meeting_id=meeting_id, customer_id=customer_id
+            )
+            return {"participants": None, "summary": summary, "prompt_version": prompt_version}
+
+        participants, summary = await asyncio.gather(
+            self.aextract_participants(
+                transcript, meeting_id=meeting_id, customer_id=customer_id
+            ),
+            self.asummarize_meeting(transcript, meeting_id=meeting_id, customer_id=customer_id),
+            return_exceptions=True,
         )
+        if isinstance(summary, BaseException):
+            raise summary
+        if isinstance(participants, BaseException):
+            # A missing participant list should not cost us the summary
+            logger.error(f"Error extracting participants: {participants}", exc_info=participants)
+            participants = None
 
-        # Parse JSON response
+        return {"participants": participants, "summary": summary, "prompt_version": prompt_version}
+
+    @classmethod
+    def is_valid_summary(cls, response_text: str) -> bool:
+        """Whether a summary response parses; unparseable ones are never cached."""
+        return "raw_response" not in cls.parse_summary(response_text)
+
+    @staticmethod
+    def parse_partial_summary(response_text: str) -> dict:
+        """
+        Best-effort parse of a JSON summary that is still being streamed.
+
+        Open strings, lists and objects are closed so the fields received so
+        far can be shown; a key whose value hasn't started yet is left out.
+        Returns {} until there is something to show.
+        """
+        start = response_text.find("{")
+        if start < 0:
+            return {}
+        text = response_text[start:]
+        stack: List[str] = []
+        cuts: List[Tuple[int, str]] = []  # (end, closers) of prefixes that end on a complete value
+        in_string = escaped = False
+        for index, char in enumerate(text):
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif char == "\\":
+                    escaped = True
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = True
+            elif char in "{[":
+                stack.append("}" if char == "{" else "]")
+                cuts.append((index + 1, "".join(reversed(stack))))
+            elif char in "}]":
+                if stack:
+                    stack.pop()
+                if not stack:
+                    text = text[:index + 1]
+                    break
+            elif char == ",":
+                cuts.append((index, "".join(reversed(stack))))
+
+        candidates = []
+        if stack:
+            tail = text
+            if in_string:
+                # Drop a half-received escape sequence before closing the string
+                tail = tail[:-1] if escaped else re.sub(r"\\u[0-9a-fA-F]{0,3}$", "", tail)
+                tail += '"'
+            candidates.append(tail + "".join(reversed(stack)))
+            candidates.extend(text[:end] + closers for end, closers in reversed(cuts))
+        else:
+            candidates.append(text)
+        for candidate in candidates:
+            try:
+                parsed = json.loads(candidate)
+            except json.JSONDecodeError:
+                continue
+            return parsed if isinstance(parsed, dict) else {}
+        return {}
+
+    @staticmethod
+    def parse_summary(response_text: str) -> dict:
+        """Parse the JSON summary returned by the model."""
         try:
             # Clean up response if it has markdown code blocks
             if response_text.startswith("```"):
@@ -116,6 +720,34 @@ class LLMService:
                 "raw_response": response_text,
             }
 
+    async def aclose(self) -> None:
+        """Close the providers' HTTP clients."""
+        await self.router.aclose()
+
+
+# Global LLM service instance, created on first use
+_llm_service: Optional[LLMService] = None
+_llm_service_lock = threading.Lock()
+
+
+def get_llm_service() -> LLMService:
+    """
+    Get the shared LLM service, creating it on first use.
+
+    Creating it imports LangChain and the OpenAI client, so processes that
+    never call an LLM (scripts, migrations) never pay for that. Also
+    usable as a FastAPI dependency.
+    """
+    global _llm_service
+    if _llm_service is None:
+        with _llm_service_lock:
+            if _llm_service is None:
+                _llm_service = LLMService()
+                install_llm_limiter_gauges(_llm_service.rate_limiter)
+    return _llm_service
+
 
-# Global LLM service instance
-llm_service = LLMService()
+async def aclose_llm_service() -> None:
+    """Close the shared LLM service, if it was ever created."""
+    if _llm_service is not None:
+        await _llm_service.aclose()
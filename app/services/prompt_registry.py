@@ -0,0 +1,102 @@
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Optional
+
+if TYPE_CHECKING:
+    from langchain.prompts import PromptTemplate
+
+logger = logging.getLogger(__name__)
+
+# prompts/ at the project root, independent of the working directory
+DEFAULT_PROMPTS_DIR = Path(__file__).resolve().parents[2] / "prompts"
+
+
+class CompiledPrompt:
+    """A prompt template parsed once, tagged with a hash of its text."""
+
+    __slots__ = ("name", "template", "version", "mtime_ns")
+
+    def __init__(self, name: str, template: "PromptTemplate", version: str, mtime_ns: int):
+        self.name = name
+        self.template = template
+        self.version = version
+        self.mtime_ns = mtime_ns
+
+    def format(self, **variables) -> str:
+        return self.template.format(**variables)
+
+
+def prompt_version(text: str) -> str:
+    """Content hash identifying a prompt template's text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:12]
+
+
+class PromptRegistry:
+    """
+    Every prompt template in a directory, read and compiled once.
+
+    Templates are the directory's *.txt files, named by file stem. With
+    auto_reload, each lookup stats the file and recompiles it when it has
+    changed, so prompts can be edited without a restart (meant for debug
+    mode; production lookups never touch the disk).
+    """
+
+    def __init__(self, directory: Path = DEFAULT_PROMPTS_DIR, auto_reload: bool = False):
+        self.directory = Path(directory)
+        self.auto_reload = auto_reload
+        self._lock = threading.Lock()
+        self._prompts: Dict[str, CompiledPrompt] = {}
+        for path in sorted(self.directory.glob("*.txt")):
+            self._prompts[path.stem] = self._compile(path)
+
+    def _compile(self, path: Path) -> CompiledPrompt:
+        from langchain.prompts import PromptTemplate  # Deferred: slow to import
+
+        mtime_ns = path.stat().st_mtime_ns
+        text = path.read_text(encoding="utf-8")
+        return CompiledPrompt(
+            name=path.stem,
+            template=PromptTemplate.from_template(text),
+            version=prompt_version(text),
+            mtime_ns=mtime_ns,
+        )
+
+    def _reload_if_changed(self, name: str) -> Optional[CompiledPrompt]:
+        path = self.directory / f"{name}.txt"
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return self._prompts.get(name)
+        prompt = self._prompts.get(name)
+        if prompt is not None and prompt.mtime_ns == mtime_ns:
+            return prompt
+        with self._lock:
+            prompt = self._compile(path)
+            self._prompts[name] = prompt
+        logger.info(f"Reloaded prompt {name} (version {prompt.version})")
+        return prompt
+
+    def get(self, name: str) -> CompiledPrompt:
+        """
+        Get a compiled prompt by name.
+
+        Raises:
+            KeyError: If there is no such prompt
+        """
+        prompt = self._reload_if_changed(name) if self.auto_reload else self._prompts.get(name)
+        if prompt is None:
+            raise KeyError(f"Unknown prompt: {name}")
+        return prompt
+
+    def version(self, *names: str) -> str:
+        """Version of one prompt, or a combined version of several used together."""
+        versions = [self.get(name).version for name in names]
+        if len(versions) == 1:
+            return versions[0]
+        return prompt_version(":".join(versions))
+
+    def versions(self) -> Dict[str, str]:
+        """Current version of every prompt, by name."""
+        return {name: self.get(name).version for name in sorted(self._prompts)}
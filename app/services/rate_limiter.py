@@ -0,0 +1,242 @@
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+
+# Priority classes; lower values are served first
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 1
+PRIORITY_NAMES = {PRIORITY_INTERACTIVE: "interactive", PRIORITY_BACKGROUND: "background"}
+
+# Priority of LLM calls made in the current context; set it with llm_priority()
+current_llm_priority: ContextVar[int] = ContextVar("current_llm_priority", default=PRIORITY_BACKGROUND)
+
+
+@contextmanager
+def llm_priority(priority: int):
+    """Run the LLM calls made inside the block (and tasks started from it) at the given priority."""
+    token = current_llm_priority.set(priority)
+    try:
+        yield
+    finally:
+        current_llm_priority.reset(token)
+
+
+class TokenBucket:
+    """A bucket holding up to `capacity` units, refilled continuously over a minute."""
+
+    def __init__(self, per_minute: float):
+        self.capacity = per_minute
+        self.rate = per_minute / 60.0
+        self.level = per_minute
+        self.updated = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def delay(self, amount: float) -> float:
+        """Seconds until amount is available (amounts over capacity wait for a full bucket)."""
+        missing = min(amount, self.capacity) - self.level
+        return 0.0 if missing <= 0 else missing / self.rate
+
+    def take(self, amount: float) -> None:
+        self.level -= min(amount, self.capacity)
+
+
+class _Waiter:
+    """A caller queued for capacity; woken through a threading.Event or an asyncio future."""
+
+    __slots__ = ("priority", "tokens", "enqueued", "granted", "cancelled", "event", "loop", "future")
+
+    def __init__(self, priority: int, tokens: int, loop: Optional[asyncio.AbstractEventLoop] = None):
+        self.priority = priority
+        self.tokens = tokens
+        self.enqueued = time.monotonic()
+        self.granted = False
+        self.cancelled = False
+        self.loop = loop
+        self.event = threading.Event() if loop is None else None
+        self.future = loop.create_future() if loop is not None else None
+
+    def wake(self) -> None:
+        if self.loop is None:
+            self.event.set()
+        else:
+            self.loop.call_soon_threadsafe(self._resolve)
+
+    def _resolve(self) -> None:
+        if not self.future.done():
+            self.future.set_result(None)
+
+
+class RateLimiter:
+    """
+    Process-wide governor for LLM calls: requests per minute, tokens per
+    minute and calls in flight.
+
+    Callers queue instead of failing. The queue is served strictly by
+    priority class (interactive before background), first come first served
+    within a class, so a burst of background work can't hold up an
+    interactive request and the budget is never overshot. Thread-safe; use
+    limit() from threads and alimit() from coroutines. A limit of 0
+    disables that dimension.
+    """
+
+    def __init__(self, requests_per_minute: int = 0, tokens_per_minute: int = 0, max_concurrency: int = 0):
+        self._lock = threading.Lock()
+        self._requests = TokenBucket(requests_per_minute) if requests_per_minute > 0 else None
+        self._tokens = TokenBucket(tokens_per_minute) if tokens_per_minute > 0 else None
+        self.max_concurrency = max_concurrency
+        self.in_flight = 0
+        self._queue: List[Tuple[int, int, _Waiter]] = []
+        self._sequence = itertools.count()
+        self.waits: Dict[int, int] = {priority: 0 for priority in PRIORITY_NAMES}
+        self.wait_seconds: Dict[int, float] = {priority: 0.0 for priority in PRIORITY_NAMES}
+        self.on_wait = None  # Optional callback(priority, seconds) for metrics
+
+    @contextmanager
+    def limit(self, tokens: int = 0, priority: Optional[int] = None):
+        """Block the calling thread until one request of `tokens` tokens fits the budget; hold a slot for the block."""
+        waiter = self._enqueue(tokens, priority, loop=None)
+        try:
+            while True:
+                delay = self._poll(waiter)
+                if delay is None:
+                    break
+                waiter.event.wait(delay or None)
+                waiter.event.clear()
+        except BaseException:
+            self._abandon(waiter)
+            raise
+        try:
+            yield
+        finally:
+            self._release()
+
+    @asynccontextmanager
+    async def alimit(self, tokens: int = 0, priority: Optional[int] = None):
+        """Async variant of limit() that waits without blocking the event loop."""
+        waiter = self._enqueue(tokens, priority, loop=asyncio.get_running_loop())
+        try:
+            while True:
+                delay = self._poll(waiter)
+                if delay is None:
+                    break
+                await asyncio.wait({waiter.future}, timeout=delay or None)
+                waiter.future = waiter.loop.create_future()
+        except BaseException:
+            self._abandon(waiter)
+            raise
+        try:
+            yield
+        finally:
+            self._release()
+
+    def _enqueue(self, tokens: int, priority: Optional[int], loop) -> _Waiter:
+        if priority is None:
+            priority = current_llm_priority.get()
+        waiter = _Waiter(priority, tokens, loop)
+        with self._lock:
+            heapq.heappush(self._queue, (priority, next(self._sequence), waiter))
+        return waiter
+
+    def _poll(self, waiter: _Waiter) -> Optional[float]:
+        """Grant whatever capacity allows. None if waiter now holds a slot, else seconds to wait (0 = until woken)."""
+        with self._lock:
+            delay = self._dispatch(time.monotonic())
+            return None if waiter.granted else delay
+
+    def _dispatch(self, now: float) -> float:
+        """Grant queued waiters in order while capacity allows; returns when to try again (0 = on release)."""
+        if self._requests is not None:
+            self._requests.refill(now)
+        if self._tokens is not None:
+            self._tokens.refill(now)
+        while self._queue:
+            waiter = self._queue[0][2]
+            if waiter.cancelled:
+                heapq.heappop(self._queue)
+                continue
+            if self.max_concurrency and self.in_flight >= self.max_concurrency:
+                return 0.0
+            delay = max(
+                self._requests.delay(1) if self._requests is not None else 0.0,
+                self._tokens.delay(waiter.tokens) if self._tokens is not None else 0.0,
+            )
+            if delay > 0:
+                return delay
+            heapq.heappop(self._queue)
+            if self._requests is not None:
+                self._requests.take(1)
+            if self._tokens is not None:
+                self._tokens.take(waiter.tokens)
+            self.in_flight += 1
+            waiter.granted = True
+            waited = now - waiter.enqueued
+            if waited > 0.001:
+                self.waits[waiter.priority] = self.waits.get(waiter.priority, 0) + 1
+                self.wait_seconds[waiter.priority] = self.wait_seconds.get(waiter.priority, 0.0) + waited
+            if self.on_wait is not None:
+                self.on_wait(waiter.priority, waited)
+            waiter.wake()
+        return 0.0
+
+    def _redispatch(self) -> None:
+        """Dispatch after capacity came back; call with the lock held."""
+        if self._dispatch(time.monotonic()) > 0:
+            # The head waiter may be parked on a full house with no timeout:
+            # wake it so it polls again and sleeps until the buckets refill
+            self._queue[0][2].wake()
+
+    def _release(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            self._redispatch()
+
+    def _abandon(self, waiter: _Waiter) -> None:
+        """Drop a waiter that gave up (e.g. its task was cancelled), giving back its slot if it got one."""
+        with self._lock:
+            waiter.cancelled = True
+            if waiter.granted:
+                self.in_flight -= 1
+            self._redispatch()
+
+    def queue_depth(self, priority: Optional[int] = None) -> int:
+        """Callers waiting, optionally only those of one priority class."""
+        with self._lock:
+            return sum(
+                1 for p, _, waiter in self._queue
+                if not waiter.cancelled and (priority is None or p == priority)
+            )
+
+    def stats(self) -> dict:
+        """Current bucket levels, calls in flight, queue depth and how long callers waited, by priority."""
+        with self._lock:
+            now = time.monotonic()
+            depth = {name: 0 for name in PRIORITY_NAMES.values()}
+            for priority, _, waiter in self._queue:
+                if not waiter.cancelled:
+                    name = PRIORITY_NAMES.get(priority, str(priority))
+                    depth[name] = depth.get(name, 0) + 1
+            return {
+                "requests_available": self._level(self._requests, now),
+                "tokens_available": self._level(self._tokens, now),
+                "in_flight": self.in_flight,
+                "max_concurrency": self.max_concurrency or None,
+                "queue_depth": depth,
+                "waits": {PRIORITY_NAMES.get(p, str(p)): n for p, n in self.waits.items()},
+                "wait_seconds": {
+                    PRIORITY_NAMES.get(p, str(p)): round(s, 3) for p, s in self.wait_seconds.items()
+                },
+            }
+
+    @staticmethod
+    def _level(bucket: Optional[TokenBucket], now: float) -> Optional[float]:
+        if bucket is None:
+            return None
+        return round(min(bucket.capacity, bucket.level + (now - bucket.updated) * bucket.rate), 1)
@@ -0,0 +1,276 @@
+import logging
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Session.info key holding cache keys to invalidate once the transaction commits
+PENDING_INVALIDATIONS = "read_cache_invalidate"
+
+
+class MemoryBackend:
+    """
+    In-process store with LRU eviction, TTL expiry and caps on entries and total bytes.
+
+    A single generation counter versions every key: it moves on each delete
+    or clear, and a store is checked against it under the same lock.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int, ttl_seconds: float = 0):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds  # 0 disables expiry
+        self._entries: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._generation = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at and time.monotonic() >= expires_at:
+                self._remove(key)
+                self.expirations += 1
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def version(self, key: str) -> int:
+        with self._lock:
+            return self._generation
+
+    def set(self, key: str, value: bytes, version: int) -> bool:
+        """Store value unless key was invalidated since version was read."""
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds else 0.0
+        with self._lock:
+            if version != self._generation:
+                return False
+            self._remove(key)
+            if len(value) > self.max_bytes:
+                return False
+            self._entries[key] = (value, expires_at)
+            self._bytes += len(value)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+            return True
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._generation += 1
+            self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._bytes = 0
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry[0])
+
+    def stats(self) -> dict:
+        return {
+            "backend": "memory",
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+class RedisBackend:
+    """
+    Store shared by every worker process through Redis. Requires the redis package.
+
+    Rows live under versioned keys (prefix + "data:<version>:<key>"), with
+    each key's current version in prefix + "version:<key>". Deleting a key
+    moves its version to a fresh value of a global counter, so a row loaded
+    before an invalidation in any process lands under a version no reader
+    asks for, and expires with the TTL.
+    """
+
+    def __init__(self, url: str, ttl_seconds: float = 0, prefix: str = "prancing-pony:read-cache:"):
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError("READ_CACHE_REDIS_URL is set but the redis package is not installed") from e
+        self._client = redis.Redis.from_url(url)
+        self.ttl_seconds = ttl_seconds
+        self.prefix = prefix
+
+    def _data_key(self, key: str, version: int) -> str:
+        return f"{self.prefix}data:{version}:{key}"
+
+    def _version_key(self, key: str) -> str:
+        return f"{self.prefix}version:{key}"
+
+    def _version_ttl(self) -> Optional[int]:
+        # Outlives any row stored under an older version, so versions never repeat while one exists
+        return int(self.ttl_seconds) * 2 or None
+
+    def version(self, key: str) -> int:
+        value = self._client.get(self._version_key(key))
+        return int(value) if value is not None else 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._client.get(self._data_key(key, self.version(key)))
+
+    def set(self, key: str, value: bytes, version: int) -> bool:
+        """Store value under version; it is only ever read if key wasn't invalidated since."""
+        self._client.set(self._data_key(key, version), value, ex=int(self.ttl_seconds) or None)
+        return True
+
+    def delete(self, key: str) -> None:
+        old = self.version(key)
+        version = self._client.incr(self.prefix + "versions")
+        pipeline = self._client.pipeline()
+        pipeline.set(self._version_key(key), version, ex=self._version_ttl())
+        pipeline.delete(self._data_key(key, old))
+        pipeline.execute()
+
+    def clear(self) -> None:
+        # Versions stay, so a load racing the clear can't be stored under a live one
+        for key in self._client.scan_iter(match=self.prefix + "data:*"):
+            self._client.delete(key)
+
+    def stats(self) -> dict:
+        return {"backend": "redis"}
+
+
+class ReadCache:
+    """
+    Read-through cache of ORM rows for hot single-row lookups.
+
+    Rows are stored pickled, so the byte cap is exact and a shared backend
+    can hold them. Hits are merged into the caller's session with
+    load=False, which emits no SQL. Writers register keys with
+    invalidate_on_commit(); they are dropped right after the transaction
+    commits. A load is stored against the key's version read before it
+    started, and the backend refuses (or never serves) it if the key was
+    invalidated in between, so a read racing a write can't put the
+    pre-write row back, in this process or another one.
+    """
+
+    def __init__(self, backend=None):
+        self.backend = backend  # None disables caching
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.invalidations = 0
+        self.errors = 0
+
+    def get_or_load(self, db: Session, key: str, load: Callable[[], Optional[T]]) -> Optional[T]:
+        """Return the cached row for key, attached to db, or load it and cache it. None is never cached."""
+        if self.backend is None:
+            return load()
+
+        data = self._call(self.backend.get, key)
+        if data is not None:
+            self.hits += 1
+            return db.merge(pickle.loads(data), load=False)
+
+        self.misses += 1
+        version = self._call(self.backend.version, key)
+        row = load()
+        if row is not None and version is not None:
+            data = pickle.dumps(row, protocol=pickle.HIGHEST_PROTOCOL)
+            if self._call(self.backend.set, key, data, version):
+                self.stores += 1
+        return row
+
+    def invalidate(self, *keys: str) -> None:
+        """Drop keys now. Prefer invalidate_on_commit() inside a transaction."""
+        if self.backend is None:
+            return
+        for key in keys:
+            self._call(self.backend.delete, key)
+            self.invalidations += 1
+
+    def invalidate_on_commit(self, db: Session, *keys: str) -> None:
+        """Drop keys once db's current transaction commits."""
+        db.info.setdefault(PENDING_INVALIDATIONS, set()).update(keys)
+
+    def clear(self) -> None:
+        if self.backend is not None:
+            self._call(self.backend.clear)
+
+    def _call(self, method, *args):
+        # A failing shared backend degrades to reading from the database
+        try:
+            return method(*args)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Read cache backend error: {e}")
+            return None
+
+    def stats(self) -> dict:
+        """Hit/miss counters for monitoring."""
+        lookups = self.hits + self.misses
+        backend_stats = self.backend.stats() if self.backend is not None else {}
+        return {
+            "enabled": self.backend is not None,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "stores": self.stores,
+            "invalidations": self.invalidations,
+            "errors": self.errors,
+            **backend_stats,
+        }
+
+
+def customer_key(customer_id: int) -> str:
+    return f"customer:{customer_id}"
+
+
+def event_summary_key(event_id: int) -> str:
+    return f"event_summary:{event_id}"
+
+
+def _build_backend():
+    if not settings.read_cache_enabled:
+        return None
+    if settings.read_cache_redis_url:
+        return RedisBackend(settings.read_cache_redis_url, settings.read_cache_ttl_seconds)
+    return MemoryBackend(
+        settings.read_cache_max_entries,
+        settings.read_cache_max_bytes,
+        settings.read_cache_ttl_seconds,
+    )
+
+
+# Global read cache
+read_cache = ReadCache(_build_backend())
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    keys = session.info.pop(PENDING_INVALIDATIONS, None)
+    if keys:
+        read_cache.invalidate(*keys)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_after_rollback(session: Session, previous_transaction) -> None:
+    # Nothing was written, so there is nothing to invalidate
+    session.info.pop(PENDING_INVALIDATIONS, None)
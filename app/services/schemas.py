@@ -1,6 +1,16 @@
 from pydantic import BaseModel, EmailStr, ConfigDict
-from datetime import datetime
-from typing import Optional
+from datetime import date, datetime
+from typing import Dict, Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+# Pagination
+class Page(BaseModel, Generic[T]):
+    """A page of results from a keyset-paginated listing."""
+
+    items: List[T]
+    next_cursor: Optional[str] = None  # Pass back as ?cursor= to fetch the next page
 
 
 # Customer Schemas (B2B Organizations)
@@ -46,6 +56,26 @@ class CustomerResponse(CustomerBase):
     updated_at: datetime
 
 
+class CustomerHealthResponse(BaseModel):
+    """Schema for a customer's health rollup."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    customer_id: int
+    organization_name: Optional[str] = None
+    latest_sentiment: Optional[str] = None  # green, amber or red
+    latest_event_id: Optional[int] = None
+    latest_summary_at: Optional[datetime] = None
+    green_count: int
+    amber_count: int
+    red_count: int
+    open_action_items: int
+    last_meeting_at: Optional[datetime] = None
+    trend_score: Optional[float] = None  # Mean sentiment over the trend window, 1 (green) to -1 (red)
+    recent_sentiments: List[list]  # [timestamp, event_id, sentiment] within the trend window
+    updated_at: Optional[datetime] = None
+
+
 # Event Schemas
 class EventBase(BaseModel):
     """Base event schema."""
@@ -81,6 +111,20 @@ class EventResponse(EventBase):
     updated_at: datetime
 
 
+class EventListItem(EventBase):
+    """Slim event schema for timeline listings; excludes the full transcript."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    event_type: str
+    location: Optional[str] = None  # For meetings
+    transcript_preview: Optional[str] = None  # First characters of the transcript
+    created_at: datetime
+    updated_at: datetime
+    summary: Optional[dict] = None  # Only populated with ?include=summary
+
+
 # Meeting Schemas
 class MeetingBase(EventBase):
     """Base meeting schema."""
@@ -113,3 +157,73 @@ class MeetingResponse(MeetingBase):
     event_type: str
     created_at: datetime
     updated_at: datetime
+    summary_status: Optional[str] = None  # pending/running/done/failed
+
+
+# Summary Job Schemas
+class SummaryJobStatus(BaseModel):
+    """Schema for reporting background summary generation progress."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    event_id: int
+    status: str
+    attempts: int
+    max_attempts: int
+    last_error: Optional[str] = None
+    run_after: datetime
+
+
+# Bulk Ingest Schemas
+class BulkIngestItem(BaseModel):
+    """Per-meeting status within a bulk ingest batch."""
+
+    event_id: int
+    status: Optional[str] = None  # Summary job status; None when there is no transcript to summarize
+    attempts: int = 0
+    last_error: Optional[str] = None
+
+
+class BulkIngestBatch(BaseModel):
+    """Schema for reporting the progress of a bulk ingest batch."""
+
+    batch_id: str
+    total: int
+    counts: Dict[str, int]  # Number of items per summary job status
+    items: List[BulkIngestItem]
+
+
+# Action Item Schemas
+class ActionItemUpdate(BaseModel):
+    """Schema for updating an action item."""
+
+    status: Optional[str] = None  # open or done
+    owner: Optional[str] = None
+    due_date: Optional[date] = None
+
+
+class ActionItemResponse(BaseModel):
+    """Schema for action item response."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    event_id: int
+    customer_id: int
+    position: int
+    text: str
+    status: str
+    owner: Optional[str] = None
+    due_date: Optional[date] = None
+    created_at: datetime
+    updated_at: datetime
+
+
+# Search Schemas
+class SearchHit(BaseModel):
+    """Schema for a full-text search hit."""
+
+    event_id: int
+    customer_id: int
+    rank: float  # Relevance, higher is better (negated bm25 on SQLite, ts_rank_cd on PostgreSQL)
+    snippet: str  # Matched terms are wrapped in **
@@ -0,0 +1,194 @@
+import re
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from typing import List, Optional, Tuple
+
+from app.models.event import Event, Meeting
+from app.models.event_summary import EventSummary
+from app.services.pagination import decode_cursor, encode_cursor
+
+# Markers wrapped around matched terms in snippets (plain text, safe to render)
+SNIPPET_OPEN = "**"
+SNIPPET_CLOSE = "**"
+SNIPPET_TOKENS = 16
+
+# The search_index table is created by migration: an FTS5 virtual table on
+# SQLite (rowid = event ID) or a table with a generated tsvector column and a
+# GIN index on PostgreSQL. It is kept in sync by the event service.
+# Both queries return rank as a higher-is-better relevance score: bm25() is
+# lower-is-better, so it is negated on SQLite.
+
+SQLITE_SEARCH = f"""
+SELECT rowid AS event_id,
+       customer_id,
+       -bm25(search_index, 1.0, 4.0, 2.0) AS rank,
+       snippet(search_index, -1, '{SNIPPET_OPEN}', '{SNIPPET_CLOSE}', '…', {SNIPPET_TOKENS}) AS snippet
+FROM search_index
+WHERE search_index MATCH :query
+  AND (:customer_id IS NULL OR customer_id = :customer_id)
+ORDER BY rank DESC, rowid
+LIMIT :limit OFFSET :offset
+"""
+
+POSTGRES_SEARCH = f"""
+SELECT event_id,
+       customer_id,
+       ts_rank_cd(document, query) AS rank,
+       ts_headline(
+           'english',
+           coalesce(tldr, '') || ' ' || coalesce(action_items, '') || ' ' || coalesce(transcript, ''),
+           query,
+           'StartSel={SNIPPET_OPEN}, StopSel={SNIPPET_CLOSE}, MaxWords={SNIPPET_TOKENS}, MinWords=5'
+       ) AS snippet
+FROM search_index, websearch_to_tsquery('english', :query) AS query
+WHERE document @@ query
+  AND (CAST(:customer_id AS INTEGER) IS NULL OR customer_id = :customer_id)
+ORDER BY rank DESC, event_id
+LIMIT :limit OFFSET :offset
+"""
+
+SQLITE_REBUILD = """
+INSERT INTO search_index (rowid, transcript, tldr, action_items, customer_id)
+SELECT e.id,
+       m.transcript,
+       json_extract(s.summary_json, '$.tldr'),
+       (SELECT group_concat(value, char(10)) FROM json_each(s.summary_json, '$.action_items')),
+       e.customer_id
+FROM events e
+JOIN meetings m ON m.id = e.id
+LEFT JOIN event_summaries s ON s.event_id = e.id
+"""
+
+POSTGRES_REBUILD = """
+INSERT INTO search_index (event_id, customer_id, transcript, tldr, action_items)
+SELECT e.id,
+       e.customer_id,
+       m.transcript,
+       s.summary_json ->> 'tldr',
+       (SELECT string_agg(value, E'\\n') FROM json_array_elements_text(s.summary_json -> 'action_items') AS value)
+FROM events e
+JOIN meetings m ON m.id = e.id
+LEFT JOIN event_summaries s ON s.event_id = e.id
+"""
+
+
+def _dialect(db: Session) -> str:
+    return db.get_bind().dialect.name
+
+
+def build_match_query(query: str) -> str:
+    """
+    Turn free text into a safe FTS5 query that matches all of its words.
+
+    Each word is quoted so FTS5 operators and punctuation in user input
+    can't produce syntax errors.
+
+    Raises:
+        ValueError: If the query contains no searchable words
+    """
+    words = re.findall(r"\w+", query)
+    if not words:
+        raise ValueError("Search query must contain at least one word")
+    return " ".join(f'"{word}"' for word in words)
+
+
+def _summary_text(summary_json: Optional[dict]) -> Tuple[Optional[str], Optional[str]]:
+    if not summary_json:
+        return None, None
+    action_items = summary_json.get("action_items") or []
+    return summary_json.get("tldr"), "\n".join(str(item) for item in action_items)
+
+
+def index_event(db: Session, event_id: int) -> None:
+    """(Re)index a meeting's transcript and summary. Joins the caller's transaction."""
+    row = (
+        db.query(Event.customer_id, Meeting.transcript, EventSummary.summary_json)
+        .select_from(Meeting)
+        .outerjoin(EventSummary, EventSummary.event_id == Meeting.id)
+        .filter(Meeting.id == event_id)
+        .first()
+    )
+    remove_event(db, event_id)
+    if row is None:
+        return
+
+    tldr, action_items = _summary_text(row.summary_json)
+    params = {
+        "event_id": event_id,
+        "customer_id": row.customer_id,
+        "transcript": row.transcript,
+        "tldr": tldr,
+        "action_items": action_items,
+    }
+    if _dialect(db) == "sqlite":
+        db.execute(
+            text(
+                "INSERT INTO search_index (rowid, transcript, tldr, action_items, customer_id) "
+                "VALUES (:event_id, :transcript, :tldr, :action_items, :customer_id)"
+            ),
+            params,
+        )
+    else:
+        db.execute(
+            text(
+                "INSERT INTO search_index (event_id, customer_id, transcript, tldr, action_items) "
+                "VALUES (:event_id, :customer_id, :transcript, :tldr, :action_items)"
+            ),
+            params,
+        )
+
+
+def remove_event(db: Session, event_id: int) -> None:
+    """Remove an event from the search index."""
+    key = "rowid" if _dialect(db) == "sqlite" else "event_id"
+    db.execute(text(f"DELETE FROM search_index WHERE {key} = :event_id"), {"event_id": event_id})
+
+
+def remove_customer(db: Session, customer_id: int) -> None:
+    """Remove all of a customer's events from the search index."""
+    db.execute(
+        text("DELETE FROM search_index WHERE customer_id = :customer_id"), {"customer_id": customer_id}
+    )
+
+
+def rebuild_search_index(db: Session, commit: bool = True) -> None:
+    """Rebuild the whole search index from meetings and summaries in one statement."""
+    db.execute(text("DELETE FROM search_index"))
+    db.execute(text(SQLITE_REBUILD if _dialect(db) == "sqlite" else POSTGRES_REBUILD))
+    if commit:
+        db.commit()
+
+
+def search(
+    db: Session,
+    query: str,
+    customer_id: Optional[int] = None,
+    cursor: Optional[str] = None,
+    limit: int = 20,
+) -> Tuple[List[dict], Optional[str]]:
+    """
+    Full-text search over meeting transcripts, summaries and action items.
+
+    Hits are ordered by relevance, so pages are addressed by offset (encoded
+    in the opaque cursor) rather than by a seek key.
+
+    Returns:
+        Tuple of (hits, cursor for the next page or None on the last page)
+
+    Raises:
+        ValueError: If the query has no searchable words or the cursor is invalid
+    """
+    offset = decode_cursor(cursor, int)[0] if cursor else 0
+    if _dialect(db) == "sqlite":
+        sql, match = SQLITE_SEARCH, build_match_query(query)
+    else:
+        sql, match = POSTGRES_SEARCH, query
+
+    rows = db.execute(
+        text(sql),
+        {"query": match, "customer_id": customer_id, "limit": limit + 1, "offset": offset},
+    ).all()
+
+    hits = [dict(row._mapping) for row in rows[:limit]]
+    next_cursor = encode_cursor(offset + limit) if len(rows) > limit else None
+    return hits, next_cursor
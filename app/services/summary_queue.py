@@ -0,0 +1,176 @@
+from datetime import datetime, timedelta
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from typing import List, Optional
+
+from app.config import settings
+from app.models.summary_job import (
+    SummaryJob,
+    SUMMARY_PENDING,
+    SUMMARY_RUNNING,
+    SUMMARY_DONE,
+    SUMMARY_FAILED,
+)
+
+
+def get_summary_job(db: Session, event_id: int) -> Optional[SummaryJob]:
+    """Get the summary job for an event."""
+    return db.query(SummaryJob).filter(SummaryJob.event_id == event_id).first()
+
+
+def enqueue_summary_job(db: Session, event_id: int, commit: bool = True) -> SummaryJob:
+    """Queue (or requeue) summarization for an event."""
+    job = get_summary_job(db, event_id)
+    if job is None:
+        job = SummaryJob(event_id=event_id)
+        db.add(job)
+
+    job.status = SUMMARY_PENDING
+    job.attempts = 0
+    job.max_attempts = settings.summary_job_max_attempts
+    job.last_error = None
+    job.run_after = datetime.now()
+    job.started_at = None
+    job.finished_at = None
+
+    if commit:
+        db.commit()
+        db.refresh(job)
+    else:
+        db.flush()
+    return job
+
+
+def remove_summary_job(db: Session, event_id: int) -> None:
+    """Delete an event's summary job. Joins the caller's transaction."""
+    db.query(SummaryJob).filter(SummaryJob.event_id == event_id).delete(synchronize_session=False)
+
+
+def enqueue_summary_jobs(
+    db: Session, event_ids: List[int], batch_id: str, batch_size: int = 1000
+) -> None:
+    """
+    Queue summarization for many newly created events as one batch. Joins the caller's transaction.
+
+    Like enqueue_summary_job, an existing job for an event is reset rather
+    than duplicated, so a row left behind for a reused event ID can't fail
+    the batch. Rows are upserted batch_size at a time to stay under the
+    database's bound parameter limit.
+    """
+    insert = sqlite_insert if db.get_bind().dialect.name == "sqlite" else postgresql_insert
+    now = datetime.now()
+    reset = (
+        "batch_id", "status", "attempts", "max_attempts", "last_error",
+        "run_after", "started_at", "finished_at", "updated_at",
+    )
+    for start in range(0, len(event_ids), batch_size):
+        statement = insert(SummaryJob).values([
+            {
+                "event_id": event_id,
+                "batch_id": batch_id,
+                "status": SUMMARY_PENDING,
+                "attempts": 0,
+                "max_attempts": settings.summary_job_max_attempts,
+                "last_error": None,
+                "run_after": now,
+                "started_at": None,
+                "finished_at": None,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for event_id in event_ids[start:start + batch_size]
+        ])
+        db.execute(
+            statement.on_conflict_do_update(
+                index_elements=[SummaryJob.event_id],
+                set_={column: statement.excluded[column] for column in reset},
+            )
+        )
+    db.flush()
+
+
+def get_batch_jobs(db: Session, batch_id: str) -> List[SummaryJob]:
+    """Get the summary jobs of a bulk ingest batch, in creation order."""
+    return (
+        db.query(SummaryJob)
+        .filter(SummaryJob.batch_id == batch_id)
+        .order_by(SummaryJob.event_id)
+        .all()
+    )
+
+
+def claim_next_job(db: Session) -> Optional[SummaryJob]:
+    """
+    Atomically claim the oldest runnable job and mark it as running.
+
+    The conditional UPDATE makes claiming safe across several workers (or
+    processes) sharing one database: only one of them sees a rowcount of 1.
+    """
+    while True:
+        now = datetime.now()
+        candidate_id = (
+            db.query(SummaryJob.id)
+            .filter(SummaryJob.status == SUMMARY_PENDING, SummaryJob.run_after <= now)
+            .order_by(SummaryJob.run_after, SummaryJob.id)
+            .limit(1)
+            .scalar()
+        )
+        if candidate_id is None:
+            return None
+
+        claimed = (
+            db.query(SummaryJob)
+            .filter(SummaryJob.id == candidate_id, SummaryJob.status == SUMMARY_PENDING)
+            .update(
+                {
+                    SummaryJob.status: SUMMARY_RUNNING,
+                    SummaryJob.attempts: SummaryJob.attempts + 1,
+                    SummaryJob.started_at: now,
+                    SummaryJob.updated_at: now,
+                },
+                synchronize_session=False,
+            )
+        )
+        db.commit()
+        if claimed:
+            return db.get(SummaryJob, candidate_id)
+        # Another worker won the race; try the next candidate
+
+
+def mark_job_done(db: Session, job: SummaryJob) -> SummaryJob:
+    """Mark a job as successfully completed."""
+    job.status = SUMMARY_DONE
+    job.last_error = None
+    job.finished_at = datetime.now()
+    db.commit()
+    return job
+
+
+def mark_job_failed(db: Session, job: SummaryJob, error: str) -> SummaryJob:
+    """Record a failed attempt, scheduling a retry with exponential backoff."""
+    job.last_error = error
+    if job.attempts >= job.max_attempts:
+        job.status = SUMMARY_FAILED
+        job.finished_at = datetime.now()
+    else:
+        delay = settings.summary_job_backoff_seconds * (2 ** (job.attempts - 1))
+        job.status = SUMMARY_PENDING
+        job.run_after = datetime.now() + timedelta(seconds=delay)
+    db.commit()
+    return job
+
+
+def requeue_stale_jobs(db: Session, older_than_seconds: int) -> int:
+    """Return jobs left running by a crashed worker to the queue."""
+    cutoff = datetime.now() - timedelta(seconds=older_than_seconds)
+    count = (
+        db.query(SummaryJob)
+        .filter(SummaryJob.status == SUMMARY_RUNNING, SummaryJob.started_at < cutoff)
+        .update(
+            {SummaryJob.status: SUMMARY_PENDING, SummaryJob.run_after: datetime.now()},
+            synchronize_session=False,
+        )
+    )
+    db.commit()
+    return count
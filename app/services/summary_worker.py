@@ -0,0 +1,210 @@
+import asyncio
+import logging
+from typing import Callable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.event import Meeting
+from app.models.summary_job import SummaryJob
+from app.services import event_service, health_service, summary_queue
+from app.services.llm_service import get_llm_service
+
+logger = logging.getLogger(__name__)
+
+
+class SummaryWorkerPool:
+    """
+    Pool of asyncio workers draining the summary job queue.
+
+    LLM calls are awaited on the event loop and database work runs in worker
+    threads, so a summarization never holds up the requests being served.
+    The pool also ages customer health trend windows every
+    customer_health_sweep_interval seconds.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        llm=None,
+        concurrency: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+    ):
+        self.session_factory = session_factory
+        self._llm = llm
+        self.concurrency = concurrency or settings.summary_worker_concurrency
+        self.poll_interval = poll_interval or settings.summary_worker_poll_interval
+        self._tasks: List[asyncio.Task] = []
+        self._stopping = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._stopped: Optional[asyncio.Event] = None
+
+    @property
+    def llm(self):
+        """LLM service used for jobs; injectable so tests can pass a stub."""
+        return self._llm or get_llm_service()
+
+    async def start(self) -> None:
+        """Requeue stale jobs and start the worker tasks."""
+        if self._tasks:
+            return
+        self._stopping = False
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._stopped = asyncio.Event()
+
+        requeued = await asyncio.to_thread(self._requeue_stale_jobs)
+        if requeued:
+            logger.info(f"Requeued {requeued} stale summary jobs")
+
+        self._tasks = [
+            asyncio.create_task(self._run(), name=f"summary-worker-{i}")
+            for i in range(self.concurrency)
+        ]
+        if settings.customer_health_sweep_interval > 0:
+            self._tasks.append(asyncio.create_task(self._sweep_health(), name="customer-health-sweep"))
+
+    async def stop(self, timeout: float = 30.0) -> None:
+        """Stop the workers, letting in-flight jobs finish within the timeout."""
+        if not self._tasks:
+            return
+        self._stopping = True
+        self._wakeup.set()
+        self._stopped.set()
+        done, pending = await asyncio.wait(self._tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        self._tasks = []
+
+    def notify(self) -> None:
+        """Wake idle workers after new jobs are queued. Safe to call from any thread."""
+        if self._loop is not None and self._wakeup is not None:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    async def run_once(self) -> bool:
+        """Claim and process a single job. Returns False if the queue was empty."""
+        job_id = await asyncio.to_thread(self._claim_next_job_id)
+        if job_id is None:
+            return False
+        await self.process_job(job_id)
+        return True
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            try:
+                processed = await self.run_once()
+            except Exception as e:
+                logger.error(f"Summary worker error: {e}", exc_info=True)
+                processed = False
+
+            if not processed and not self._stopping:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def _sweep_health(self) -> None:
+        while not self._stopping:
+            try:
+                aged = await asyncio.to_thread(self._age_customer_trends)
+                if aged:
+                    logger.info(f"Aged the trend window of {aged} customers")
+            except Exception as e:
+                logger.error(f"Customer health sweep error: {e}", exc_info=True)
+            try:
+                await asyncio.wait_for(self._stopped.wait(), settings.customer_health_sweep_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def _age_customer_trends(self) -> int:
+        db = self.session_factory()
+        try:
+            return health_service.age_customer_trends(db)
+        finally:
+            db.close()
+
+    def _requeue_stale_jobs(self) -> int:
+        db = self.session_factory()
+        try:
+            return summary_queue.requeue_stale_jobs(
+                db, settings.summary_job_stale_after_seconds
+            )
+        finally:
+            db.close()
+
+    def _claim_next_job_id(self) -> Optional[int]:
+        db = self.session_factory()
+        try:
+            job = summary_queue.claim_next_job(db)
+            return job.id if job else None
+        finally:
+            db.close()
+
+    async def process_job(self, job_id: int) -> None:
+        """
+        Extract participants and generate the summary for a claimed job.
+
+        No database session is held while the LLM calls are in flight.
+        """
+        try:
+            meeting = await asyncio.to_thread(self._load_meeting, job_id)
+            if meeting is not None:
+                event_id, customer_id, transcript, participants = meeting
+                # The first job creates the shared LLM service; keep its slow imports off the loop
+                llm = await asyncio.to_thread(lambda: self.llm)
+                result = await llm.aanalyze_meeting(
+                    transcript,
+                    meeting_id=event_id,
+                    extract_participants=not participants,
+                    customer_id=customer_id,
+                )
+                await asyncio.to_thread(self._save_result, event_id, result)
+            await asyncio.to_thread(self._finish_job, job_id, None)
+        except Exception as e:
+            logger.error(f"Summary job {job_id} failed: {e}", exc_info=True)
+            await asyncio.to_thread(self._finish_job, job_id, str(e))
+
+    def _load_meeting(self, job_id: int) -> Optional[Tuple[int, int, str, Optional[str]]]:
+        db = self.session_factory()
+        try:
+            job = db.get(SummaryJob, job_id)
+            meeting = db.get(Meeting, job.event_id) if job else None
+            if meeting is None or not meeting.transcript:
+                # Meeting was deleted or its transcript removed after queueing
+                return None
+            return meeting.id, meeting.customer_id, meeting.transcript, meeting.participants
+        finally:
+            db.close()
+
+    def _save_result(self, event_id: int, result: dict) -> None:
+        db = self.session_factory()
+        try:
+            if result["participants"]:
+                meeting = db.get(Meeting, event_id)
+                if meeting is not None and not meeting.participants:
+                    meeting.participants = result["participants"]
+            event_service.save_event_summary(
+                db, event_id, result["summary"], prompt_version=result["prompt_version"]
+            )
+        finally:
+            db.close()
+
+    def _finish_job(self, job_id: int, error: Optional[str]) -> None:
+        db = self.session_factory()
+        try:
+            job = db.get(SummaryJob, job_id)
+            if job is None:
+                return
+            if error is None:
+                summary_queue.mark_job_done(db, job)
+            else:
+                summary_queue.mark_job_failed(db, job, error)
+        finally:
+            db.close()
+
+
+# Global summary worker pool
+summary_worker_pool = SummaryWorkerPool()
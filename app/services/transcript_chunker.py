@@ -0,0 +1,85 @@
+import re
+from typing import List
+
+# Rough OpenAI-style tokenizer ratio for English text; keeps chunking offline
+CHARS_PER_TOKEN = 4
+
+# "Name:" or "Name (Role):" at the start of a line opens a new speaker turn
+SPEAKER_TURN = re.compile(r"^[^\s:][^:\n]{0,80}:\s")
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of model tokens in a piece of text."""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def split_speaker_turns(transcript: str) -> List[str]:
+    """
+    Split a transcript into speaker turns.
+
+    Lines that don't start with a speaker label (wrapped text, headers)
+    stay attached to the preceding turn.
+    """
+    turns: List[str] = []
+    current: List[str] = []
+    for line in transcript.splitlines(keepends=True):
+        if SPEAKER_TURN.match(line) and current:
+            turns.append("".join(current))
+            current = []
+        current.append(line)
+    if current:
+        turns.append("".join(current))
+    return turns
+
+
+def _split_oversized(turn: str, max_tokens: int) -> List[str]:
+    """Split a single turn that exceeds the budget on sentence, then word, boundaries."""
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    pieces: List[str] = []
+    current = ""
+    for sentence in re.split(r"(?<=[.!?])\s+", turn):
+        if current and len(sentence) > max_chars:
+            # Flush first so the sentence's pieces don't jump ahead of it
+            pieces.append(current)
+            current = ""
+        while len(sentence) > max_chars:
+            cut = sentence.rfind(" ", 0, max_chars)
+            cut = cut if cut > 0 else max_chars
+            pieces.append(sentence[:cut])
+            sentence = sentence[cut:].lstrip()
+        if current and len(current) + len(sentence) + 1 > max_chars:
+            pieces.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def chunk_transcript(transcript: str, max_tokens: int) -> List[str]:
+    """
+    Pack whole speaker turns into chunks of at most max_tokens (estimated).
+
+    Turns are never split across chunks unless a single turn is larger than
+    the budget on its own.
+    """
+    chunks: List[str] = []
+    current: List[str] = []
+    current_tokens = 0
+    for turn in split_speaker_turns(transcript):
+        turn_tokens = estimate_tokens(turn)
+        if turn_tokens > max_tokens:
+            pieces = [f"{piece}\n" for piece in _split_oversized(turn, max_tokens)]
+        else:
+            pieces = [turn]
+        for piece in pieces:
+            piece_tokens = estimate_tokens(piece)
+            if current and current_tokens + piece_tokens > max_tokens:
+                chunks.append("".join(current))
+                current, current_tokens = [], 0
+            current.append(piece)
+            current_tokens += piece_tokens
+    if current:
+        chunks.append("".join(current))
+    return chunks
@@ -1,7 +1,8 @@
-import { useState, useEffect } from 'react'
+import { useState, useEffect, useRef } from 'react'
 import { useParams, Link } from 'react-router-dom'
 import axios from 'axios'
 import { API_BASE_URL } from '../config'
+import { postEventStream } from '../sse'
 import CustomerFormModal, { CustomerFormData } from '../components/CustomerFormModal'
 
 interface Customer {
@@ -23,7 +24,8 @@ interface Event {
   event_type: string
   timestamp: string
   participants: string | null
-  transcript?: string | null
+  transcript?: string | null // Only present on the full event, not list items
+  transcript_preview?: string | null
   location?: string | null
 }
 
@@ -34,17 +36,38 @@ interface EventSummary {
   sentiment_explanation: string
 }
 
+interface EventWithSummary extends Event {
+  summary: EventSummary | null
+}
+
+interface SummaryJobStatus {
+  event_id: number
+  status: 'pending' | 'running' | 'done' | 'failed'
+  attempts: number
+  max_attempts: number
+  last_error: string | null
+}
+
+const SUMMARY_POLL_INTERVAL_MS = 3000
+
+const SENTIMENTS = ['green', 'amber', 'red']
 
 function CustomerDetails() {
   const { id } = useParams<{ id: string }>()
   const [customer, setCustomer] = useState<Customer | null>(null)
   const [events, setEvents] = useState<Event[]>([])
+  const [nextEventsCursor, setNextEventsCursor] = useState<string | null>(null)
+  const [loadingMoreEvents, setLoadingMoreEvents] = useState(false)
   const [selectedEvent, setSelectedEvent] = useState<Event | null>(null)
   const [eventSummary, setEventSummary] = useState<EventSummary | null>(null)
+  // Fields of a summary that is still being streamed in
+  const [summaryDraft, setSummaryDraft] = useState<Partial<EventSummary> | null>(null)
   const [eventSummaries, setEventSummaries] = useState<Record<number, EventSummary>>({})
   const [summaryNotFound, setSummaryNotFound] = useState(false)
+  const [summaryJob, setSummaryJob] = useState<SummaryJobStatus | null>(null)
   const [loading, setLoading] = useState(true)
   const [regeneratingSummary, setRegeneratingSummary] = useState(false)
+  const selectedEventIdRef = useRef<number | null>(null)
   const [deletingEvent, setDeletingEvent] = useState(false)
   const [showEditModal, setShowEditModal] = useState(false)
   const [formData, setFormData] = useState<CustomerFormData>({
@@ -76,34 +99,40 @@ function CustomerDetails() {
     }
   }
 
-  const fetchCustomerEvents = async () => {
+  const fetchCustomerEvents = async (cursor: string | null = null) => {
     try {
+      // Summaries are embedded in the same response to avoid one request per event
       const response = await axios.get(
-        `${API_BASE_URL}/api/events/customer/${id}`
+        `${API_BASE_URL}/api/events/customer/${id}`,
+        { params: { include: 'summary', ...(cursor ? { cursor } : {}) } }
       )
-      const eventsData = response.data
-      setEvents(eventsData)
+      const eventsData: EventWithSummary[] = response.data.items
+      setEvents(prev => (cursor ? [...prev, ...eventsData] : eventsData))
+      setNextEventsCursor(response.data.next_cursor)
 
-      // Fetch summaries for all events
       const summariesMap: Record<number, EventSummary> = {}
-      await Promise.all(
-        eventsData.map(async (event: Event) => {
-          try {
-            const summaryResponse = await axios.get(
-              `${API_BASE_URL}/api/events/${event.id}/summary`
-            )
-            summariesMap[event.id] = summaryResponse.data
-          } catch (error) {
-            // Summary doesn't exist, that's okay
-          }
-        })
-      )
-      setEventSummaries(summariesMap)
+      eventsData.forEach((event) => {
+        if (event.summary) {
+          summariesMap[event.id] = event.summary
+        }
+      })
+      setEventSummaries(prev => (cursor ? { ...prev, ...summariesMap } : summariesMap))
     } catch (error) {
       console.error('Error fetching events:', error)
     }
   }
 
+  const handleLoadMoreEvents = async () => {
+    if (!nextEventsCursor) return
+
+    setLoadingMoreEvents(true)
+    try {
+      await fetchCustomerEvents(nextEventsCursor)
+    } finally {
+      setLoadingMoreEvents(false)
+    }
+  }
+
   const formatDate = (dateString: string) => {
     // Parse the datetime string as-is without timezone interpretation
     // The backend stores naive datetime, so we display it as-is
@@ -117,43 +146,103 @@ function CustomerDetails() {
     })
   }
 
-  const handleEventClick = async (event: Event) => {
-    setSelectedEvent(event)
-    setEventSummary(null) // Reset summary
-    setSummaryNotFound(false)
-
-    // Fetch summary for this event
+  const fetchEventSummary = async (event: Event) => {
     try {
       const response = await axios.get(
         `${API_BASE_URL}/api/events/${event.id}/summary`
       )
+      if (response.status === 202) {
+        setSummaryJob(response.data)
+        return
+      }
+      setSummaryJob(null)
       setEventSummary(response.data)
+      setEventSummaries(prev => ({ ...prev, [event.id]: response.data }))
     } catch (error) {
       console.error('Error fetching summary:', error)
+      setSummaryJob(null)
       setSummaryNotFound(true)
     }
   }
 
+  // Poll while the background summary job is still pending or running
+  useEffect(() => {
+    if (!selectedEvent || !summaryJob) return
+    const timer = setTimeout(
+      () => fetchEventSummary(selectedEvent),
+      SUMMARY_POLL_INTERVAL_MS
+    )
+    return () => clearTimeout(timer)
+  }, [selectedEvent, summaryJob])
+
+  const fetchEventDetails = async (event: Event) => {
+    // List items omit the transcript, so load the full event for the modal
+    try {
+      const response = await axios.get(`${API_BASE_URL}/api/events/${event.id}`)
+      setSelectedEvent(current =>
+        current && current.id === event.id ? { ...current, ...response.data } : current
+      )
+    } catch (error) {
+      console.error('Error fetching event:', error)
+    }
+  }
+
+  useEffect(() => {
+    selectedEventIdRef.current = selectedEvent ? selectedEvent.id : null
+  }, [selectedEvent])
+
+  const handleEventClick = async (event: Event) => {
+    setSelectedEvent(event)
+    setEventSummary(null) // Reset summary
+    setSummaryNotFound(false)
+    setSummaryJob(null)
+
+    // Fetch the full event and its summary in parallel
+    await Promise.all([fetchEventDetails(event), fetchEventSummary(event)])
+  }
+
   const handleRegenerateSummary = async () => {
     if (!selectedEvent) return
 
+    const eventId = selectedEvent.id
+    // The modal may have moved on to another event by the time the stream ends
+    const isShown = () => selectedEventIdRef.current === eventId
+
     setRegeneratingSummary(true)
     try {
-      const response = await axios.post(
-        `${API_BASE_URL}/api/events/${selectedEvent.id}/summary/regenerate`
+      // Streamed, so the summary appears field by field while it is being written
+      let summary = null as EventSummary | null
+      await postEventStream(
+        `${API_BASE_URL}/api/events/${eventId}/summary/regenerate/stream`,
+        ({ event, data }) => {
+          const payload = JSON.parse(data)
+          if (event === 'error') {
+            throw new Error(payload.detail)
+          } else if (event === 'partial' && isShown()) {
+            setSummaryDraft(payload)
+          } else if (event === 'summary') {
+            summary = payload
+          }
+        }
       )
-      setEventSummary(response.data)
-      setSummaryNotFound(false)
+      if (!summary) throw new Error('Summary stream ended early')
+
+      const newSummary = summary
+      if (isShown()) {
+        setEventSummary(newSummary)
+        setSummaryNotFound(false)
+      }
       // Update the summaries map so the timeline shows the new sentiment
       setEventSummaries(prev => ({
         ...prev,
-        [selectedEvent.id]: response.data
+        [eventId]: newSummary
       }))
     } catch (error) {
       console.error('Error regenerating summary:', error)
-      alert('Failed to regenerate summary. Please try again.')
+      if (isShown()) alert('Failed to regenerate summary. Please try again.')
     } finally {
       setRegeneratingSummary(false)
+      setSummaryDraft(null)
     }
   }
 
@@ -228,6 +317,9 @@ function CustomerDetails() {
     setShowEditModal(false)
   }
 
+  // While a summary is streaming in, show what has arrived so far
+  const shownSummary: Partial<EventSummary> | null = summaryDraft ?? eventSummary
+
   const getSentimentColor = (sentiment: string) => {
     switch (sentiment) {
       case 'green':
@@ -386,6 +478,18 @@ function CustomerDetails() {
             })}
           </div>
         )}
+
+        {nextEventsCursor && (
+          <div className="mt-4 text-center">
+            <button
+              onClick={handleLoadMoreEvents}
+              disabled={loadingMoreEvents}
+              className="bg-gray-200 hover:bg-gray-300 text-gray-800 font-semibold py-2 px-4 rounded disabled:opacity-50 disabled:cursor-not-allowed"
+            >
+              {loadingMoreEvents ? 'Loading...' : 'Load more'}
+            </button>
+          </div>
+        )}
       </div>
 
       {/* Event Detail Modal */}
@@ -412,7 +516,21 @@ function CustomerDetails() {
 
               <div className="space-y-4">
                 {/* AI Summary Section */}
-                {summaryNotFound && (
+                {summaryJob && (
+                  <div className="bg-gray-50 border border-gray-300 rounded-lg p-4 mb-4">
+                    <h4 className="text-md font-bold text-gray-900 mb-2">
+                      📊 AI-Generated Summary
+                    </h4>
+                    <p className="text-gray-600 text-sm">
+                      {summaryJob.status === 'running'
+                        ? 'Generating summary...'
+                        : 'Summary is queued for generation...'}
+                      {summaryJob.attempts > 0 &&
+                        ` (attempt ${summaryJob.attempts} of ${summaryJob.max_attempts})`}
+                    </p>
+                  </div>
+                )}
+                {summaryNotFound && !summaryDraft && (
                   <div className="bg-gray-50 border border-gray-300 rounded-lg p-4 mb-4">
                     <div className="flex justify-between items-start">
                       <div>
@@ -421,10 +539,10 @@ function CustomerDetails() {
                         </h4>
                         <p className="text-gray-600 text-sm">
                           No summary available for this event.
-                          {selectedEvent?.transcript && ' Click "Generate Summary" to create one.'}
+                          {selectedEvent?.transcript_preview && ' Click "Generate Summary" to create one.'}
                         </p>
                       </div>
-                      {selectedEvent?.transcript && (
+                      {selectedEvent?.transcript_preview && (
                         <button
                           onClick={handleRegenerateSummary}
                           disabled={regeneratingSummary}
@@ -436,11 +554,16 @@ function CustomerDetails() {
                     </div>
                   </div>
                 )}
-                {eventSummary && (
+                {shownSummary && (
                   <div className="bg-blue-50 border border-blue-200 rounded-lg p-4 mb-4">
                     <div className="flex justify-between items-center mb-3">
                       <h4 className="text-md font-bold text-gray-900">
                         📊 AI-Generated Summary
+                        {summaryDraft && (
+                          <span className="ml-2 text-xs font-normal text-gray-500 animate-pulse">
+                            Writing...
+                          </span>
+                        )}
                       </h4>
                       <button
                         onClick={handleRegenerateSummary}
@@ -451,43 +574,47 @@ function CustomerDetails() {
                       </button>
                     </div>
 
-                    {/* Sentiment Badge */}
-                    <div className="mb-3">
-                      <span
-                        className={`inline-block px-3 py-1 text-sm font-semibold rounded border ${getSentimentColor(
-                          eventSummary.sentiment
-                        )}`}
-                      >
-                        Sentiment: {eventSummary.sentiment.toUpperCase()}
-                      </span>
-                    </div>
+                    {/* Sentiment Badge (once the whole value has arrived) */}
+                    {shownSummary.sentiment && SENTIMENTS.includes(shownSummary.sentiment) && (
+                      <div className="mb-3">
+                        <span
+                          className={`inline-block px-3 py-1 text-sm font-semibold rounded border ${getSentimentColor(
+                            shownSummary.sentiment
+                          )}`}
+                        >
+                          Sentiment: {shownSummary.sentiment.toUpperCase()}
+                        </span>
+                      </div>
+                    )}
 
                     {/* TL;DR */}
                     <div className="mb-3">
                       <p className="text-sm font-semibold text-gray-700 mb-1">
                         TL;DR
                       </p>
-                      <p className="text-gray-900">{eventSummary.tldr}</p>
+                      <p className="text-gray-900">{shownSummary.tldr}</p>
                     </div>
 
                     {/* Sentiment Explanation */}
-                    <div className="mb-3">
-                      <p className="text-sm font-semibold text-gray-700 mb-1">
-                        Sentiment Analysis
-                      </p>
-                      <p className="text-gray-900">
-                        {eventSummary.sentiment_explanation}
-                      </p>
-                    </div>
+                    {shownSummary.sentiment_explanation !== undefined && (
+                      <div className="mb-3">
+                        <p className="text-sm font-semibold text-gray-700 mb-1">
+                          Sentiment Analysis
+                        </p>
+                        <p className="text-gray-900">
+                          {shownSummary.sentiment_explanation}
+                        </p>
+                      </div>
+                    )}
 
                     {/* Action Items */}
-                    {eventSummary.action_items.length > 0 && (
+                    {shownSummary.action_items && shownSummary.action_items.length > 0 && (
                       <div>
                         <p className="text-sm font-semibold text-gray-700 mb-1">
                           Action Items
                         </p>
                         <ul className="list-disc list-inside space-y-1">
-                          {eventSummary.action_items.map((item, index) => (
+                          {shownSummary.action_items.map((item, index) => (
                             <li key={index} className="text-gray-900">
                               {item}
                             </li>
@@ -20,6 +20,8 @@ interface Customer {
 function Customers() {
   const navigate = useNavigate()
   const [customers, setCustomers] = useState<Customer[]>([])
+  const [nextCursor, setNextCursor] = useState<string | null>(null)
+  const [loadingMore, setLoadingMore] = useState(false)
   const [loading, setLoading] = useState(true)
   const [showModal, setShowModal] = useState(false)
   const [editingCustomer, setEditingCustomer] = useState<Customer | null>(null)
@@ -41,7 +43,8 @@ function Customers() {
   const fetchCustomers = async () => {
     try {
       const response = await axios.get(`${API_BASE_URL}/api/customers/`)
-      setCustomers(response.data)
+      setCustomers(response.data.items)
+      setNextCursor(response.data.next_cursor)
     } catch (error) {
       console.error('Error fetching customers:', error)
     } finally {
@@ -49,6 +52,23 @@ function Customers() {
     }
   }
 
+  const fetchMoreCustomers = async () => {
+    if (!nextCursor) return
+
+    setLoadingMore(true)
+    try {
+      const response = await axios.get(`${API_BASE_URL}/api/customers/`, {
+        params: { cursor: nextCursor },
+      })
+      setCustomers(prev => [...prev, ...response.data.items])
+      setNextCursor(response.data.next_cursor)
+    } catch (error) {
+      console.error('Error fetching customers:', error)
+    } finally {
+      setLoadingMore(false)
+    }
+  }
+
   const handleInputChange = (
     e: React.ChangeEvent<HTMLInputElement | HTMLTextAreaElement>
   ) => {
@@ -209,6 +229,18 @@ function Customers() {
         </table>
       </div>
 
+      {nextCursor && (
+        <div className="mt-4 text-center">
+          <button
+            onClick={fetchMoreCustomers}
+            disabled={loadingMore}
+            className="bg-gray-200 hover:bg-gray-300 text-gray-800 font-semibold py-2 px-4 rounded disabled:opacity-50 disabled:cursor-not-allowed"
+          >
+            {loadingMore ? 'Loading...' : 'Load more'}
+          </button>
+        </div>
+      )}
+
       <CustomerFormModal
         isOpen={showModal}
         isEditing={!!editingCustomer}
@@ -0,0 +1,50 @@
+/**
+ * Server-Sent Events over POST.
+ *
+ * EventSource can only GET, so the response body is read with fetch and
+ * split into events here. Only the `event:` and `data:` fields are used.
+ */
+
+export interface ServerSentEvent {
+  event: string
+  data: string
+}
+
+export async function postEventStream(
+  url: string,
+  onEvent: (event: ServerSentEvent) => void,
+  signal?: AbortSignal
+): Promise<void> {
+  const response = await fetch(url, {
+    method: 'POST',
+    headers: { Accept: 'text/event-stream' },
+    signal,
+  })
+  if (!response.ok || !response.body) {
+    throw new Error(`Request failed with status ${response.status}`)
+  }
+
+  const reader = response.body.pipeThrough(new TextDecoderStream()).getReader()
+  let buffer = ''
+  for (;;) {
+    const { value, done } = await reader.read()
+    if (done) break
+    // Normalize line endings, keeping a trailing \r in case its \n is in the next chunk
+    buffer = (buffer + value).replace(/\r\n|\r(?!$)/g, '\n')
+
+    let boundary = buffer.indexOf('\n\n')
+    while (boundary !== -1) {
+      const block = buffer.slice(0, boundary)
+      buffer = buffer.slice(boundary + 2)
+      boundary = buffer.indexOf('\n\n')
+
+      let event = 'message'
+      const data: string[] = []
+      for (const line of block.split('\n')) {
+        if (line.startsWith('event:')) event = line.slice(6).trim()
+        else if (line.startsWith('data:')) data.push(line.slice(5).replace(/^ /, ''))
+      }
+      if (data.length > 0) onEvent({ event, data: data.join('\n') })
+    }
+  }
+}
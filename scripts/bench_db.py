@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Benchmark concurrent read/write throughput of the database engine profile.
+
+Runs the same mixed workload (timeline reads plus meeting/summary writes)
+against a throwaway SQLite file twice: once with the old bare engine
+(check_same_thread=False only) and once with the tuned profile from
+app.database.create_db_engine.
+
+Usage:
+    poetry run python scripts/bench_db.py [--seconds 10] [--readers 8] [--writers 2]
+"""
+
+import sys
+import argparse
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add parent directory to path so we can import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base, create_db_engine
+from app.models import Customer, Event, EventSummary, Meeting
+
+SEED_CUSTOMERS = 50
+SEED_MEETINGS_PER_CUSTOMER = 40
+TRANSCRIPT = "Alice: Thanks for joining today.\nBob: Happy to be here.\n" * 100
+
+
+def seed(session_factory):
+    """Create a small but realistic dataset."""
+    db = session_factory()
+    try:
+        start = datetime(2025, 1, 1)
+        for c in range(SEED_CUSTOMERS):
+            customer = Customer(organization_name=f"Customer {c}")
+            db.add(customer)
+            db.flush()
+            for m in range(SEED_MEETINGS_PER_CUSTOMER):
+                db.add(Meeting(
+                    customer_id=customer.id,
+                    timestamp=start + timedelta(hours=m),
+                    transcript=TRANSCRIPT,
+                ))
+        db.commit()
+    finally:
+        db.close()
+
+
+def run_workload(session_factory, seconds, readers, writers):
+    """Run reader and writer threads for a fixed duration and count operations."""
+    stop_at = time.perf_counter() + seconds
+    counts = {"reads": 0, "writes": 0, "errors": 0}
+    lock = threading.Lock()
+
+    def record(key):
+        with lock:
+            counts[key] += 1
+
+    def reader(worker_id):
+        i = worker_id
+        while time.perf_counter() < stop_at:
+            db = session_factory()
+            try:
+                customer_id = i % SEED_CUSTOMERS + 1
+                (
+                    db.query(Event.id, Event.timestamp, Event.participants)
+                    .filter(Event.customer_id == customer_id)
+                    .order_by(Event.timestamp.desc(), Event.id.desc())
+                    .limit(50)
+                    .all()
+                )
+                record("reads")
+            except OperationalError:
+                record("errors")
+            finally:
+                db.close()
+            i += 1
+
+    def writer(worker_id):
+        i = worker_id
+        while time.perf_counter() < stop_at:
+            db = session_factory()
+            try:
+                meeting = Meeting(
+                    customer_id=i % SEED_CUSTOMERS + 1,
+                    timestamp=datetime.now(),
+                    transcript=TRANSCRIPT,
+                )
+                db.add(meeting)
+                db.flush()
+                db.add(EventSummary(
+                    event_id=meeting.id,
+                    summary_json={"tldr": "ok", "action_items": [], "sentiment": "green"},
+                ))
+                db.commit()
+                record("writes")
+            except OperationalError:
+                db.rollback()
+                record("errors")
+            finally:
+                db.close()
+            i += 1
+
+    threads = [threading.Thread(target=reader, args=(n,)) for n in range(readers)]
+    threads += [threading.Thread(target=writer, args=(n,)) for n in range(writers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return counts
+
+
+def bench_profile(name, make_engine, args):
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{Path(tmp) / 'bench.db'}"
+        engine = make_engine(url)
+        Base.metadata.create_all(engine)
+        session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        seed(session_factory)
+
+        counts = run_workload(session_factory, args.seconds, args.readers, args.writers)
+        engine.dispose()
+
+    print(
+        f"{name:<10} reads/s: {counts['reads'] / args.seconds:>9.1f}   "
+        f"writes/s: {counts['writes'] / args.seconds:>8.1f}   "
+        f"lock errors: {counts['errors']}"
+    )
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=2)
+    args = parser.parse_args()
+
+    print(f"⏱️  {args.readers} readers, {args.writers} writers, {args.seconds:g}s per profile\n")
+    bench_profile(
+        "baseline",
+        lambda url: create_engine(url, connect_args={"check_same_thread": False}),
+        args,
+    )
+    bench_profile("tuned", create_db_engine, args)
+
+
+if __name__ == "__main__":
+    main()
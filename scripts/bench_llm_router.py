@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Benchmark LLM provider routing with local fake providers that inject latency.
+
+A primary provider with a long latency tail and a steadier secondary are
+driven with concurrent requests, once with the primary alone, once with
+fallback only and once with hedging, and the latency percentiles are
+compared. A final run makes the primary fail outright to show fallback
+and the circuit breaker taking it out of rotation. No network or API keys
+are needed.
+
+Usage:
+    poetry run python scripts/bench_llm_router.py [--requests 500] [--concurrency 50] [--hedge-after 0.3]
+"""
+
+import sys
+import argparse
+import asyncio
+import logging
+import random
+import statistics
+import time
+from pathlib import Path
+
+# Add parent directory to path so we can import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.llm_router import FakeChat, LLMProvider, LLMRouter
+
+SUMMARY = '{"tldr": "ok", "action_items": [], "sentiment": "green", "sentiment_explanation": ""}'
+
+
+def tail_latency(rng, median: float, slow_rate: float, slow: float):
+    """Latency sampler: mostly around median, with a slow_rate chance of a slow stall."""
+    return lambda: slow if rng.random() < slow_rate else rng.uniform(median * 0.5, median * 1.5)
+
+
+def make_router(args, secondary: bool, hedge_after: float, primary_error_rate: float = 0.0):
+    rng = random.Random(args.seed)
+    providers = [
+        LLMProvider(
+            "primary",
+            FakeChat([SUMMARY], latency=tail_latency(rng, 0.2, 0.05, 3.0), error_rate=primary_error_rate, seed=1),
+            failure_threshold=5,
+            reset_seconds=60,
+        )
+    ]
+    if secondary:
+        providers.append(
+            LLMProvider("secondary", FakeChat([SUMMARY], latency=tail_latency(rng, 0.3, 0.01, 1.5), seed=2))
+        )
+    return LLMRouter(providers, hedge_after_seconds=hedge_after, timeout_seconds=10)
+
+
+async def drive(router, requests: int, concurrency: int):
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies, errors = [], 0
+
+    async def one():
+        nonlocal errors
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                await router.ainvoke("prompt")
+            except Exception:
+                errors += 1
+                return
+            latencies.append(time.perf_counter() - started)
+
+    await asyncio.gather(*(one() for _ in range(requests)))
+    return latencies, errors
+
+
+def report(name, router, latencies, errors):
+    cuts = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else [latencies[0]] * 99
+    wins = ", ".join(f"{p.name} {p.wins}" for p in router.providers)
+    breakers = ", ".join(f"{p.name} {p.breaker.state}" for p in router.providers)
+    print(
+        f"{name:<18} p50 {cuts[49] * 1000:7.0f} ms   p95 {cuts[94] * 1000:7.0f} ms   "
+        f"p99 {cuts[98] * 1000:7.0f} ms   errors {errors:<4} hedges {router.hedges:<4} "
+        f"fallbacks {router.fallbacks:<4} wins: {wins}   breakers: {breakers}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--hedge-after", type=float, default=0.3, help="Seconds before the secondary is raced")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    logging.getLogger("app.services.llm_router").setLevel(logging.ERROR)  # Failures are counted below
+
+    print(f"⏱️  {args.requests} requests, {args.concurrency} concurrent\n")
+    scenarios = [
+        ("primary only", dict(secondary=False, hedge_after=0)),
+        ("fallback only", dict(secondary=True, hedge_after=0)),
+        (f"hedged @{args.hedge_after:g}s", dict(secondary=True, hedge_after=args.hedge_after)),
+        ("primary failing", dict(secondary=True, hedge_after=args.hedge_after, primary_error_rate=1.0)),
+    ]
+    for name, options in scenarios:
+        router = make_router(args, **options)
+        latencies, errors = asyncio.run(drive(router, args.requests, args.concurrency))
+        report(name, router, latencies, errors)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Benchmark full-text search latency on a synthetic corpus.
+
+Builds a throwaway SQLite database with N synthetic meetings (transcripts plus
+summaries), builds the FTS5 search index, and times search_service.search for
+a mix of common, rare and multi-word queries. A LIKE scan over transcripts is
+timed for comparison.
+
+Usage:
+    poetry run python scripts/bench_search.py [--meetings 100000] [--queries 50]
+"""
+
+import sys
+import argparse
+import itertools
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add parent directory to path so we can import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base, create_db_engine
+from app.models import Customer, Event, EventSummary, Meeting
+from app.services import search_service
+
+CUSTOMERS = 1000
+SPEAKERS = ["Alice", "Bob", "Carol", "Dave", "Erin", "Frank"]
+# Everyday filler words, drawn with a Zipf-like distribution
+FILLER = [f"w{n}" for n in range(5000)]
+FILLER_CUM_WEIGHTS = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(FILLER))))
+# Business topics, each mentioned in roughly 1 in 10 meetings
+TOPICS = (
+    "pricing renewal contract onboarding integration dashboard report export "
+    "latency outage support ticket roadmap feature request budget quarter "
+    "security audit compliance migration training invoice discount pilot "
+    "stakeholder timeline launch feedback adoption churn expansion seats"
+).split()
+TOPIC_RATE = 0.005  # per speaker turn
+COMPETITORS = ["Zorblax", "Quillfeather", "Brandywine"]
+COMPETITOR_RATE = 0.0002  # per speaker turn
+
+QUERIES = [
+    "pricing",  # common
+    "renewal contract",  # multi-word
+    "Zorblax",  # rare
+    "security audit compliance",
+    "churn",
+]
+
+
+def make_transcript(rng: random.Random, turns: int) -> str:
+    lines = []
+    for _ in range(turns):
+        words = rng.choices(FILLER, cum_weights=FILLER_CUM_WEIGHTS, k=rng.randint(8, 20))
+        for topic in TOPICS:
+            if rng.random() < TOPIC_RATE:
+                words.insert(rng.randrange(len(words)), topic)
+        if rng.random() < COMPETITOR_RATE:
+            words.append(rng.choice(COMPETITORS))
+        lines.append(f"{rng.choice(SPEAKERS)}: {' '.join(words)}.")
+    return "\n".join(lines)
+
+
+def seed(engine, meetings: int, turns: int, batch_size: int = 5000):
+    """Bulk insert customers, meetings and summaries."""
+    rng = random.Random(42)
+    start = datetime(2024, 1, 1)
+    with engine.begin() as conn:
+        conn.execute(
+            Customer.__table__.insert(),
+            [{"id": i + 1, "organization_name": f"Customer {i + 1}"} for i in range(CUSTOMERS)],
+        )
+        for offset in range(0, meetings, batch_size):
+            ids = range(offset + 1, min(offset + batch_size, meetings) + 1)
+            conn.execute(Event.__table__.insert(), [
+                {
+                    "id": i,
+                    "customer_id": rng.randint(1, CUSTOMERS),
+                    "event_type": "meeting",
+                    "timestamp": start + timedelta(minutes=i),
+                }
+                for i in ids
+            ])
+            conn.execute(Meeting.__table__.insert(), [
+                {"id": i, "transcript": make_transcript(rng, turns)} for i in ids
+            ])
+            conn.execute(EventSummary.__table__.insert(), [
+                {
+                    "event_id": i,
+                    "summary_json": {
+                        "tldr": " ".join(rng.sample(TOPICS, k=3) + rng.choices(FILLER, k=9)),
+                        "action_items": [" ".join(rng.sample(TOPICS, k=2) + rng.choices(FILLER, k=3))],
+                        "sentiment": "green",
+                    },
+                }
+                for i in ids
+            ])
+
+
+def create_search_index(engine):
+    """Create the FTS5 table the same way the migration does."""
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE VIRTUAL TABLE search_index USING fts5("
+            "transcript, tldr, action_items, customer_id UNINDEXED, "
+            "tokenize = 'porter unicode61')"
+        ))
+
+
+def percentile(samples, pct):
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * pct / 100))]
+
+
+def time_queries(label, run, repeats):
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        run()
+        timings.append((time.perf_counter() - started) * 1000)
+    print(
+        f"  {label:<34} p50 {statistics.median(timings):>8.2f} ms   "
+        f"p95 {percentile(timings, 95):>8.2f} ms   max {max(timings):>8.2f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--meetings", type=int, default=100_000)
+    parser.add_argument("--turns", type=int, default=20, help="Speaker turns per transcript")
+    parser.add_argument("--queries", type=int, default=50, help="Repeats per query")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_db_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        Base.metadata.create_all(engine)
+        create_search_index(engine)
+        session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+        started = time.perf_counter()
+        seed(engine, args.meetings, args.turns)
+        print(f"🌱 Seeded {args.meetings:,} meetings in {time.perf_counter() - started:.1f}s")
+
+        db = session_factory()
+        try:
+            started = time.perf_counter()
+            search_service.rebuild_search_index(db)
+            print(f"🔎 Built search index in {time.perf_counter() - started:.1f}s\n")
+
+            print(f"FTS5 search ({args.queries} runs each, limit 20)")
+            for query in QUERIES:
+                time_queries(
+                    f"q={query!r}",
+                    lambda: search_service.search(db, query, limit=20),
+                    args.queries,
+                )
+            time_queries(
+                "q='pricing' page 5",
+                lambda: search_service.search(
+                    db, "pricing", cursor=search_service.encode_cursor(80), limit=20
+                ),
+                args.queries,
+            )
+            time_queries(
+                "q='pricing' customer_id=7",
+                lambda: search_service.search(db, "pricing", customer_id=7, limit=20),
+                args.queries,
+            )
+
+            # What callers had to do before: find every matching meeting by scanning
+            print("\nLIKE scan over all transcripts (baseline)")
+            for query in ("pricing", "Zorblax"):
+                time_queries(
+                    f"q={query!r}",
+                    lambda: db.query(Meeting.id)
+                    .filter(Meeting.transcript.ilike(f"%{query}%"))
+                    .all(),
+                    max(1, args.queries // 10),
+                )
+        finally:
+            db.close()
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
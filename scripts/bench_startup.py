@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark cold-start import time of the API and the maintenance scripts.
+
+Each target is started in a fresh interpreter under `python -X importtime`,
+a few times, and the median wall time is compared against a budget. The
+slowest imports (top level and one level down) are listed, and the run fails if a target pulls
+in a module that should only load on first LLM use (LangChain, OpenAI).
+Exits non-zero on any regression, so it can run in CI.
+
+Usage:
+    poetry run python scripts/bench_startup.py [--runs 5] [--budget-ms 1000] [--top 8]
+"""
+
+import sys
+import argparse
+import os
+import statistics
+import subprocess
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+# name -> interpreter arguments
+TARGETS = {
+    "api": ["-c", "import app.main"],
+    "export_db": ["scripts/export_db.py", "--help"],
+    "import_db": ["scripts/import_db.py", "--help"],
+}
+
+# Top-level packages that must not be imported until an LLM is actually used
+DEFERRED_PACKAGES = {"langchain", "langchain_core", "langchain_openai", "langsmith", "openai", "tiktoken"}
+
+
+def parse_importtime(stderr: str):
+    """
+    Parse -X importtime output.
+
+    Returns:
+        Tuple of (imports at most one level deep as (cumulative µs, module)
+        pairs, all imported module names)
+    """
+    shallow, modules = [], set()
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative_us, name = line.split("|")
+        try:
+            cumulative = int(cumulative_us)
+        except ValueError:
+            continue  # Header line
+        module = name.strip()
+        modules.add(module)
+        # One space of padding, then two more per level of nesting
+        if not name.startswith("    "):
+            shallow.append((cumulative, module))
+    return shallow, modules
+
+
+def run_target(args):
+    """Run one cold start; returns (wall seconds, parsed importtime output)."""
+    env = {**os.environ, "PYTHONPATH": str(ROOT)}
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    elapsed = time.perf_counter() - started
+    if result.returncode != 0:
+        raise RuntimeError(f"{' '.join(args)} exited with {result.returncode}:\n{result.stderr[-2000:]}")
+    return elapsed, parse_importtime(result.stderr)
+
+
+def bench_target(name, args, runs, budget_ms, top):
+    run_target(args)  # Warm the bytecode cache so compilation isn't timed
+    timings = []
+    for _ in range(runs):
+        elapsed, (shallow, modules) = run_target(args)
+        timings.append(elapsed * 1000)
+
+    median_ms = statistics.median(timings)
+    deferred = sorted(m for m in modules if m.split(".")[0] in DEFERRED_PACKAGES)
+    ok = median_ms <= budget_ms and not deferred
+    print(
+        f"{'✅' if ok else '❌'} {name:<10} median {median_ms:7.1f} ms   "
+        f"min {min(timings):7.1f} ms   budget {budget_ms:g} ms   {len(modules)} modules"
+    )
+    for cumulative, module in sorted(shallow, reverse=True)[:top]:
+        print(f"      {cumulative / 1000:7.1f} ms  {module}")
+    if deferred:
+        print(f"      imports deferred packages: {', '.join(sorted({m.split('.')[0] for m in deferred}))}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Cold starts per target")
+    parser.add_argument("--budget-ms", type=float, default=1000.0, help="Median wall time allowed per target")
+    parser.add_argument("--top", type=int, default=8, help="Slowest imports to list per target")
+    parser.add_argument("targets", nargs="*", help=f"Targets to run: {', '.join(TARGETS)} (default: all)")
+    args = parser.parse_args()
+    unknown = set(args.targets) - set(TARGETS)
+    if unknown:
+        parser.error(f"unknown targets: {', '.join(sorted(unknown))}")
+
+    print(f"⏱️  {args.runs} cold starts per target\n")
+    results = [
+        bench_target(name, TARGETS[name], args.runs, args.budget_ms, args.top)
+        for name in (args.targets or TARGETS)
+    ]
+    sys.exit(0 if all(results) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark time to first content of streamed versus blocking meeting summaries.
+
+Summaries are generated through LLMService with a local fake provider that
+takes --first-token seconds to start answering and then writes a token
+every --token-latency seconds, like a hosted model. Each mode runs
+--requests summaries, --concurrency at a time: blocking calls show nothing
+until the whole answer is parsed, streamed ones as soon as the first
+summary field (the TL;DR) has started. No network or API keys are needed.
+
+Usage:
+    poetry run python scripts/bench_summary_stream.py [--requests 50] [--concurrency 10] [--first-token 0.4]
+"""
+
+import sys
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import time
+from pathlib import Path
+
+# Add parent directory to path so we can import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+os.environ.setdefault("LLM_LOG_SAMPLE_RATE", "0")  # Don't fill llm-logs/ with fake calls
+
+from app.services.llm_router import FakeChat, LLMProvider
+from app.services.llm_service import LLMService
+
+SUMMARY = json.dumps({
+    "tldr": "The customer is happy with the rollout but worried about the renewal price, "
+            "and wants a breakdown of usage by team before the next quarterly review.",
+    "action_items": [
+        "Send the usage breakdown by team",
+        "Book the quarterly business review",
+        "Follow up with finance on renewal pricing options",
+    ],
+    "sentiment": "amber",
+    "sentiment_explanation": "Positive about the product, but price concerns could put the renewal at risk.",
+})
+TRANSCRIPT = "Alice: How is the rollout going?\nBob: Well, but the renewal price worries us."
+
+
+async def blocking(llm: LLMService):
+    started = time.perf_counter()
+    await llm.asummarize_meeting(TRANSCRIPT, use_cache=False)
+    elapsed = time.perf_counter() - started
+    return elapsed, elapsed
+
+
+async def streaming(llm: LLMService):
+    started = time.perf_counter()
+    first = None
+    async for event, data in llm.astream_summarize_meeting(TRANSCRIPT, use_cache=False):
+        if first is None and event == "partial" and data.get("tldr"):
+            first = time.perf_counter() - started
+    return first, time.perf_counter() - started
+
+
+async def drive(run, llm: LLMService, requests: int, concurrency: int):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            return await run(llm)
+
+    return await asyncio.gather(*(one() for _ in range(requests)))
+
+
+def percentiles(values):
+    cuts = statistics.quantiles(values, n=100) if len(values) > 1 else [values[0]] * 99
+    return cuts[49], cuts[94]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--first-token", type=float, default=0.4, help="Seconds until the model starts answering")
+    parser.add_argument("--token-latency", type=float, default=0.02, help="Seconds between generated tokens")
+    args = parser.parse_args()
+
+    chat = FakeChat([SUMMARY], latency=args.first_token, token_latency=args.token_latency)
+    llm = LLMService(providers=[LLMProvider("fake", chat)])
+    print(
+        f"⏱️  {args.requests} summaries, {args.concurrency} concurrent, first token after "
+        f"{args.first_token:g}s, {len(SUMMARY) // FakeChat.STREAM_CHUNK_CHARS} tokens\n"
+    )
+    for name, run in (("blocking", blocking), ("streaming", streaming)):
+        results = asyncio.run(drive(run, llm, args.requests, args.concurrency))
+        first_p50, first_p95 = percentiles([first for first, _ in results])
+        total_p50, total_p95 = percentiles([total for _, total in results])
+        print(
+            f"{name:<10} first content p50 {first_p50 * 1000:6.0f} ms  p95 {first_p95 * 1000:6.0f} ms   "
+            f"complete p50 {total_p50 * 1000:6.0f} ms  p95 {total_p95 * 1000:6.0f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
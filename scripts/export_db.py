@@ -1,104 +1,266 @@
 #!/usr/bin/env python3
 """
-Export database to JSON file.
+Export database to a JSON or JSON Lines file.
+
+Rows are streamed from the database in batches and written as they are read,
+so memory use stays flat regardless of database size.
 
 Usage:
-    poetry run python scripts/export_db.py [output_file.json]
+    poetry run python scripts/export_db.py [output_file] [--format json|jsonl]
+                                           [--compress gzip|zstd] [--since ISO_DATETIME]
+
+The format and compression are inferred from the file name when not given,
+e.g. db_export.jsonl.gz is written as gzip-compressed JSON Lines.
+
+Formats:
+    json   A single JSON document (the format of test_data/test_data.json)
+    jsonl  One header line, then one {"table": ..., "data": {...}} line per row
 """
 
 import sys
+import io
 import json
+import argparse
+import gzip
+import textwrap
 from datetime import datetime
 from pathlib import Path
 
 # Add parent directory to path so we can import app modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from sqlalchemy import select
+
 from app.database import SessionLocal
+from app.models.action_item import ActionItem
 from app.models.customer import Customer
 from app.models.event import Event, Meeting
 from app.models.event_summary import EventSummary
+from app.models.summary_job import SummaryJob
+
+EXPORT_FORMAT_VERSION = 1
+EXPORT_TABLES = ["customers", "events", "event_summaries", "action_items", "summary_jobs"]
+
+
+def _isoformat(value):
+    return value.isoformat() if value else None
+
+
+def customer_record(row) -> dict:
+    return {
+        "id": row.id,
+        "organization_name": row.organization_name,
+        "industry": row.industry,
+        "website": row.website,
+        "primary_contact_name": row.primary_contact_name,
+        "primary_contact_email": row.primary_contact_email,
+        "primary_contact_phone": row.primary_contact_phone,
+        "address": row.address,
+        "notes": row.notes,
+        "created_at": _isoformat(row.created_at),
+        "updated_at": _isoformat(row.updated_at),
+    }
+
+
+def event_record(row) -> dict:
+    event_dict = {
+        "id": row.id,
+        "customer_id": row.customer_id,
+        "event_type": row.event_type,
+        "timestamp": _isoformat(row.timestamp),
+        "participants": row.participants,
+        "created_at": _isoformat(row.created_at),
+        "updated_at": _isoformat(row.updated_at),
+    }
+
+    # Add meeting-specific fields if it's a meeting
+    if row.event_type == "meeting":
+        event_dict["transcript"] = row.transcript
+        event_dict["location"] = row.location
+
+    return event_dict
+
+
+def summary_record(row) -> dict:
+    return {
+        "id": row.id,
+        "event_id": row.event_id,
+        "summary_json": row.summary_json,
+        "prompt_version": row.prompt_version,
+        "created_at": _isoformat(row.created_at),
+        "updated_at": _isoformat(row.updated_at),
+    }
+
 
+def action_item_record(row) -> dict:
+    return {
+        "id": row.id,
+        "event_id": row.event_id,
+        "customer_id": row.customer_id,
+        "position": row.position,
+        "text": row.text,
+        "status": row.status,
+        "owner": row.owner,
+        "due_date": _isoformat(row.due_date),
+        "created_at": _isoformat(row.created_at),
+        "updated_at": _isoformat(row.updated_at),
+    }
+
+
+def summary_job_record(row) -> dict:
+    return {
+        "id": row.id,
+        "event_id": row.event_id,
+        "batch_id": row.batch_id,
+        "status": row.status,
+        "attempts": row.attempts,
+        "max_attempts": row.max_attempts,
+        "last_error": row.last_error,
+        "run_after": _isoformat(row.run_after),
+        "started_at": _isoformat(row.started_at),
+        "finished_at": _isoformat(row.finished_at),
+        "created_at": _isoformat(row.created_at),
+        "updated_at": _isoformat(row.updated_at),
+    }
+
+
+def iter_table(db, name: str, since: datetime = None, batch_size: int = 1000):
+    """Stream export records for one table using a server-side cursor."""
+    if name == "customers":
+        stmt = select(Customer.__table__).order_by(Customer.id)
+        updated_at, to_record = Customer.updated_at, customer_record
+    elif name == "events":
+        # Select the tables directly so meetings don't each trigger a lazy load
+        meetings = Meeting.__table__
+        stmt = (
+            select(Event.__table__, meetings.c.transcript, meetings.c.location)
+            .outerjoin(meetings, meetings.c.id == Event.id)
+            .order_by(Event.id)
+        )
+        updated_at, to_record = Event.updated_at, event_record
+    elif name == "event_summaries":
+        stmt = select(EventSummary.__table__).order_by(EventSummary.id)
+        updated_at, to_record = EventSummary.updated_at, summary_record
+    elif name == "action_items":
+        stmt = select(ActionItem.__table__).order_by(ActionItem.id)
+        updated_at, to_record = ActionItem.updated_at, action_item_record
+    elif name == "summary_jobs":
+        stmt = select(SummaryJob.__table__).order_by(SummaryJob.id)
+        updated_at, to_record = SummaryJob.updated_at, summary_job_record
+    else:
+        raise ValueError(f"Unknown table: {name}")
+
+    if since is not None:
+        stmt = stmt.where(updated_at >= since)
+
+    result = db.execute(stmt.execution_options(yield_per=batch_size))
+    for row in result:
+        yield to_record(row)
+
+
+def open_output(output_file: str, compress: str = None):
+    """Open the output file for text writing, optionally compressed."""
+    if compress == "gzip":
+        return gzip.open(output_file, "wt", encoding="utf-8")
+    if compress == "zstd":
+        try:
+            import zstandard
+        except ImportError:
+            print("❌ Error: zstd compression requires the 'zstandard' package")
+            sys.exit(1)
+        raw = open(output_file, "wb")
+        writer = zstandard.ZstdCompressor().stream_writer(raw, closefd=True)
+        return io.TextIOWrapper(writer, encoding="utf-8")
+    return open(output_file, "w", encoding="utf-8")
+
+
+def write_jsonl(f, db, header: dict, since: datetime, batch_size: int) -> dict:
+    counts = {}
+    f.write(json.dumps(header, ensure_ascii=False) + "\n")
+    for table in EXPORT_TABLES:
+        counts[table] = 0
+        for record in iter_table(db, table, since, batch_size):
+            f.write(json.dumps({"table": table, "data": record}, ensure_ascii=False))
+            f.write("\n")
+            counts[table] += 1
+    return counts
+
+
+def write_json(f, db, header: dict, since: datetime, batch_size: int) -> dict:
+    """Incrementally write the same document json.dump(indent=2) would produce."""
+    counts = {}
+    f.write("{\n")
+    f.write(f'  "export_date": {json.dumps(header["export_date"])}')
+    if header["since"]:
+        f.write(f',\n  "since": {json.dumps(header["since"])}')
+    for table in EXPORT_TABLES:
+        counts[table] = 0
+        f.write(f',\n  "{table}": [')
+        for record in iter_table(db, table, since, batch_size):
+            f.write(",\n" if counts[table] else "\n")
+            f.write(textwrap.indent(json.dumps(record, indent=2, ensure_ascii=False), "    "))
+            counts[table] += 1
+        f.write("\n  ]" if counts[table] else "]")
+    f.write("\n}")
+    return counts
+
+
+def export_database(
+    output_file: str = "db_export.json",
+    export_format: str = None,
+    compress: str = None,
+    since: datetime = None,
+    batch_size: int = 1000,
+):
+    """Stream all database data (or rows updated since a point in time) to a file."""
+    suffixes = Path(output_file).suffixes
+    if compress is None:
+        compress = {".gz": "gzip", ".zst": "zstd"}.get(suffixes[-1] if suffixes else "")
+    if export_format is None:
+        export_format = "jsonl" if ".jsonl" in suffixes else "json"
+
+    header = {
+        "format": export_format,
+        "version": EXPORT_FORMAT_VERSION,
+        "export_date": datetime.now().isoformat(),
+        "since": _isoformat(since),
+    }
 
-def export_database(output_file: str = "db_export.json"):
-    """Export all database data to JSON file."""
     db = SessionLocal()
 
     try:
-        # Export customers
-        customers = db.query(Customer).all()
-        customers_data = []
-        for customer in customers:
-            customers_data.append({
-                "id": customer.id,
-                "organization_name": customer.organization_name,
-                "industry": customer.industry,
-                "website": customer.website,
-                "primary_contact_name": customer.primary_contact_name,
-                "primary_contact_email": customer.primary_contact_email,
-                "primary_contact_phone": customer.primary_contact_phone,
-                "address": customer.address,
-                "notes": customer.notes,
-                "created_at": customer.created_at.isoformat() if customer.created_at else None,
-                "updated_at": customer.updated_at.isoformat() if customer.updated_at else None,
-            })
-
-
-
-        # Export events (including meetings)
-        events = db.query(Event).all()
-        events_data = []
-        for event in events:
-            event_dict = {
-                "id": event.id,
-                "customer_id": event.customer_id,
-                "event_type": event.event_type,
-                "timestamp": event.timestamp.isoformat() if event.timestamp else None,
-                "participants": event.participants,
-                "created_at": event.created_at.isoformat() if event.created_at else None,
-                "updated_at": event.updated_at.isoformat() if event.updated_at else None,
-            }
-
-            # Add meeting-specific fields if it's a meeting
-            if isinstance(event, Meeting):
-                event_dict["transcript"] = event.transcript
-                event_dict["location"] = event.location
-
-            events_data.append(event_dict)
-
-        # Export event summaries
-        summaries = db.query(EventSummary).all()
-        summaries_data = []
-        for summary in summaries:
-            summaries_data.append({
-                "id": summary.id,
-                "event_id": summary.event_id,
-                "summary_json": summary.summary_json,
-                "created_at": summary.created_at.isoformat() if summary.created_at else None,
-                "updated_at": summary.updated_at.isoformat() if summary.updated_at else None,
-            })
-
-        # Combine all data
-        export_data = {
-            "export_date": datetime.now().isoformat(),
-            "customers": customers_data,
-            "events": events_data,
-            "event_summaries": summaries_data,
-        }
-
-        # Write to file
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
+        with open_output(output_file, compress) as f:
+            write = write_jsonl if export_format == "jsonl" else write_json
+            counts = write(f, db, header, since, batch_size)
 
         print(f"✅ Database exported successfully to {output_file}")
-        print(f"   - Customers: {len(customers_data)}")
-        print(f"   - Events: {len(events_data)}")
-        print(f"   - Event Summaries: {len(summaries_data)}")
+        print(f"   - Customers: {counts['customers']}")
+        print(f"   - Events: {counts['events']}")
+        print(f"   - Event Summaries: {counts['event_summaries']}")
+        print(f"   - Action Items: {counts['action_items']}")
+        print(f"   - Summary Jobs: {counts['summary_jobs']}")
 
     finally:
         db.close()
 
 
 if __name__ == "__main__":
-    output_file = sys.argv[1] if len(sys.argv) > 1 else "db_export.json"
-    export_database(output_file)
+    parser = argparse.ArgumentParser(description="Export database to JSON or JSON Lines.")
+    parser.add_argument("output_file", nargs="?", default="db_export.json")
+    parser.add_argument("--format", choices=["json", "jsonl"], dest="export_format")
+    parser.add_argument("--compress", choices=["gzip", "zstd"])
+    parser.add_argument(
+        "--since",
+        type=datetime.fromisoformat,
+        help="Only export rows updated at or after this ISO datetime",
+    )
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    export_database(
+        args.output_file,
+        export_format=args.export_format,
+        compress=args.compress,
+        since=args.since,
+        batch_size=args.batch_size,
+    )
@@ -1,142 +1,361 @@
 #!/usr/bin/env python3
 """
-Import database from JSON file.
+Import database from a JSON or JSON Lines file.
 WARNING: This will delete all existing data in the database!
 
+Rows are inserted with batched Core executemany statements inside a single
+transaction, with secondary indexes dropped during the load and rebuilt at
+the end. JSON Lines input (optionally .gz/.zst compressed, as written by
+export_db.py) is streamed with bounded memory.
+
 Usage:
-    poetry run python scripts/import_db.py [input_file.json]
+    poetry run python scripts/import_db.py [input_file] [--batch-size N] [--yes]
 """
 
 import sys
+import io
 import json
-from datetime import datetime
+import argparse
+import gzip
+import time
+from datetime import date, datetime
 from pathlib import Path
 
 # Add parent directory to path so we can import app modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from app.database import SessionLocal, engine
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.database import engine
+from app.models.action_item import ActionItem
 from app.models.customer import Customer
+from app.models.customer_health import CustomerHealth
 from app.models.event import Event, Meeting
-from app.models.event_summary import EventSummary
-from app.database import Base
+from app.models.event_summary import EventSummary, SUMMARY_SCHEMA_VERSION
+from app.models.summary_job import SummaryJob
+from app.services.action_item_service import rebuild_action_items
+from app.services.health_service import rebuild_customer_health, summary_sentiment
+from app.services.search_service import rebuild_search_index
+
+customers_table = Customer.__table__
+events_table = Event.__table__
+meetings_table = Meeting.__table__
+summaries_table = EventSummary.__table__
+action_items_table = ActionItem.__table__
+summary_jobs_table = SummaryJob.__table__
+
+# Tables in dependency order
+IMPORT_TABLES = [
+    customers_table,
+    events_table,
+    meetings_table,
+    summaries_table,
+    action_items_table,
+    summary_jobs_table,
+]
+
+
+def _parse_datetime(value):
+    return datetime.fromisoformat(value) if value else None
+
+
+def customer_row(record: dict) -> dict:
+    return {
+        "id": record["id"],
+        "organization_name": record["organization_name"],
+        "industry": record["industry"],
+        "website": record["website"],
+        "primary_contact_name": record["primary_contact_name"],
+        "primary_contact_email": record["primary_contact_email"],
+        "primary_contact_phone": record["primary_contact_phone"],
+        "address": record["address"],
+        "notes": record["notes"],
+        "created_at": _parse_datetime(record["created_at"]),
+        "updated_at": _parse_datetime(record["updated_at"]),
+    }
+
+
+def event_rows(record: dict):
+    """Split an exported event into its events row and, for meetings, its meetings row."""
+    # Check if this is a meeting (has transcript or location fields)
+    is_meeting = "transcript" in record or "location" in record
+    event = {
+        "id": record["id"],
+        "customer_id": record["customer_id"],
+        "event_type": "meeting" if is_meeting else record["event_type"],
+        "timestamp": _parse_datetime(record["timestamp"]),
+        "participants": record.get("participants"),
+        "created_at": _parse_datetime(record["created_at"]),
+        "updated_at": _parse_datetime(record["updated_at"]),
+    }
+    if not is_meeting:
+        return event, None
+    meeting = {
+        "id": record["id"],
+        "transcript": record.get("transcript"),
+        "location": record.get("location"),
+    }
+    return event, meeting
+
+
+def summary_row(record: dict) -> dict:
+    tldr = (record["summary_json"] or {}).get("tldr")
+    return {
+        "id": record["id"],
+        "event_id": record["event_id"],
+        "summary_json": record["summary_json"],
+        "sentiment": summary_sentiment(record["summary_json"]),
+        "tldr": str(tldr) if tldr is not None else None,
+        "schema_version": SUMMARY_SCHEMA_VERSION,
+        "prompt_version": record.get("prompt_version"),
+        "created_at": _parse_datetime(record["created_at"]),
+        "updated_at": _parse_datetime(record["updated_at"]),
+    }
+
+
+def action_item_row(record: dict) -> dict:
+    due_date = record.get("due_date")
+    return {
+        "id": record["id"],
+        "event_id": record["event_id"],
+        "customer_id": record["customer_id"],
+        "position": record["position"],
+        "text": record["text"],
+        "status": record["status"],
+        "owner": record.get("owner"),
+        "due_date": date.fromisoformat(due_date) if due_date else None,
+        "created_at": _parse_datetime(record["created_at"]),
+        "updated_at": _parse_datetime(record["updated_at"]),
+    }
+
+
+def summary_job_row(record: dict) -> dict:
+    return {
+        "id": record["id"],
+        "event_id": record["event_id"],
+        "batch_id": record.get("batch_id"),
+        "status": record["status"],
+        "attempts": record["attempts"],
+        "max_attempts": record["max_attempts"],
+        "last_error": record.get("last_error"),
+        "run_after": _parse_datetime(record["run_after"]),
+        "started_at": _parse_datetime(record.get("started_at")),
+        "finished_at": _parse_datetime(record.get("finished_at")),
+        "created_at": _parse_datetime(record["created_at"]),
+        "updated_at": _parse_datetime(record["updated_at"]),
+    }
+
+
+def open_input(input_file: str):
+    """Open the input file for text reading, decompressing by extension."""
+    if input_file.endswith(".gz"):
+        return gzip.open(input_file, "rt", encoding="utf-8")
+    if input_file.endswith(".zst"):
+        try:
+            import zstandard
+        except ImportError:
+            print("❌ Error: zstd input requires the 'zstandard' package")
+            sys.exit(1)
+        reader = zstandard.ZstdDecompressor().stream_reader(open(input_file, "rb"), closefd=True)
+        return io.TextIOWrapper(reader, encoding="utf-8")
+    return open(input_file, "r", encoding="utf-8")
+
+
+def iter_records(f, is_jsonl: bool):
+    """
+    Yield the export header, then (table, record) pairs.
+
+    JSON Lines files are read one line at a time; legacy JSON documents
+    have to be parsed in one go.
+    """
+    if is_jsonl:
+        yield json.loads(f.readline())
+        for line in f:
+            if line.strip():
+                entry = json.loads(line)
+                yield entry["table"], entry["data"]
+        return
+
+    data = json.load(f)
+    yield {"export_date": data.get("export_date"), "since": data.get("since")}
+    for table in ("customers", "events", "event_summaries", "action_items", "summary_jobs"):
+        for record in data.get(table, []):
+            yield table, record
+
+
+def read_header(input_file: str) -> dict:
+    """Read just the export header of a file."""
+    with open_input(input_file) as f:
+        return next(iter_records(f, ".jsonl" in Path(input_file).suffixes))
 
 
-def clear_database(db):
+def check_full_export(header: dict) -> None:
+    """
+    Refuse incremental exports: the import replaces the whole database, so
+    loading a --since export would leave only the rows changed since then.
+    """
+    if header.get("since"):
+        print(f"❌ Error: This is an incremental export (rows updated since {header['since']})")
+        print("   Only full exports can be imported, since the import replaces all existing data")
+        sys.exit(1)
+
+
+class BatchInserter:
+    """Buffer rows per table and flush them with executemany."""
+
+    def __init__(self, conn, batch_size: int):
+        self.conn = conn
+        self.batch_size = batch_size
+        self.buffers = {table.name: [] for table in IMPORT_TABLES}
+        self.counts = {table.name: 0 for table in IMPORT_TABLES}
+
+    def add(self, table_name: str, row: dict):
+        buffer = self.buffers[table_name]
+        buffer.append(row)
+        if len(buffer) >= self.batch_size:
+            self.flush(up_to=table_name)
+
+    def flush(self, up_to: str = None):
+        """Flush buffers in dependency order, so parent rows always land before children."""
+        for table in IMPORT_TABLES:
+            buffer = self.buffers[table.name]
+            if buffer:
+                self.conn.execute(table.insert(), buffer)
+                self.counts[table.name] += len(buffer)
+                buffer.clear()
+            if table.name == up_to:
+                break
+
+
+def clear_database(conn):
     """Delete all data from all tables."""
     print("🗑️  Clearing existing database data...")
-    db.query(EventSummary).delete()
-    db.query(Meeting).delete()
-    db.query(Event).delete()
-    db.query(Customer).delete()
-    db.commit()
+    conn.execute(CustomerHealth.__table__.delete())
+    for table in reversed(IMPORT_TABLES):
+        conn.execute(table.delete())
     print("✅ Database cleared")
 
 
-def import_database(input_file: str = "db_export.json"):
-    """Import database data from JSON file."""
+def drop_indexes(conn):
+    """Drop secondary indexes so they are built once after the load."""
+    for table in IMPORT_TABLES:
+        for index in table.indexes:
+            index.drop(conn, checkfirst=True)
+
+
+def create_indexes(conn):
+    for table in IMPORT_TABLES:
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
+
+
+def reset_sequences(conn):
+    """Move PostgreSQL ID sequences past the imported IDs."""
+    if conn.dialect.name != "postgresql":
+        return
+    for table in IMPORT_TABLES:
+        if table is meetings_table:
+            continue  # Shares its primary key with events
+        conn.execute(text(
+            f"SELECT setval(pg_get_serial_sequence('{table.name}', 'id'), "
+            f"COALESCE((SELECT MAX(id) FROM {table.name}), 1))"
+        ))
+
+
+def import_database(input_file: str = "db_export.json", batch_size: int = 5000):
+    """Import database data from a JSON or JSON Lines file."""
 
     # Check if file exists
     if not Path(input_file).exists():
         print(f"❌ Error: File '{input_file}' not found")
         sys.exit(1)
 
-    # Load JSON data
-    with open(input_file, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    print(f"📁 Loading data from {input_file}")
-    print(f"   Export date: {data.get('export_date', 'Unknown')}")
-
-    db = SessionLocal()
-
-    try:
-        # Clear existing data
-        clear_database(db)
-
-        # Import customers
-        print(f"\n📊 Importing {len(data['customers'])} customers...")
-        for customer_data in data["customers"]:
-            customer = Customer(
-                id=customer_data["id"],
-                organization_name=customer_data["organization_name"],
-                industry=customer_data["industry"],
-                website=customer_data["website"],
-                primary_contact_name=customer_data["primary_contact_name"],
-                primary_contact_email=customer_data["primary_contact_email"],
-                primary_contact_phone=customer_data["primary_contact_phone"],
-                address=customer_data["address"],
-                notes=customer_data["notes"],
-                created_at=datetime.fromisoformat(customer_data["created_at"]) if customer_data["created_at"] else None,
-                updated_at=datetime.fromisoformat(customer_data["updated_at"]) if customer_data["updated_at"] else None,
-            )
-            db.add(customer)
-        db.commit()
-        print("✅ Customers imported")
-
-
-
-        # Import events
-        print(f"\n📊 Importing {len(data['events'])} events...")
-        for event_data in data["events"]:
-            # Check if this is a meeting (has transcript or location fields)
-            if "transcript" in event_data or "location" in event_data:
-                event = Meeting(
-                    id=event_data["id"],
-                    customer_id=event_data["customer_id"],
-                    timestamp=datetime.fromisoformat(event_data["timestamp"]) if event_data["timestamp"] else None,
-                    participants=event_data.get("participants"),
-                    transcript=event_data.get("transcript"),
-                    location=event_data.get("location"),
-                    created_at=datetime.fromisoformat(event_data["created_at"]) if event_data["created_at"] else None,
-                    updated_at=datetime.fromisoformat(event_data["updated_at"]) if event_data["updated_at"] else None,
-                )
-            else:
-                event = Event(
-                    id=event_data["id"],
-                    customer_id=event_data["customer_id"],
-                    event_type=event_data["event_type"],
-                    timestamp=datetime.fromisoformat(event_data["timestamp"]) if event_data["timestamp"] else None,
-                    participants=event_data.get("participants"),
-                    created_at=datetime.fromisoformat(event_data["created_at"]) if event_data["created_at"] else None,
-                    updated_at=datetime.fromisoformat(event_data["updated_at"]) if event_data["updated_at"] else None,
-                )
-            db.add(event)
-        db.commit()
-        print("✅ Events imported")
-
-        # Import event summaries
-        print(f"\n📊 Importing {len(data['event_summaries'])} event summaries...")
-        for summary_data in data["event_summaries"]:
-            summary = EventSummary(
-                id=summary_data["id"],
-                event_id=summary_data["event_id"],
-                summary_json=summary_data["summary_json"],
-                created_at=datetime.fromisoformat(summary_data["created_at"]) if summary_data["created_at"] else None,
-                updated_at=datetime.fromisoformat(summary_data["updated_at"]) if summary_data["updated_at"] else None,
-            )
-            db.add(summary)
-        db.commit()
-        print("✅ Event summaries imported")
-
-        print(f"\n✅ Database import completed successfully!")
-
-    except Exception as e:
-        print(f"\n❌ Error during import: {e}")
-        db.rollback()
-        raise
-    finally:
-        db.close()
+    is_jsonl = ".jsonl" in Path(input_file).suffixes
+    started = time.perf_counter()
+
+    with open_input(input_file) as f:
+        records = iter_records(f, is_jsonl)
+        header = next(records)
+
+        print(f"📁 Loading data from {input_file}")
+        print(f"   Export date: {header.get('export_date', 'Unknown')}")
+        check_full_export(header)
+
+        try:
+            # One transaction for the whole import: all or nothing
+            with engine.begin() as conn:
+                clear_database(conn)
+                drop_indexes(conn)
+
+                print("\n📊 Importing rows...")
+                inserter = BatchInserter(conn, batch_size)
+                for table, record in records:
+                    if table == "customers":
+                        inserter.add("customers", customer_row(record))
+                    elif table == "events":
+                        event, meeting = event_rows(record)
+                        inserter.add("events", event)
+                        if meeting is not None:
+                            inserter.add("meetings", meeting)
+                    elif table == "event_summaries":
+                        inserter.add("event_summaries", summary_row(record))
+                    elif table == "action_items":
+                        inserter.add("action_items", action_item_row(record))
+                    elif table == "summary_jobs":
+                        inserter.add("summary_jobs", summary_job_row(record))
+                inserter.flush()
+
+                print("🔧 Rebuilding indexes...")
+                create_indexes(conn)
+                reset_sequences(conn)
+
+                print("🔎 Rebuilding search index...")
+                with Session(bind=conn) as db:
+                    rebuild_search_index(db, commit=False)
+
+                # Exported action items keep their status, owner and due date;
+                # only summaries without any (e.g. older exports) get them derived
+                print("🩺 Rebuilding action items and customer health...")
+                with Session(bind=conn) as db:
+                    rebuild_action_items(db, commit=False, missing_only=True)
+                    rebuild_customer_health(db, commit=False)
+        except Exception as e:
+            print(f"\n❌ Error during import: {e}")
+            raise
+
+    elapsed = time.perf_counter() - started
+    total = sum(inserter.counts.values())
+    print(f"   - Customers: {inserter.counts['customers']}")
+    print(f"   - Events: {inserter.counts['events']} ({inserter.counts['meetings']} meetings)")
+    print(f"   - Event Summaries: {inserter.counts['event_summaries']}")
+    print(f"   - Action Items: {inserter.counts['action_items']}")
+    print(f"   - Summary Jobs: {inserter.counts['summary_jobs']}")
+    print(f"\n✅ Database import completed successfully!")
+    print(f"   {total} rows in {elapsed:.2f}s ({total / elapsed if elapsed else 0:,.0f} rows/sec)")
 
 
 if __name__ == "__main__":
-    input_file = sys.argv[1] if len(sys.argv) > 1 else "db_export.json"
+    parser = argparse.ArgumentParser(description="Import database from JSON or JSON Lines.")
+    parser.add_argument("input_file", nargs="?", default="db_export.json")
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--yes", action="store_true", help="Skip the confirmation prompt")
+    args = parser.parse_args()
+
+    if not Path(args.input_file).exists():
+        print(f"❌ Error: File '{args.input_file}' not found")
+        sys.exit(1)
+    header = read_header(args.input_file)
+    check_full_export(header)
 
     # Confirm before proceeding
-    print("⚠️  WARNING: This will delete all existing data in the database!")
-    response = input("Type 'yes' to continue: ")
+    if not args.yes:
+        print("⚠️  WARNING: This will delete all existing data in the database!")
+        print(f"   It will be replaced by the full export in {args.input_file} "
+              f"(exported {header.get('export_date') or 'at an unknown date'})")
+        response = input("Type 'yes' to continue: ")
+        if response.lower() != "yes":
+            print("❌ Import cancelled")
+            sys.exit(0)
 
-    if response.lower() == "yes":
-        import_database(input_file)
-    else:
-        print("❌ Import cancelled")
+    import_database(args.input_file, batch_size=args.batch_size)
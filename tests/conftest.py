@@ -0,0 +1,39 @@
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# Point the app at a throwaway database before any app module reads settings
+_tmpdir = tempfile.TemporaryDirectory()
+os.environ["DATABASE_URL"] = f"sqlite:///{Path(_tmpdir.name) / 'test.db'}"
+os.environ["READ_CACHE_ENABLED"] = "true"
+os.environ["READ_CACHE_REDIS_URL"] = ""
+os.environ["SUMMARY_WORKER_ENABLED"] = "false"
+os.environ["LLM_LOG_SAMPLE_RATE"] = "0"  # Keep llm-logs/ out of the tree
+
+from alembic import command  # noqa: E402
+from alembic.config import Config  # noqa: E402
+
+from app.database import SessionLocal  # noqa: E402
+from app.services.read_cache import read_cache  # noqa: E402
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture(scope="session", autouse=True)
+def database():
+    """Create the schema, search index included, by running the migrations."""
+    command.upgrade(Config(str(ROOT / "alembic.ini")), "head")
+    yield
+    _tmpdir.cleanup()
+
+
+@pytest.fixture
+def db():
+    read_cache.clear()
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
@@ -0,0 +1,29 @@
+import sqlite3
+
+from app.diagnostics import explain
+
+
+def _connection_in_a_transaction():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+    conn.commit()
+    conn.execute("INSERT INTO items (id) VALUES (1)")  # Opens a transaction
+    return conn
+
+
+def test_explain_returns_the_plan():
+    conn = _connection_in_a_transaction()
+    plan = explain(conn.cursor(), "SELECT * FROM items WHERE id = ?", (1,), "sqlite")
+    assert "items" in plan
+
+
+def test_failed_explain_leaves_the_transaction_usable():
+    # Exercises the savepoint path used on PostgreSQL, where a failed statement aborts the transaction
+    conn = _connection_in_a_transaction()
+
+    plan = explain(conn.cursor(), "SELECT * FROM missing", (), "postgresql")
+
+    assert plan.startswith("EXPLAIN failed")
+    assert conn.in_transaction
+    assert conn.execute("SELECT id FROM items").fetchall() == [(1,)]
+    conn.commit()
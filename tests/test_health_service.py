@@ -0,0 +1,54 @@
+from datetime import datetime, timedelta
+
+from app.models.customer_health import CustomerHealth
+from app.services import customer_service, event_service, health_service
+from app.services.schemas import CustomerCreate, MeetingCreate
+
+
+def _meeting_with_summary(db, customer_id: int, timestamp: datetime, sentiment: str) -> int:
+    meeting = event_service.create_meeting(
+        db, MeetingCreate(customer_id=customer_id, timestamp=timestamp, transcript="Alice: Hi")
+    )
+    event_service.save_event_summary(
+        db,
+        meeting.id,
+        {"tldr": "Hi", "action_items": [], "sentiment": sentiment, "sentiment_explanation": "."},
+    )
+    return meeting.id
+
+
+def test_sweep_ages_meetings_out_of_the_trend_window(db):
+    customer = customer_service.create_customer(db, CustomerCreate(organization_name="Quiet Co"))
+    now = datetime.now()
+    _meeting_with_summary(db, customer.id, now - timedelta(days=60), "red")
+    _meeting_with_summary(db, customer.id, now - timedelta(days=10), "green")
+    health = db.get(CustomerHealth, customer.id)
+    assert health.trend_score == 0.0
+
+    # Thirty-five days pass without a meeting: the red one leaves the 90-day window
+    health.recent_sentiments = [
+        [(datetime.fromisoformat(at) - timedelta(days=35)).isoformat(), event_id, sentiment]
+        for at, event_id, sentiment in health.recent_sentiments
+    ]
+    health.trend_oldest_at = datetime.fromisoformat(health.recent_sentiments[0][0])
+    db.commit()
+
+    assert health_service.age_customer_trends(db) == 1
+    db.refresh(health)
+    assert health.trend_score == 1.0
+    assert [sentiment for _, _, sentiment in health.recent_sentiments] == ["green"]
+    assert health.trend_oldest_at > now - timedelta(days=90)
+    assert health_service.age_customer_trends(db) == 0
+
+
+def test_rebuild_sets_the_oldest_windowed_meeting(db):
+    customer = customer_service.create_customer(db, CustomerCreate(organization_name="Old Co"))
+    now = datetime.now()
+    _meeting_with_summary(db, customer.id, now - timedelta(days=200), "red")
+    recent_id = _meeting_with_summary(db, customer.id, now - timedelta(days=5), "amber")
+
+    health_service.rebuild_customer_health(db, [customer.id])
+
+    health = db.get(CustomerHealth, customer.id)
+    assert [event_id for _, event_id, _ in health.recent_sentiments] == [recent_id]
+    assert health.trend_oldest_at == now - timedelta(days=5)
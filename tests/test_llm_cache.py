@@ -0,0 +1,43 @@
+from app.services.llm_cache import LLMResponseCache
+
+
+def test_hits_do_not_write(tmp_path):
+    cache = LLMResponseCache(tmp_path / "cache.db")
+    cache.set("a", "answer")
+    changes = cache._conn.total_changes
+
+    assert cache.get("a") == "answer"
+    assert cache.get("missing") is None
+    assert cache._conn.total_changes == changes
+
+
+def test_evicts_least_recently_used_past_the_byte_cap(tmp_path):
+    cache = LLMResponseCache(tmp_path / "cache.db", max_bytes=25)
+    cache.set("a", "x" * 10)
+    cache.set("b", "y" * 10)
+    assert cache.get("a") is not None  # Buffered access time, saved before evicting
+
+    cache.set("c", "z" * 10)
+
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.stats()["bytes"] == 20
+
+
+def test_byte_cap_counts_bytes_not_characters(tmp_path):
+    cache = LLMResponseCache(tmp_path / "cache.db", max_bytes=10)
+    cache.set("a", "é" * 6)  # 12 bytes in UTF-8
+
+    assert cache.get("a") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_entry_cap_and_counters_survive_reopening(tmp_path):
+    cache = LLMResponseCache(tmp_path / "cache.db", max_entries=2)
+    for key in "abc":
+        cache.set(key, key * 3)
+
+    reopened = LLMResponseCache(tmp_path / "cache.db", max_entries=2)
+    assert reopened.get("a") is None
+    assert reopened.stats()["entries"] == 2
+    assert reopened.stats()["bytes"] == 6
@@ -0,0 +1,15 @@
+import pytest
+
+from app.services.llm_metrics import estimate_cost
+
+
+def test_known_models_are_priced_per_provider():
+    assert estimate_cost("openai", "gpt-4o-mini", 1000, 1000) == pytest.approx(0.00075)
+    assert estimate_cost("anthropic", "claude-3-5-haiku-latest", 1000, 0) == pytest.approx(0.0008)
+
+
+def test_unknown_models_get_no_cost():
+    assert estimate_cost("anthropic", "gpt-4o-mini", 1000, 1000) is None
+    assert estimate_cost("openai", "some-new-model", 10, 10) is None
+    # Cache hits and failed calls used no tokens, so they are free whatever the model
+    assert estimate_cost("openai", "some-new-model", 0, 0) == 0.0
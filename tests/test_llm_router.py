@@ -0,0 +1,112 @@
+import asyncio
+import time
+
+import pytest
+
+from app.services.llm_router import (
+    BREAKER_CLOSED,
+    BREAKER_HALF_OPEN,
+    BREAKER_OPEN,
+    FakeChat,
+    LLMProvider,
+    LLMProviderError,
+    LLMRouter,
+)
+
+
+def _provider(name: str, responses=("ok",), **chat) -> LLMProvider:
+    return LLMProvider(name, FakeChat(list(responses), **chat), failure_threshold=2, reset_seconds=60)
+
+
+def test_falls_back_to_the_next_provider_on_error():
+    primary, backup = _provider("primary", error_rate=1.0), _provider("backup", ["from backup"])
+    router = LLMRouter([primary, backup])
+
+    response, provider = router.invoke("prompt")
+
+    assert (response.content, provider) == ("from backup", backup)
+    assert router.fallbacks == 1
+    assert (primary.failures, backup.wins) == (1, 1)
+
+
+def test_falls_back_on_an_invalid_answer_and_keeps_it_as_a_last_resort():
+    primary, backup = _provider("primary", ["not json"]), _provider("backup", ["{}"])
+    router = LLMRouter([primary, backup])
+
+    assert router.invoke("prompt", validate=lambda text: text == "{}")[1] is backup
+    response, provider = router.invoke("prompt", validate=lambda text: False)
+    assert (response.content, provider) == ("not json", primary)
+
+
+def test_raises_when_every_provider_fails():
+    router = LLMRouter([_provider("a", error_rate=1.0), _provider("b", error_rate=1.0)])
+
+    with pytest.raises(LLMProviderError, match="All LLM providers failed"):
+        router.invoke("prompt")
+
+
+def test_open_circuit_skips_the_provider():
+    primary, backup = _provider("primary", error_rate=1.0), _provider("backup")
+    router = LLMRouter([primary, backup])
+
+    for _ in range(3):
+        router.invoke("prompt")
+
+    assert primary.breaker.state == BREAKER_OPEN
+    assert primary.attempts == 2  # Threshold reached, then skipped
+    assert backup.wins == 3
+
+
+def test_half_open_circuit_lets_one_trial_call_through():
+    primary = LLMProvider("primary", FakeChat(["ok"]), failure_threshold=1, reset_seconds=0)
+    primary.breaker.record_failure()
+
+    assert primary.breaker.state == BREAKER_HALF_OPEN
+    assert primary.breaker.allow()
+    assert not primary.breaker.allow()  # The trial is taken
+    primary.breaker.record_success()
+    assert primary.breaker.state == BREAKER_CLOSED
+
+
+def test_async_hedges_a_slow_provider():
+    slow, fast = _provider("slow", ["slow"], latency=1.0), _provider("fast", ["fast"])
+    router = LLMRouter([slow, fast], hedge_after_seconds=0.05)
+
+    started = time.perf_counter()
+    response, provider = asyncio.run(router.ainvoke("prompt"))
+
+    assert (response.content, provider) == ("fast", fast)
+    assert time.perf_counter() - started < 0.5
+    assert router.hedges == 1
+    # The losing hedge was cancelled, which isn't held against the provider
+    assert slow.failures == 0 and slow.breaker.state != BREAKER_OPEN
+
+
+def test_async_falls_back_without_waiting_for_the_hedge_delay():
+    failing, backup = _provider("failing", error_rate=1.0), _provider("backup", ["backup"])
+    router = LLMRouter([failing, backup], hedge_after_seconds=5)
+
+    started = time.perf_counter()
+    assert asyncio.run(router.ainvoke("prompt"))[1] is backup
+    assert time.perf_counter() - started < 1
+    assert (router.fallbacks, router.hedges) == (1, 0)
+
+
+def test_async_timeout_counts_as_a_failure():
+    hung, backup = _provider("hung", latency=5), _provider("backup", ["backup"])
+    router = LLMRouter([hung, backup], timeout_seconds=0.05)
+
+    assert asyncio.run(router.ainvoke("prompt"))[1] is backup
+    assert hung.failures == 1
+
+
+def test_stream_falls_back_before_the_first_chunk():
+    failing, backup = _provider("failing", error_rate=1.0), _provider("backup", ["streamed answer"])
+    router = LLMRouter([failing, backup])
+
+    async def collect():
+        return [(chunk.content, provider) async for chunk, provider in router.astream("prompt")]
+
+    chunks = asyncio.run(collect())
+    assert "".join(content for content, _ in chunks) == "streamed answer"
+    assert {provider for _, provider in chunks} == {backup}
@@ -0,0 +1,146 @@
+import asyncio
+import json
+import threading
+
+from app.services.llm_cache import LLMResponseCache
+from app.services.llm_router import FakeChat, LLMProvider
+from app.services.llm_service import LLMService
+from app.services.transcript_chunker import CHARS_PER_TOKEN, estimate_tokens
+
+
+def _stream_summary(responses):
+    llm = LLMService(providers=[LLMProvider("fake", FakeChat(responses))])
+
+    async def collect():
+        return [event async for event in llm.astream_summarize_meeting("Alice: Hi", use_cache=False)]
+
+    return asyncio.run(collect())
+
+
+def test_stream_summary_of_empty_answer_is_a_parse_error():
+    events = _stream_summary([""])
+
+    assert [name for name, _ in events] == ["summary"]
+    summary = events[0][1]
+    assert summary["tldr"] == "Error: Could not parse LLM response"
+    assert summary["raw_response"] == ""
+
+
+class ThreadRecordingCache(LLMResponseCache):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.threads = set()
+
+    def get(self, key):
+        self.threads.add(threading.current_thread())
+        return super().get(key)
+
+    def set(self, key, response):
+        self.threads.add(threading.current_thread())
+        super().set(key, response)
+
+
+def test_async_calls_use_the_cache_off_the_event_loop(tmp_path):
+    summary = json.dumps(
+        {"tldr": "Fine", "action_items": [], "sentiment": "green", "sentiment_explanation": "Happy."}
+    )
+    cache = ThreadRecordingCache(tmp_path / "cache.db")
+    llm = LLMService(providers=[LLMProvider("fake", FakeChat([summary]))], cache=cache)
+
+    async def summarize_twice():
+        await llm.asummarize_meeting("Alice: Hi")
+        return await llm.asummarize_meeting("Alice: Hi")
+
+    assert asyncio.run(summarize_twice())["tldr"] == "Fine"
+    assert cache.hits == 1 and cache.writes == 1
+    assert threading.main_thread() not in cache.threads
+
+
+def test_usage_is_priced_by_the_provider_that_answered(monkeypatch):
+    from app.config import settings
+    from app.services.llm_metrics import llm_metrics
+
+    monkeypatch.setitem(settings.llm_prices_per_1k_tokens, "backup/backup-model", (1.0, 2.0))
+    summary = json.dumps(
+        {"tldr": "Fine", "action_items": [], "sentiment": "green", "sentiment_explanation": "Happy."}
+    )
+    primary = LLMProvider("primary", FakeChat([summary], error_rate=1.0), "unpriced-model")
+    backup = LLMProvider("backup", FakeChat([summary]), "backup-model")
+    llm = LLMService(providers=[primary, backup])
+
+    before = llm_metrics.snapshot()["by_model"].get("backup-model", {}).get("cost_usd", 0.0)
+    llm.summarize_meeting("Alice: Hi")
+    usage = llm_metrics.snapshot()["by_model"]["backup-model"]
+
+    assert usage["cost_usd"] > before
+    assert usage["unpriced_calls"] == 0
+
+
+class RecordingChat(FakeChat):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prompts = []
+
+    def invoke(self, prompt):
+        self.prompts.append(prompt)
+        return super().invoke(prompt)
+
+    async def ainvoke(self, prompt):
+        self.prompts.append(prompt)
+        return await super().ainvoke(prompt)
+
+    def astream(self, prompt):
+        self.prompts.append(prompt)
+        return super().astream(prompt)
+
+
+def _map_reduce_setup():
+    """Three chunks of two turns each, with the budget fitting two partial summaries per reduce."""
+    summary = json.dumps(
+        {"tldr": "Fine", "action_items": [], "sentiment": "green", "sentiment_explanation": "Happy."}
+    )
+    chat = RecordingChat([summary])
+    llm = LLMService(providers=[LLMProvider("fake", chat)])
+    partial = {key: value for key, value in llm.parse_summary(summary).items() if key != "raw_response"}
+    partial_tokens = estimate_tokens(json.dumps(partial))
+    llm.chunk_tokens = 2 * partial_tokens + 1
+    turn_chars = (partial_tokens - 1) * CHARS_PER_TOKEN
+    transcript = "".join(f"S{i}: ".ljust(turn_chars - 1, "x") + "\n" for i in range(6))
+    return llm, chat, transcript
+
+
+def _calls(chat):
+    chunks = [p for p in chat.prompts if "Transcript Part" in p]
+    reduces = [p for p in chat.prompts if "Partial Summaries" in p]
+    return chunks, reduces
+
+
+def test_long_transcript_is_reduced_in_groups_within_the_budget():
+    llm, chat, transcript = _map_reduce_setup()
+
+    assert llm.summarize_meeting(transcript, use_cache=False)["tldr"] == "Fine"
+
+    chunks, reduces = _calls(chat)
+    assert len(chunks) == 3 and all("of 3" in prompt for prompt in chunks)
+    # Three partials don't fit one reduce: two groups, then a final reduce of their results
+    assert [prompt.count("\nPart ") for prompt in reduces] == [2, 1, 2]
+    assert chat.prompts[-1] == reduces[-1]
+
+
+def test_async_and_streamed_map_reduce_make_the_same_calls():
+    llm, chat, transcript = _map_reduce_setup()
+    llm.summarize_meeting(transcript, use_cache=False)
+    expected = sorted(chat.prompts)
+
+    chat.prompts.clear()
+    asyncio.run(llm.asummarize_meeting(transcript, use_cache=False))
+    assert sorted(chat.prompts) == expected
+
+    async def stream():
+        return [event async for event in llm.astream_summarize_meeting(transcript, use_cache=False)]
+
+    chat.prompts.clear()
+    events = asyncio.run(stream())
+    assert events[0] == ("progress", {"parts": 3})
+    assert events[-1][0] == "summary"
+    assert sorted(chat.prompts) == expected
@@ -0,0 +1,33 @@
+import threading
+
+from app.metrics import Counter, Histogram, Registry
+
+
+def _in_threads(count: int, work) -> None:
+    threads = [threading.Thread(target=work) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_exited_threads_fold_their_shards():
+    counter = Counter("test_requests_total", "Requests", registry=Registry())
+    child = counter.labels()
+
+    for _ in range(5):
+        _in_threads(20, lambda: counter.inc(2))
+
+    assert child.value() == 200
+    assert len(child._shards) == 0
+
+
+def test_histogram_keeps_observations_of_exited_threads():
+    registry = Registry()
+    histogram = Histogram("test_seconds", "Latency", buckets=(0.1, 1.0), registry=registry)
+
+    _in_threads(10, lambda: histogram.observe(0.5))
+    histogram.observe(2.0)
+
+    assert histogram.labels().snapshot() == ([0, 10, 11], 11, 7.0)
+    assert 'test_seconds_bucket{le="1"} 10' in registry.render()
@@ -0,0 +1,129 @@
+import asyncio
+import threading
+import time
+
+from app.services.rate_limiter import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE, RateLimiter
+
+
+def _drain(limiter: RateLimiter, calls: int) -> None:
+    for _ in range(calls):
+        with limiter.limit():
+            pass
+
+
+def test_waiter_behind_full_house_wakes_when_the_bucket_refills():
+    # One request a second, one at a time
+    limiter = RateLimiter(requests_per_minute=60, max_concurrency=1)
+    _drain(limiter, 59)
+    done = threading.Event()
+
+    def second():
+        with limiter.limit():
+            done.set()
+
+    with limiter.limit():  # Takes the last request in the bucket
+        thread = threading.Thread(target=second, daemon=True)
+        thread.start()
+        time.sleep(0.1)  # Let it park on the concurrency limit
+    # The slot is free but the bucket is empty: it must still get in once it refills
+    assert done.wait(3)
+
+
+def test_async_waiter_behind_full_house_wakes_when_the_bucket_refills():
+    limiter = RateLimiter(requests_per_minute=60, max_concurrency=1)
+    _drain(limiter, 59)
+
+    async def second():
+        async with limiter.alimit():
+            pass
+
+    async def main():
+        async with limiter.alimit():
+            task = asyncio.create_task(second())
+            await asyncio.sleep(0.1)
+        await asyncio.wait_for(task, 3)
+
+    asyncio.run(main())
+
+
+def test_interactive_callers_go_first_then_first_come_first_served():
+    limiter = RateLimiter(max_concurrency=1)
+    order = []
+
+    async def call(name, priority):
+        async with limiter.alimit(priority=priority):
+            order.append(name)
+
+    async def main():
+        async with limiter.alimit():
+            tasks = []
+            for name, priority in [
+                ("background 1", PRIORITY_BACKGROUND),
+                ("interactive 1", PRIORITY_INTERACTIVE),
+                ("background 2", PRIORITY_BACKGROUND),
+                ("interactive 2", PRIORITY_INTERACTIVE),
+            ]:
+                tasks.append(asyncio.create_task(call(name, priority)))
+                await asyncio.sleep(0)  # Queue them in this order
+            assert limiter.queue_depth(PRIORITY_INTERACTIVE) == 2
+            assert limiter.queue_depth(PRIORITY_BACKGROUND) == 2
+        await asyncio.gather(*tasks)
+
+    asyncio.run(main())
+    assert order == ["interactive 1", "interactive 2", "background 1", "background 2"]
+
+
+def test_calls_in_flight_never_exceed_the_concurrency_cap():
+    limiter = RateLimiter(max_concurrency=2)
+    in_flight = peak = 0
+
+    async def call():
+        nonlocal in_flight, peak
+        async with limiter.alimit():
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+    async def main():
+        await asyncio.gather(*(call() for _ in range(6)))
+
+    asyncio.run(main())
+    assert peak == 2
+    assert limiter.in_flight == 0
+
+
+def test_cancelled_waiter_does_not_hold_up_the_queue():
+    limiter = RateLimiter(max_concurrency=1)
+
+    async def call():
+        async with limiter.alimit():
+            pass
+
+    async def main():
+        async with limiter.alimit():
+            abandoned = asyncio.create_task(call())
+            waiting = asyncio.create_task(call())
+            await asyncio.sleep(0)
+            abandoned.cancel()
+            await asyncio.sleep(0)
+        await asyncio.wait_for(waiting, 1)
+        assert abandoned.cancelled()
+
+    asyncio.run(main())
+    assert limiter.in_flight == 0
+    assert limiter.queue_depth() == 0
+
+
+def test_token_budget_makes_callers_wait_for_the_refill():
+    # Ten tokens a second
+    limiter = RateLimiter(tokens_per_minute=600)
+    with limiter.limit(tokens=600, priority=PRIORITY_INTERACTIVE):
+        pass
+
+    started = time.monotonic()
+    with limiter.limit(tokens=3, priority=PRIORITY_INTERACTIVE):
+        waited = time.monotonic() - started
+
+    assert 0.2 < waited < 1.0
+    assert limiter.waits[PRIORITY_INTERACTIVE] == 1
@@ -0,0 +1,85 @@
+"""Cached reads must never return data a committed write has replaced or removed."""
+
+from datetime import datetime
+
+import pytest
+
+from app.services import customer_service, event_service
+from app.services.read_cache import event_summary_key, read_cache
+from app.services.schemas import CustomerCreate, MeetingCreate
+
+SUMMARY = {
+    "tldr": "Rollout is on track",
+    "action_items": ["Send the usage report"],
+    "sentiment": "green",
+    "sentiment_explanation": "Happy with the rollout.",
+}
+
+
+@pytest.fixture
+def meeting(db):
+    customer = customer_service.create_customer(db, CustomerCreate(organization_name="Cache Co"))
+    meeting = event_service.create_meeting(
+        db,
+        MeetingCreate(
+            customer_id=customer.id,
+            timestamp=datetime(2026, 1, 1, 10, 0),
+            transcript="Alice: How is the rollout going?",
+        ),
+    )
+    event_service.save_event_summary(db, meeting.id, SUMMARY)
+    return meeting
+
+
+def _warm(load):
+    """Read twice so the second read is known to come from the cache."""
+    first = load()
+    hits = read_cache.hits
+    assert load() is not None
+    assert read_cache.hits == hits + 1
+    return first
+
+
+def test_save_event_summary_replaces_cached_summary(db, meeting):
+    _warm(lambda: event_service.get_event_summary(db, meeting.id))
+
+    event_service.save_event_summary(db, meeting.id, {**SUMMARY, "tldr": "Renewal at risk", "sentiment": "red"})
+
+    summary = event_service.get_event_summary(db, meeting.id)
+    assert summary.tldr == "Renewal at risk"
+    assert summary.sentiment == "red"
+
+
+def test_delete_event_drops_cached_summary(db, meeting):
+    event_id = meeting.id
+    _warm(lambda: event_service.get_event_summary(db, event_id))
+
+    assert event_service.delete_event(db, event_id)
+
+    assert event_service.get_event_summary(db, event_id) is None
+
+
+def test_delete_customer_drops_cached_customer_and_summaries(db, meeting):
+    customer_id, event_id = meeting.customer_id, meeting.id
+    _warm(lambda: customer_service.get_customer(db, customer_id))
+    _warm(lambda: event_service.get_event_summary(db, event_id))
+
+    assert customer_service.delete_customer(db, customer_id)
+
+    assert customer_service.get_customer(db, customer_id) is None
+    assert event_service.get_event_summary(db, event_id) is None
+
+
+def test_load_overlapping_an_invalidation_is_not_stored(db, meeting):
+    event_id = meeting.id
+    key = event_summary_key(event_id)
+
+    def load():
+        row = event_service._load_event_summary(db, event_id)
+        read_cache.invalidate(key)  # A write commits after the row was read, before it is stored
+        return row
+
+    stores = read_cache.stores
+    assert read_cache.get_or_load(db, key, load) is not None
+    assert read_cache.stores == stores
+    assert read_cache.backend.get(key) is None
@@ -0,0 +1,23 @@
+from datetime import datetime
+
+from app.services import customer_service, event_service, search_service
+from app.services.schemas import CustomerCreate, MeetingCreate
+
+
+def test_rank_is_higher_for_better_matches(db):
+    customer = customer_service.create_customer(db, CustomerCreate(organization_name="Search Co"))
+    ids = {}
+    for name, transcript in (
+        ("passing", "Alice: The weather was nice. Bob: We talked about the quokka once."),
+        ("focused", "Alice: Quokka pricing. Bob: The quokka rollout and quokka renewal."),
+    ):
+        meeting = event_service.create_meeting(
+            db,
+            MeetingCreate(customer_id=customer.id, timestamp=datetime(2026, 1, 1), transcript=transcript),
+        )
+        ids[name] = meeting.id
+
+    hits, _ = search_service.search(db, "quokka", customer_id=customer.id)
+
+    assert [hit["event_id"] for hit in hits] == [ids["focused"], ids["passing"]]
+    assert hits[0]["rank"] > hits[1]["rank"] > 0
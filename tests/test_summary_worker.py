@@ -0,0 +1,126 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models.event import Meeting
+from app.models.summary_job import SummaryJob, SUMMARY_DONE, SUMMARY_FAILED, SUMMARY_PENDING, SUMMARY_RUNNING
+from app.services import customer_service, event_service, summary_queue
+from app.services.schemas import CustomerCreate, MeetingCreate
+from app.services.summary_worker import SummaryWorkerPool
+
+
+class FakeLLM:
+    """Stands in for LLMService.aanalyze_meeting, optionally failing."""
+
+    def __init__(self, error: Exception = None):
+        self.error = error
+        self.calls = []
+
+    async def aanalyze_meeting(self, transcript, meeting_id=None, extract_participants=True, customer_id=None):
+        self.calls.append((meeting_id, extract_participants))
+        if self.error:
+            raise self.error
+        return {
+            "participants": "Alice, Bob" if extract_participants else None,
+            "summary": {"tldr": "Kickoff", "action_items": [], "sentiment": "green", "sentiment_explanation": "."},
+            "prompt_version": "test",
+        }
+
+
+@pytest.fixture
+def queue(db):
+    """Start every test with an empty job queue."""
+    db.query(SummaryJob).delete()
+    db.commit()
+    return db
+
+
+def _queued_meeting(db) -> int:
+    customer = customer_service.create_customer(db, CustomerCreate(organization_name="Queue Co"))
+    meeting = event_service.create_meeting(
+        db, MeetingCreate(customer_id=customer.id, timestamp=datetime.now(), transcript="Alice: Hi\nBob: Hello")
+    )
+    return meeting.id
+
+
+def test_claim_marks_the_job_running_once(queue):
+    event_id = _queued_meeting(queue)
+
+    job = summary_queue.claim_next_job(queue)
+
+    assert job.event_id == event_id
+    assert job.status == SUMMARY_RUNNING
+    assert job.attempts == 1
+    assert summary_queue.claim_next_job(queue) is None
+
+
+def test_failure_backs_off_then_fails_for_good(queue, monkeypatch):
+    monkeypatch.setattr(summary_queue.settings, "summary_job_backoff_seconds", 10.0)
+    _queued_meeting(queue)
+
+    job = summary_queue.claim_next_job(queue)
+    before = datetime.now()
+    summary_queue.mark_job_failed(queue, job, "boom")
+    assert job.status == SUMMARY_PENDING
+    assert job.run_after >= before + timedelta(seconds=10)
+    # Backing off keeps it out of reach until run_after
+    assert summary_queue.claim_next_job(queue) is None
+
+    job.run_after = datetime.now()
+    queue.commit()
+    job = summary_queue.claim_next_job(queue)
+    before = datetime.now()
+    summary_queue.mark_job_failed(queue, job, "boom")
+    assert job.attempts == 2
+    assert job.run_after >= before + timedelta(seconds=20)
+
+    job.run_after = datetime.now()
+    queue.commit()
+    job = summary_queue.claim_next_job(queue)
+    summary_queue.mark_job_failed(queue, job, "still broken")
+    assert job.attempts == job.max_attempts == 3
+    assert job.status == SUMMARY_FAILED
+    assert job.last_error == "still broken"
+    assert job.finished_at is not None
+
+
+def test_requeue_returns_only_stale_running_jobs(queue):
+    stale_id = _queued_meeting(queue)
+    fresh_id = _queued_meeting(queue)
+    stale = summary_queue.claim_next_job(queue)
+    fresh = summary_queue.claim_next_job(queue)
+    assert (stale.event_id, fresh.event_id) == (stale_id, fresh_id)
+    stale.started_at = datetime.now() - timedelta(hours=1)
+    queue.commit()
+
+    assert summary_queue.requeue_stale_jobs(queue, older_than_seconds=600) == 1
+    queue.expire_all()
+    assert queue.get(SummaryJob, stale.id).status == SUMMARY_PENDING
+    assert queue.get(SummaryJob, fresh.id).status == SUMMARY_RUNNING
+
+
+def test_run_once_saves_the_summary_and_finishes_the_job(queue):
+    event_id = _queued_meeting(queue)
+    llm = FakeLLM()
+
+    assert asyncio.run(SummaryWorkerPool(llm=llm).run_once()) is True
+    assert asyncio.run(SummaryWorkerPool(llm=llm).run_once()) is False
+
+    assert llm.calls == [(event_id, True)]
+    queue.expire_all()
+    assert summary_queue.get_summary_job(queue, event_id).status == SUMMARY_DONE
+    assert queue.get(Meeting, event_id).participants == "Alice, Bob"
+    assert event_service.get_event_summary(queue, event_id).tldr == "Kickoff"
+
+
+def test_run_once_records_a_failed_attempt(queue):
+    event_id = _queued_meeting(queue)
+
+    asyncio.run(SummaryWorkerPool(llm=FakeLLM(RuntimeError("provider down"))).run_once())
+
+    job = summary_queue.get_summary_job(queue, event_id)
+    assert job.status == SUMMARY_PENDING
+    assert job.attempts == 1
+    assert job.last_error == "provider down"
+    assert job.run_after > datetime.now()
@@ -0,0 +1,46 @@
+from app.services.transcript_chunker import (
+    chunk_transcript,
+    estimate_tokens,
+    split_speaker_turns,
+)
+
+
+def test_wrapped_lines_stay_with_their_turn():
+    transcript = "Alice: Welcome\nto the call.\nBob (CTO): Thanks\nURL: not a speaker?\n"
+
+    assert split_speaker_turns(transcript) == [
+        "Alice: Welcome\nto the call.\n",
+        "Bob (CTO): Thanks\n",
+        "URL: not a speaker?\n",
+    ]
+
+
+def test_chunks_pack_whole_turns_within_the_budget():
+    turns = [f"Speaker {i}: {'word ' * (3 + i)}\n" for i in range(8)]
+    transcript = "".join(turns)
+
+    chunks = chunk_transcript(transcript, max_tokens=20)
+
+    assert len(chunks) > 1
+    assert "".join(chunks) == transcript
+    for chunk in chunks:
+        assert sum(estimate_tokens(turn) for turn in split_speaker_turns(chunk)) <= 20
+        # Every chunk boundary falls between turns
+        assert set(split_speaker_turns(chunk)) <= set(turns)
+
+
+def test_short_transcript_is_a_single_chunk():
+    assert chunk_transcript("Alice: Hi\nBob: Hello\n", max_tokens=100) == ["Alice: Hi\nBob: Hello\n"]
+
+
+def test_oversized_turn_is_split_on_sentences_then_words():
+    sentences = [f"Sentence number {i} is here." for i in range(10)]
+    run_on = " ".join(["unbroken"] * 30)
+    turn = "Alice: " + " ".join(sentences) + " " + run_on + "\n"
+
+    chunks = chunk_transcript(turn + "Bob: Right.\n", max_tokens=15)
+
+    assert all(estimate_tokens(chunk) <= 15 + 1 for chunk in chunks)
+    assert " ".join(chunks).split() == (turn + "Bob: Right.\n").split()
+    assert any(chunk.rstrip().endswith("here.") for chunk in chunks)
+    assert chunks[-1] == "Bob: Right.\n"